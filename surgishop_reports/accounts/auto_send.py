@@ -0,0 +1,221 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Scheduled invoice auto-send
+===========================
+Emails submitted Sales Invoices whose `custom_auto_send_status` is
+Scheduled and whose `custom_scheduled_send_time` has passed, and retries
+Failed ones with exponential backoff, from a scheduler job instead of
+one request per invoice.
+
+Every few minutes the scheduler enqueues one `send_due_invoices` job on
+the long queue (deduplicated, so runs never overlap). The job works in
+batches:
+
+1. Claim up to `auto_send_batch_size` due invoices with SELECT ... FOR
+   UPDATE SKIP LOCKED; a second worker picks the next rows instead of
+   waiting.
+2. Render their PDFs in a bounded process pool (utils/pool.py) through
+   the PDF cache (utils/pdf_cache.py).
+3. Queue one email per invoice in Email Queue; SMTP delivery stays with
+   Frappe's email flush.
+4. Write Sent / Failed back with one UPDATE per outcome and commit,
+   which also releases the row locks.
+
+A run stops after `auto_send_max_per_run` invoices; the rest wait for the
+next tick. A failed invoice is retried after `auto_send_retry_minutes` *
+2^(attempts - 1) until it has failed `auto_send_max_attempts` times.
+Limits live in Surgi Report Settings.
+
+Usage:
+    bench --site <site> execute surgishop_reports.accounts.auto_send.send_due_invoices
+"""
+
+import frappe
+from frappe.utils import now_datetime
+
+from surgishop_reports.utils.pool import get_pool
+
+SCHEDULED, SENT, FAILED = "Scheduled", "Sent", "Failed"
+
+# Longest error kept on the invoice
+ERROR_LENGTH = 500
+
+
+def enqueue_due_invoices():
+    """Scheduler entry point: one sender at a time, on the long queue"""
+    if not frappe.get_cached_doc("Surgi Report Settings").enable_auto_send:
+        return
+
+    frappe.enqueue(
+        "surgishop_reports.accounts.auto_send.send_due_invoices",
+        queue="long",
+        timeout=60 * 60,
+        job_id="surgishop_reports::auto_send",
+        deduplicate=True,
+    )
+
+
+def send_due_invoices():
+    settings = frappe.get_cached_doc("Surgi Report Settings")
+    batch_size = max(1, settings.auto_send_batch_size or 1)
+    remaining = settings.auto_send_max_per_run or batch_size
+    totals = {SENT: 0, FAILED: 0}
+
+    with get_pool(settings.auto_send_pdf_workers) as pool:
+        while remaining > 0:
+            invoices = claim_due_invoices(min(batch_size, remaining), settings.auto_send_max_attempts)
+            if not invoices:
+                break
+
+            sent, failed = send_batch(invoices, settings, pool)
+            set_sent(sent)
+            set_failed(failed, settings.auto_send_retry_minutes)
+            frappe.db.commit()
+
+            totals[SENT] += len(sent)
+            totals[FAILED] += len(failed)
+            remaining -= len(invoices)
+
+    return totals
+
+
+def claim_due_invoices(limit, max_attempts):
+    """Lock and return due invoices; rows locked by another sender are skipped"""
+    return frappe.db.sql(
+        """
+        SELECT name, contact_email
+        FROM `tabSales Invoice`
+        WHERE docstatus = 1
+            AND (
+                (custom_auto_send_status = %(scheduled)s AND custom_scheduled_send_time <= %(now)s)
+                -- Failures from before retries existed have no retry time and are left alone
+                OR (
+                    custom_auto_send_status = %(failed)s
+                    AND custom_send_attempts < %(max_attempts)s
+                    AND custom_next_send_retry <= %(now)s
+                )
+            )
+        ORDER BY custom_scheduled_send_time
+        LIMIT %(limit)s
+        FOR UPDATE SKIP LOCKED
+        """,
+        {
+            "scheduled": SCHEDULED,
+            "failed": FAILED,
+            "now": now_datetime(),
+            "max_attempts": max_attempts or 1,
+            "limit": limit,
+        },
+        as_dict=True,
+    )
+
+
+def send_batch(invoices, settings, pool):
+    """Render and queue the emails of a batch; return (sent names, {name: error})"""
+    failed = {}
+    to_render = []
+    for invoice in invoices:
+        if invoice.contact_email:
+            to_render.append(invoice.name)
+        else:
+            failed[invoice.name] = "No contact email on the invoice"
+
+    print_format = settings.auto_send_print_format
+    by_name = {invoice.name: invoice for invoice in invoices}
+    sent = []
+    for name, pdf, error in pool.map(render_pdf, to_render, [print_format] * len(to_render)):
+        if error:
+            failed[name] = error
+            continue
+        try:
+            queue_email(by_name[name], pdf, settings)
+        except Exception as e:
+            failed[name] = str(e)
+            continue
+        sent.append(name)
+
+    return sent, failed
+
+
+def render_pdf(name, print_format):
+    """Pool worker: PDF of one invoice as (name, pdf, error)"""
+    from surgishop_reports.utils.pdf_cache import get_pdf
+
+    # A worker lives for the whole run; end its REPEATABLE READ snapshot so
+    # it sees invoices and print settings committed since its last task
+    frappe.db.rollback()
+    try:
+        return name, get_pdf(frappe.get_doc("Sales Invoice", name), print_format), None
+    except Exception as e:
+        frappe.db.rollback()
+        return name, None, str(e) or repr(e)
+
+
+def queue_email(invoice, pdf, settings):
+    subject, message = get_email_content(invoice, settings.auto_send_email_template)
+    frappe.sendmail(
+        recipients=[invoice.contact_email],
+        subject=subject,
+        message=message,
+        attachments=[{"fname": f"{invoice.name}.pdf", "fcontent": pdf}],
+        reference_doctype="Sales Invoice",
+        reference_name=invoice.name,
+        delayed=True,
+    )
+
+
+def get_email_content(invoice, email_template=None):
+    if not email_template:
+        return f"Sales Invoice {invoice.name}", f"<p>Please find attached Sales Invoice {invoice.name}.</p>"
+
+    template = frappe.get_cached_doc("Email Template", email_template)
+    doc = frappe.get_doc("Sales Invoice", invoice.name).as_dict()
+    return frappe.render_template(template.subject, doc), frappe.render_template(template.response_, doc)
+
+
+def set_sent(names):
+    if not names:
+        return
+
+    frappe.db.sql(
+        """
+        UPDATE `tabSales Invoice`
+        SET custom_auto_send_status = %(sent)s,
+            custom_actual_send_time = %(now)s,
+            custom_send_attempts = IFNULL(custom_send_attempts, 0) + 1,
+            custom_next_send_retry = NULL,
+            custom_send_error = NULL
+        WHERE name IN %(names)s
+        """,
+        {"sent": SENT, "now": now_datetime(), "names": tuple(names)},
+    )
+
+
+def set_failed(errors, retry_minutes):
+    """Mark failures and schedule their retry: retry_minutes * 2^(attempts - 1) from now"""
+    if not errors:
+        return
+
+    values = {"failed": FAILED, "now": now_datetime(), "retry_minutes": retry_minutes or 1}
+    cases = []
+    for idx, (name, error) in enumerate(errors.items()):
+        values[f"name_{idx}"] = name
+        values[f"error_{idx}"] = error[:ERROR_LENGTH]
+        cases.append(f"WHEN %(name_{idx})s THEN %(error_{idx})s")
+    values["names"] = tuple(errors)
+
+    # MariaDB assigns left to right: the retry sees the incremented attempts
+    frappe.db.sql(
+        f"""
+        UPDATE `tabSales Invoice`
+        SET custom_auto_send_status = %(failed)s,
+            custom_send_attempts = IFNULL(custom_send_attempts, 0) + 1,
+            custom_next_send_retry = %(now)s
+                + INTERVAL (%(retry_minutes)s * POW(2, custom_send_attempts - 1)) MINUTE,
+            custom_send_error = CASE name {" ".join(cases)} END
+        WHERE name IN %(names)s
+        """,
+        values,
+    )
@@ -0,0 +1,280 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Customer statement context builders
+===================================
+Data for the Surgi Customer Statement, Surgi Transaction Statement and
+Surgi Open Items Statement print formats. Each builder runs its queries
+once and returns rows and totals that are ready to print, so the templates
+only loop to render.
+
+The single-customer builders are registered as Jinja methods in hooks.py
+(not whitelisted: they take any customer and do no permission check):
+
+    {% set st = statement if statement is defined else get_customer_statement(doc) %}
+
+The get_*_statements functions build the same context for many customers
+with the same number of grouped queries. Bulk runs (statement_run.py)
+hand the result to `use_statements` and then print each customer through
+Frappe's print view like a single print; the Jinja methods return the
+prebuilt context instead of querying.
+"""
+
+import frappe
+from frappe.utils import flt, getdate
+
+from surgishop_reports.accounts import party_balance
+
+AGING_BUCKETS = (
+    ("days_1_30", 1, 30),
+    ("days_31_60", 31, 60),
+    ("days_61_90", 61, 90),
+    ("days_over_90", 91, None),
+)
+
+
+def get_customer_statement(doc):
+    """Balance forward, GL lines with running balance, and aging"""
+    doc = get_statement_doc(doc)
+    return get_prebuilt(get_customer_statements, doc) or get_customer_statements(
+        [doc.customer], doc.from_date, doc.to_date
+    )[doc.customer]
+
+
+def get_transaction_statement(doc):
+    """Invoices of the period with amount received and period totals"""
+    doc = get_statement_doc(doc)
+    return get_prebuilt(get_transaction_statements, doc) or get_transaction_statements(
+        [doc.customer], doc.from_date, doc.to_date
+    )[doc.customer]
+
+
+def get_open_items_statement(doc):
+    """Unpaid invoices, unallocated payments, net open amount and aging"""
+    doc = get_statement_doc(doc)
+    return get_prebuilt(get_open_items_statements, doc) or get_open_items_statements(
+        [doc.customer], doc.from_date, doc.to_date
+    )[doc.customer]
+
+
+def use_statements(builder, statements, from_date, to_date):
+    """Serve these contexts ({customer: context} from `builder`) to the Jinja methods of this job"""
+    frappe.flags.prebuilt_statements = {
+        (builder.__name__, customer, str(getdate(from_date)), str(getdate(to_date))): statement
+        for customer, statement in statements.items()
+    }
+
+
+def get_prebuilt(builder, doc):
+    if not (frappe.flags.prebuilt_statements and doc.from_date and doc.to_date):
+        return None
+    key = (builder.__name__, doc.customer, str(getdate(doc.from_date)), str(getdate(doc.to_date)))
+    return frappe.flags.prebuilt_statements.get(key)
+
+
+def get_customer_statements(customers, from_date, to_date):
+    """Return {customer: context} for the ledger statement"""
+    today = getdate()
+    details = get_customer_details(customers)
+    balances = get_balance_forward(customers, from_date)
+    entries = get_gl_entries(customers, from_date, to_date)
+    open_invoices = get_open_invoices(customers)
+
+    statements = {}
+    for customer in customers:
+        balance_forward = balances.get(customer, 0)
+
+        balance = balance_forward
+        for entry in entries.get(customer, []):
+            entry.amount = -flt(entry.credit) if entry.credit else flt(entry.debit)
+            balance += entry.amount
+            entry.balance = balance
+
+        statements[customer] = frappe._dict(
+            today=today,
+            customer=details.get(customer, frappe._dict()),
+            balance_forward=balance_forward,
+            entries=entries.get(customer, []),
+            closing_balance=balance,
+            aging=get_aging(open_invoices.get(customer, []), today, balance),
+        )
+
+    return statements
+
+
+def get_transaction_statements(customers, from_date, to_date):
+    """Return {customer: context} for the transaction statement"""
+    today = getdate()
+    details = get_customer_details(customers)
+    invoices = group_by_party(
+        frappe.db.sql(
+            """
+            SELECT customer AS party, name, posting_date, grand_total, outstanding_amount
+            FROM `tabSales Invoice`
+            WHERE customer IN %(customers)s
+                AND docstatus = 1
+                AND posting_date BETWEEN %(from_date)s AND %(to_date)s
+            ORDER BY customer, posting_date ASC
+            """,
+            {"customers": tuple(customers), "from_date": from_date, "to_date": to_date},
+            as_dict=True,
+        )
+    )
+
+    statements = {}
+    for customer in customers:
+        total_amount = total_received = 0
+        for inv in invoices.get(customer, []):
+            inv.paid = flt(inv.grand_total) - flt(inv.outstanding_amount)
+            total_amount += flt(inv.grand_total)
+            total_received += inv.paid
+
+        statements[customer] = frappe._dict(
+            today=today,
+            customer=details.get(customer, frappe._dict()),
+            invoices=invoices.get(customer, []),
+            total_amount=total_amount,
+            total_received=total_received,
+        )
+
+    return statements
+
+
+def get_open_items_statements(customers, from_date=None, to_date=None):
+    """Return {customer: context} for the open items statement"""
+    today = getdate()
+    details = get_customer_details(customers)
+    open_invoices = get_open_invoices(customers)
+    payments = group_by_party(
+        frappe.db.sql(
+            """
+            SELECT party, name, posting_date, paid_amount, unallocated_amount
+            FROM `tabPayment Entry`
+            WHERE party_type = 'Customer'
+                AND party IN %(customers)s
+                AND docstatus = 1
+                AND unallocated_amount > 0
+            ORDER BY party, posting_date ASC
+            """,
+            {"customers": tuple(customers)},
+            as_dict=True,
+        )
+    )
+
+    statements = {}
+    for customer in customers:
+        invoices = open_invoices.get(customer, [])
+        credits = payments.get(customer, [])
+        total_open = sum(flt(inv.outstanding_amount) for inv in invoices) - sum(
+            flt(pmt.unallocated_amount) for pmt in credits
+        )
+
+        statements[customer] = frappe._dict(
+            today=today,
+            customer=details.get(customer, frappe._dict()),
+            invoices=invoices,
+            payments=credits,
+            total_open=total_open,
+            aging=get_aging(invoices, today, total_open),
+        )
+
+    return statements
+
+
+def get_statement_doc(doc):
+    """Accept the print doc itself, a dict, or JSON"""
+    if isinstance(doc, str):
+        doc = frappe.parse_json(doc)
+    return frappe._dict(
+        customer=doc.get("customer"),
+        from_date=doc.get("from_date"),
+        to_date=doc.get("to_date"),
+    )
+
+
+def get_customer_details(customers):
+    """Customer name with primary contact and address, in one statement"""
+    rows = frappe.db.sql(
+        """
+        SELECT
+            c.name,
+            c.customer_name,
+            ct.first_name, ct.last_name,
+            a.address_line1, a.address_line2, a.city, a.state, a.pincode, a.country
+        FROM `tabCustomer` c
+        LEFT JOIN `tabContact` ct ON ct.name = c.customer_primary_contact
+        LEFT JOIN `tabAddress` a ON a.name = c.customer_primary_address
+        WHERE c.name IN %(customers)s
+        """,
+        {"customers": tuple(customers)},
+        as_dict=True,
+    )
+    return {row.name: row for row in rows}
+
+
+def get_balance_forward(customers, from_date):
+    return party_balance.get_balance_forward("Customer", customers, from_date)
+
+
+def get_gl_entries(customers, from_date, to_date):
+    return group_by_party(
+        frappe.db.sql(
+            """
+            SELECT party, posting_date, voucher_type, voucher_no, debit, credit
+            FROM `tabGL Entry`
+            WHERE party_type = 'Customer'
+                AND party IN %(customers)s
+                AND posting_date BETWEEN %(from_date)s AND %(to_date)s
+                AND is_cancelled = 0
+            ORDER BY party, posting_date ASC, creation ASC
+            """,
+            {"customers": tuple(customers), "from_date": from_date, "to_date": to_date},
+            as_dict=True,
+        )
+    )
+
+
+def get_open_invoices(customers):
+    return group_by_party(
+        frappe.db.sql(
+            """
+            SELECT customer AS party, name, posting_date, grand_total, outstanding_amount
+            FROM `tabSales Invoice`
+            WHERE customer IN %(customers)s
+                AND docstatus = 1
+                AND outstanding_amount > 0
+            ORDER BY customer, posting_date ASC
+            """,
+            {"customers": tuple(customers)},
+            as_dict=True,
+        )
+    )
+
+
+def group_by_party(rows):
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(row.party, []).append(row)
+    return grouped
+
+
+def get_aging(invoices, today, amount_due):
+    """
+    Split open invoices into past-due buckets by days since posting.
+
+    `current` is whatever part of `amount_due` is not past due, so the
+    buckets always add up to the amount due on the statement.
+    """
+    aging = frappe._dict({key: 0 for key, _start, _end in AGING_BUCKETS})
+
+    for inv in invoices:
+        days_due = (today - getdate(inv.posting_date)).days
+        for key, start, end in AGING_BUCKETS:
+            if days_due >= start and (end is None or days_due <= end):
+                aging[key] += flt(inv.outstanding_amount)
+                break
+
+    aging.current = amount_due - sum(aging[key] for key, _start, _end in AGING_BUCKETS)
+    aging.amount_due = amount_due
+    return aging
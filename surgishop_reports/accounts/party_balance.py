@@ -0,0 +1,184 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Party balance snapshot
+======================
+`tabParty Balance Snapshot` holds one row per (party_type, party, month)
+in which the party has GL Entries, with the closing balance, SUM(debit -
+credit), up to the end of that month.
+
+A submitted GL Entry queues its party (utils/rebuild_queue.py). After
+the transaction commits, a background job (one per party, deduplicated)
+recomputes the party's rows from the entry's month onward with
+`rebuild`: the GL Entries (is_cancelled = 0) from that month on, added
+to the closing balance of the last snapshot month before it, so a
+long-standing party's older history is not scanned again. Nothing is
+added as a delta, so reposts (which delete GL Entries with raw SQL and
+submit them again) and cancellations cannot drift the snapshot. A
+cancellation's reversing entries are flagged is_cancelled, and the
+recompute starts from the month of the voucher's earliest entry, which
+is earlier than the reversal's when the ledger is immutable.
+
+Balance forward for a date is the closing balance of the last month
+before it, plus the GL Entries from the first of the month to the day
+before, instead of a scan of the party's whole history.
+
+Backfill or repair:
+    bench --site <site> execute surgishop_reports.accounts.party_balance.rebuild
+    bench --site <site> execute surgishop_reports.accounts.party_balance.rebuild --kwargs "{'party_type': 'Customer', 'party': 'X'}"
+"""
+
+import frappe
+from frappe.utils import flt, get_first_day, now
+
+from surgishop_reports.utils import rebuild_queue
+from surgishop_reports.utils.query import Conditions
+
+SNAPSHOT_DOCTYPE = "Party Balance Snapshot"
+
+
+def on_submit(doc, method=None):
+    """doc_events handler for GL Entry"""
+    if not (doc.party_type and doc.party):
+        return
+
+    posting_date = doc.posting_date
+    if doc.is_cancelled:
+        # Reversal of a cancelled voucher: the original entries may be in an earlier month
+        posting_date = frappe.db.sql(
+            """
+            SELECT MIN(posting_date)
+            FROM `tabGL Entry`
+            WHERE voucher_type = %s AND voucher_no = %s AND party_type = %s AND party = %s
+            """,
+            (doc.voucher_type, doc.voucher_no, doc.party_type, doc.party),
+        )[0][0] or posting_date
+
+    rebuild_queue.queue(
+        "surgishop_reports.accounts.party_balance.rebuild",
+        f"{doc.party_type}::{doc.party}",
+        doc.party_type,
+        doc.party,
+        get_first_day(posting_date),
+    )
+
+
+def get_balance_forward(party_type, parties, from_date):
+    """Return {party: SUM(debit - credit) of GL Entries before from_date}"""
+    if not parties:
+        return {}
+
+    month = get_first_day(from_date)
+    balances = get_closing_balances(party_type, parties, month)
+
+    rows = frappe.db.sql(
+        """
+        SELECT party, SUM(debit - credit)
+        FROM `tabGL Entry`
+        WHERE party_type = %(party_type)s
+            AND party IN %(parties)s
+            AND posting_date >= %(month)s
+            AND posting_date < %(from_date)s
+            AND is_cancelled = 0
+        GROUP BY party
+        """,
+        {"party_type": party_type, "parties": tuple(parties), "month": month, "from_date": from_date},
+    )
+    for party, amount in rows:
+        balances[party] = balances.get(party, 0) + flt(amount)
+
+    return balances
+
+
+def get_closing_balances(party_type, parties, month):
+    """Return {party: closing balance of the last snapshot month before `month`}"""
+    rows = frappe.db.sql(
+        f"""
+        SELECT s.party, s.closing_balance
+        FROM `tab{SNAPSHOT_DOCTYPE}` s
+        INNER JOIN (
+            SELECT party, MAX(month) AS month
+            FROM `tab{SNAPSHOT_DOCTYPE}`
+            WHERE party_type = %(party_type)s
+                AND party IN %(parties)s
+                AND month < %(month)s
+            GROUP BY party
+        ) last ON last.party = s.party AND last.month = s.month
+        WHERE s.party_type = %(party_type)s
+        """,
+        {"party_type": party_type, "parties": tuple(parties), "month": month},
+    )
+    return {party: flt(balance) for party, balance in rows}
+
+
+def rebuild(party_type=None, party=None, from_month=None):
+    """
+    Recompute the snapshot from GL Entry, for all parties or one. From a
+    month on, only the GL Entries since that month are read, on top of
+    each party's last closing balance before it.
+    """
+    snapshot = Conditions()
+    snapshot.equals("party_type", party_type)
+    snapshot.equals("party", party)
+    gl = Conditions("party_type IS NOT NULL", "party IS NOT NULL", "is_cancelled = 0")
+    gl.equals("party_type", party_type)
+    gl.equals("party", party)
+    # Closing balance of the last month before from_month, per party
+    opening = Conditions("month < %(from_month)s")
+    opening.equals("party_type", party_type)
+    opening.equals("party", party)
+
+    opening_balances = ""
+    if from_month:
+        snapshot.add("month >= %(from_month)s", from_month=from_month)
+        gl.add("posting_date >= %(from_month)s", from_month=from_month)
+        opening_balances = f"""
+                UNION ALL
+
+                SELECT s.party_type, s.party, s.month, s.closing_balance
+                FROM `tab{SNAPSHOT_DOCTYPE}` s
+                INNER JOIN (
+                    SELECT party_type, party, MAX(month) AS month
+                    FROM `tab{SNAPSHOT_DOCTYPE}`
+                    {opening.where()}
+                    GROUP BY party_type, party
+                ) last ON last.party_type = s.party_type AND last.party = s.party AND last.month = s.month
+        """
+
+    values = dict(gl.values, **snapshot.values, timestamp=now(), user=frappe.session.user)
+
+    frappe.db.sql(f"DELETE FROM `tab{SNAPSHOT_DOCTYPE}` {snapshot.where()}", values)
+
+    # The opening rows are before from_month: they seed the running sum and
+    # are filtered out again by the snapshot conditions
+    frappe.db.sql(
+        f"""
+        INSERT INTO `tab{SNAPSHOT_DOCTYPE}`
+            (name, party_type, party, month, closing_balance, creation, modified, owner, modified_by)
+        SELECT
+            CONCAT(party_type, '::', party, '::', month),
+            party_type, party, month, closing_balance,
+            %(timestamp)s, %(timestamp)s, %(user)s, %(user)s
+        FROM (
+            SELECT
+                party_type,
+                party,
+                month,
+                SUM(amount) OVER (PARTITION BY party_type, party ORDER BY month) AS closing_balance
+            FROM (
+                SELECT
+                    party_type,
+                    party,
+                    posting_date - INTERVAL (DAYOFMONTH(posting_date) - 1) DAY AS month,
+                    SUM(debit - credit) AS amount
+                FROM `tabGL Entry`
+                {gl.where()}
+                GROUP BY party_type, party, month
+                {opening_balances}
+            ) movement
+        ) balances
+        {snapshot.where()}
+        """,
+        values,
+    )
@@ -0,0 +1,31 @@
+// Copyright (c) 2025, Surgishop
+// License: MIT
+
+frappe.query_reports["Daily EOD Sales Detail"] = {
+  filters: [
+    {
+      fieldname: "from_date",
+      label: __("From Date"),
+      fieldtype: "Date",
+      default: frappe.datetime.get_today(),
+      reqd: 1,
+    },
+    {
+      fieldname: "to_date",
+      label: __("To Date"),
+      fieldtype: "Date",
+      default: frappe.datetime.get_today(),
+      reqd: 1,
+    },
+  ],
+
+  formatter(value, row, column, data, default_formatter) {
+    value = default_formatter(value, row, column, data);
+
+    // Day and grand total rows
+    if (data && (data.customer === "Daily Total Sales" || data.customer === "Grand Total")) {
+      return `<b>${value}</b>`;
+    }
+    return value;
+  },
+};
@@ -0,0 +1,23 @@
+// Copyright (c) 2025, Surgishop
+// License: MIT
+
+frappe.query_reports["Sent Sales Invoices"] = {
+  filters: [
+    {
+      fieldname: "from_date",
+      label: __("From Date"),
+      fieldtype: "Date",
+    },
+    {
+      fieldname: "to_date",
+      label: __("To Date"),
+      fieldtype: "Date",
+    },
+    {
+      fieldname: "status",
+      label: __("Status"),
+      fieldtype: "Select",
+      options: "\nScheduled\nSent\nFailed",
+    },
+  ],
+};
@@ -3,13 +3,65 @@
 
 import frappe
 
+from surgishop_reports.utils.query import Conditions
+
+DEFAULT_STATUSES = ("Sent", "Failed")
+
+
 def execute(filters=None):
     """
     Sent Sales Invoices
-    
-    TODO: Copy the report_script content from the exported JSON
+
+    Submitted sales invoices that were sent automatically by email, filtered
+    by send date range and send status (Sent and Failed by default).
     """
-    columns = []
-    data = []
-    
+    filters = frappe._dict(filters or {})
+    columns = get_columns()
+    data = get_data(filters)
     return columns, data
+
+
+def get_columns():
+    return [
+        {"fieldname": "name", "label": "Invoice Number", "fieldtype": "Link", "options": "Sales Invoice", "width": 150},
+        {"fieldname": "posting_date", "label": "Invoice Date", "fieldtype": "Date", "width": 100},
+        {"fieldname": "customer", "label": "Customer", "fieldtype": "Link", "options": "Customer", "width": 180},
+        {"fieldname": "customer_name", "label": "Customer Name", "fieldtype": "Data", "width": 180},
+        {"fieldname": "grand_total", "label": "Amount", "fieldtype": "Currency", "width": 120},
+        {"fieldname": "custom_auto_send_status", "label": "Send Status", "fieldtype": "Data", "width": 100},
+        {"fieldname": "custom_scheduled_send_time", "label": "Scheduled Send Time", "fieldtype": "Datetime", "width": 160},
+        {"fieldname": "custom_actual_send_time", "label": "Actual Send Time", "fieldtype": "Datetime", "width": 160},
+        {"fieldname": "contact_email", "label": "Email Sent To", "fieldtype": "Data", "width": 180},
+    ]
+
+
+def get_data(filters):
+    conditions = Conditions("docstatus = 1")
+
+    if filters.get("status"):
+        conditions.equals("custom_auto_send_status", filters.get("status"))
+    else:
+        # Blank and Scheduled invoices have not been sent yet
+        conditions.is_in("custom_auto_send_status", DEFAULT_STATUSES)
+
+    conditions.datetime_range("custom_actual_send_time", filters.get("from_date"), filters.get("to_date"))
+
+    return frappe.db.sql(
+        f"""
+        SELECT
+            name,
+            posting_date,
+            customer,
+            customer_name,
+            grand_total,
+            custom_auto_send_status,
+            custom_scheduled_send_time,
+            custom_actual_send_time,
+            contact_email
+        FROM `tabSales Invoice`
+        {conditions.where()}
+        ORDER BY custom_actual_send_time DESC
+        """,
+        conditions.values,
+        as_dict=1,
+    )
@@ -0,0 +1,40 @@
+// Copyright (c) 2025, Surgishop
+// License: MIT
+
+frappe.query_reports["Surgi General Ledger"] = {
+  filters: [
+    {
+      fieldname: "customer",
+      label: __("Customer"),
+      fieldtype: "Link",
+      options: "Customer",
+      reqd: 1,
+    },
+    {
+      fieldname: "from_date",
+      label: __("From Date"),
+      fieldtype: "Date",
+      reqd: 1,
+    },
+    {
+      fieldname: "to_date",
+      label: __("To Date"),
+      fieldtype: "Date",
+      reqd: 1,
+    },
+  ],
+
+  onload(report) {
+    surgishop_reports.add_export_menu(report);
+  },
+
+  formatter(value, row, column, data, default_formatter) {
+    value = default_formatter(value, row, column, data);
+
+    // Opening and closing rows
+    if (data && (data.description === "Opening Balance" || data.description === "Closing Balance")) {
+      return `<b>${value}</b>`;
+    }
+    return value;
+  },
+};
@@ -0,0 +1,89 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import frappe
+from frappe.utils import flt
+
+from surgishop_reports.accounts.party_balance import get_balance_forward
+
+
+def execute(filters=None):
+    """
+    Surgi General Ledger
+
+    The customer's GL Entries in the date range with a running balance,
+    between an opening row (balance forward from the Party Balance
+    Snapshot) and a closing row.
+    """
+    filters = frappe._dict(filters or {})
+    query, values = get_export_query(filters)
+    rows = transform_export_rows(filters, frappe.db.sql(query, values, as_dict=True))
+    return get_columns(), list(rows)
+
+
+def transform_export_rows(filters, rows):
+    """
+    The ledger lines with the opening row, running balance and closing
+    row; also used by utils.export. The balance forward is read before
+    the first line, since the export streams them over an unbuffered
+    cursor.
+    """
+    opening = get_balance_forward("Customer", [filters.customer], filters.from_date).get(filters.customer, 0)
+    return with_balances(rows, opening)
+
+
+def with_balances(rows, opening):
+    yield {"description": "Opening Balance", "balance": opening}
+
+    balance = opening
+    total_debit = total_credit = 0
+    for row in rows:
+        balance += flt(row.amount)
+        total_debit += flt(row.debit)
+        total_credit += flt(row.credit)
+        row.balance = balance
+        yield row
+
+    yield {
+        "description": "Closing Balance",
+        "debit": total_debit,
+        "credit": total_credit,
+        "amount": total_debit - total_credit,
+        "balance": balance,
+    }
+
+
+def get_export_query(filters):
+    """The ledger lines without the running balance, also used by utils.export"""
+    return (
+        """
+        SELECT
+            gle.posting_date AS posting_date,
+            CONCAT(gle.voucher_type, ' ', gle.voucher_no) AS description,
+            gle.debit AS debit,
+            gle.credit AS credit,
+            (gle.debit - gle.credit) AS amount
+        FROM `tabGL Entry` gle
+        WHERE gle.is_cancelled = 0
+            AND gle.party_type = 'Customer'
+            AND gle.party = %(customer)s
+            AND gle.posting_date BETWEEN %(from_date)s AND %(to_date)s
+        ORDER BY gle.posting_date ASC, gle.creation ASC
+        """,
+        {
+            "customer": filters.get("customer"),
+            "from_date": filters.get("from_date"),
+            "to_date": filters.get("to_date"),
+        },
+    )
+
+
+def get_columns():
+    return [
+        {"fieldname": "posting_date", "label": "Posting Date", "fieldtype": "Date", "width": 110},
+        {"fieldname": "description", "label": "Description", "fieldtype": "Data", "width": 280},
+        {"fieldname": "debit", "label": "Debit", "fieldtype": "Currency", "width": 120},
+        {"fieldname": "credit", "label": "Credit", "fieldtype": "Currency", "width": 120},
+        {"fieldname": "amount", "label": "Amount", "fieldtype": "Currency", "width": 120},
+        {"fieldname": "balance", "label": "Balance", "fieldtype": "Currency", "width": 130},
+    ]
@@ -0,0 +1,236 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Bulk statement runs
+===================
+Renders one statement print format for many customers as a background job
+and saves a single merged PDF (or a zip of per-customer PDFs) as a private
+File.
+
+Statement data is fetched in grouped queries per chunk of customers
+(customer_statement.get_*_statements). Each statement is then printed
+through Frappe's print view (frappe.get_print) with an unsaved document
+of the print format's doctype, so it gets the same print styles,
+letterhead and page shell as a single Print -> PDF; the Jinja methods of
+the template return the prebuilt data. The HTML to PDF conversion, which
+is most of the run time, happens in a bounded process pool.
+
+Every finished customer PDF is kept as a checkpoint under
+private/files/statement_runs/<run_id>/. Enqueuing the same run_id again
+resumes the run and skips the customers that are already rendered.
+
+Usage:
+    bench --site <site> execute surgishop_reports.accounts.statement_run.enqueue_statement_run \
+        --kwargs "{'print_format': 'Surgi Open Items Statement', 'from_date': '2025-01-01', 'to_date': '2025-01-31'}"
+"""
+
+import io
+import json
+import os
+import re
+import shutil
+import zipfile
+
+import frappe
+from frappe.utils import getdate, nowdate
+
+from surgishop_reports.accounts import customer_statement
+from surgishop_reports.utils.pool import get_pool
+
+STATEMENT_FORMATS = {
+    "Surgi Customer Statement": customer_statement.get_customer_statements,
+    "Surgi Transaction Statement": customer_statement.get_transaction_statements,
+    "Surgi Open Items Statement": customer_statement.get_open_items_statements,
+}
+
+CHUNK_SIZE = 250
+RUNS_FOLDER = "statement_runs"
+
+
+@frappe.whitelist()
+def enqueue_statement_run(print_format, from_date, to_date, customers=None, output="pdf", run_id=None):
+    """Start (or resume, when run_id is given) a bulk statement run"""
+    frappe.only_for(("Accounts Manager", "Accounts User", "System Manager"))
+
+    if print_format not in STATEMENT_FORMATS:
+        frappe.throw(f"Bulk runs are not supported for print format {print_format}")
+    if output not in ("pdf", "zip"):
+        frappe.throw(f"Unknown output {output}, expected pdf or zip")
+
+    run_id = run_id or frappe.generate_hash(length=10)
+    frappe.enqueue(
+        "surgishop_reports.accounts.statement_run.run",
+        queue="long",
+        timeout=4 * 60 * 60,
+        job_id=f"statement_run::{run_id}",
+        deduplicate=True,
+        run_id=run_id,
+        print_format=print_format,
+        from_date=from_date,
+        to_date=to_date,
+        customers=frappe.parse_json(customers) if customers else None,
+        output=output,
+    )
+    return run_id
+
+
+def run(run_id, print_format, from_date, to_date, customers=None, output="pdf", max_workers=None):
+    run_path = get_run_path(run_id)
+    manifest = load_manifest(run_path)
+    if not manifest:
+        manifest = {
+            "print_format": print_format,
+            "from_date": str(getdate(from_date)),
+            "to_date": str(getdate(to_date)),
+            "output": output,
+            "customers": customers or get_customers_with_balance(to_date),
+        }
+        os.makedirs(run_path, exist_ok=True)
+        with open(os.path.join(run_path, "manifest.json"), "w") as f:
+            json.dump(manifest, f)
+
+    customers = manifest["customers"]
+    pending = [
+        (idx, customer)
+        for idx, customer in enumerate(customers)
+        if not os.path.exists(get_checkpoint_path(run_path, idx))
+    ]
+    done = len(customers) - len(pending)
+    publish_progress(done, len(customers), manifest["print_format"])
+
+    if pending:
+        doctype = frappe.db.get_value("Print Format", manifest["print_format"], "doc_type")
+        build_statements = STATEMENT_FORMATS[manifest["print_format"]]
+
+        with get_pool(max_workers) as pool:
+            for start in range(0, len(pending), CHUNK_SIZE):
+                chunk = pending[start : start + CHUNK_SIZE]
+                statements = build_statements(
+                    [customer for _idx, customer in chunk], manifest["from_date"], manifest["to_date"]
+                )
+                customer_statement.use_statements(
+                    build_statements, statements, manifest["from_date"], manifest["to_date"]
+                )
+
+                futures = []
+                for idx, customer in chunk:
+                    html = get_statement_html(
+                        doctype, manifest["print_format"], customer, manifest["from_date"], manifest["to_date"]
+                    )
+                    futures.append(pool.submit(write_pdf, html, get_checkpoint_path(run_path, idx)))
+
+                for future in futures:
+                    future.result()
+                    done += 1
+                    publish_progress(done, len(customers), manifest["print_format"])
+
+    file_doc = save_output(run_id, run_path, manifest)
+    shutil.rmtree(run_path, ignore_errors=True)
+
+    frappe.publish_realtime(
+        "statement_run_complete",
+        {"run_id": run_id, "file_url": file_doc.file_url, "count": len(customers)},
+        user=frappe.session.user,
+    )
+    return file_doc.file_url
+
+
+def get_customers_with_balance(to_date):
+    return frappe.db.sql_list(
+        """
+        SELECT party
+        FROM `tabGL Entry`
+        WHERE party_type = 'Customer'
+            AND posting_date <= %(to_date)s
+            AND is_cancelled = 0
+        GROUP BY party
+        HAVING ABS(SUM(debit - credit)) >= 0.005
+        ORDER BY party
+        """,
+        {"to_date": to_date},
+    )
+
+
+def get_statement_html(doctype, print_format, customer, from_date, to_date):
+    """The print view page of one statement, as Print renders it (styles, letterhead, shell)"""
+    doc = frappe.get_doc(
+        {
+            "doctype": doctype,
+            "customer": customer,
+            "from_date": from_date,
+            "to_date": to_date,
+            "posting_date": nowdate(),
+        }
+    )
+    return frappe.get_print(doctype, None, print_format, doc=doc)
+
+
+def write_pdf(html, path):
+    """Pool worker: convert one statement and write it as a checkpoint"""
+    from frappe.utils.pdf import get_pdf
+
+    # Same conversion as frappe.get_print(as_pdf=True): margins come from the page
+    pdf = get_pdf(html)
+    with open(f"{path}.part", "wb") as f:
+        f.write(pdf)
+    # Only complete files count as done on resume
+    os.replace(f"{path}.part", path)
+    return path
+
+
+def save_output(run_id, run_path, manifest):
+    customers = manifest["customers"]
+    paths = [get_checkpoint_path(run_path, idx) for idx in range(len(customers))]
+    buffer = io.BytesIO()
+
+    if manifest["output"] == "zip":
+        file_name = f"statements-{run_id}.zip"
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for idx, (customer, path) in enumerate(zip(customers, paths)):
+                archive.write(path, f"{idx + 1:05d}-{safe_file_name(customer)}.pdf")
+    else:
+        from pypdf import PdfWriter
+
+        file_name = f"statements-{run_id}.pdf"
+        writer = PdfWriter()
+        for path in paths:
+            writer.append(path)
+        writer.write(buffer)
+
+    return frappe.get_doc(
+        {
+            "doctype": "File",
+            "file_name": file_name,
+            "is_private": 1,
+            "content": buffer.getvalue(),
+        }
+    ).insert(ignore_permissions=True)
+
+
+def publish_progress(done, total, print_format):
+    frappe.publish_progress(
+        done * 100 / total if total else 100,
+        title=print_format,
+        description=f"{done} of {total} statements",
+    )
+
+
+def get_run_path(run_id):
+    return frappe.get_site_path("private", "files", RUNS_FOLDER, run_id)
+
+
+def get_checkpoint_path(run_path, idx):
+    return os.path.join(run_path, f"{idx:05d}.pdf")
+
+
+def load_manifest(run_path):
+    path = os.path.join(run_path, "manifest.json")
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def safe_file_name(name):
+    return re.sub(r"[^\w.-]+", "_", name)
@@ -0,0 +1,79 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Item Tracking Report benchmark
+==============================
+Runs the report once per item for N items and then once in batch mode for
+the same N items, printing statement count and wall time for both. The
+history comes from the synthetic data set (benchmarks/seed.py), inserted
+inside the current transaction and rolled back afterwards; the N seeded
+items with the most Delivery Note lines are used.
+
+Usage:
+    bench --site <site> execute surgishop_reports.benchmarks.item_tracking_report.run
+    bench --site <site> execute surgishop_reports.benchmarks.item_tracking_report.run --kwargs "{'items': 20, 'scale': 100000}"
+"""
+
+import json
+
+import frappe
+
+from surgishop_reports.benchmarks import seed as bench_data
+from surgishop_reports.stock.report.item_tracking_report import item_tracking_report
+from surgishop_reports.utils.profiling import count_queries
+
+
+def run(items=50, page_length=50, scale=10000):
+    try:
+        bench_data.seed(scale)
+        item_codes = frappe.db.sql_list(
+            """
+            SELECT item_code
+            FROM `tabDelivery Note Item`
+            WHERE name LIKE %s
+            GROUP BY item_code
+            ORDER BY COUNT(*) DESC
+            LIMIT %s
+            """,
+            (f"{bench_data.BENCH_PREFIX}-%", items),
+        )
+        return time_runs(item_codes, page_length)
+    finally:
+        frappe.db.rollback()
+
+
+def time_runs(item_codes, page_length):
+    with count_queries() as single:
+        single_rows = 0
+        for item_code in item_codes:
+            _columns, data = item_tracking_report.execute({"item_code": item_code, "page_length": page_length})
+            single_rows += len(data)
+
+    with count_queries() as batched:
+        _columns, data = item_tracking_report.execute(
+            {"item_codes": json.dumps(item_codes), "page_length": page_length}
+        )
+        batched_rows = len(data)
+
+    result = {
+        "items": len(item_codes),
+        "single_runs_queries": single.count,
+        "single_runs_seconds": round(single.wall_time, 4),
+        "single_runs_rows": single_rows,
+        "batched_queries": batched.count,
+        "batched_seconds": round(batched.wall_time, 4),
+        "batched_rows": batched_rows,
+    }
+
+    print(f'{"Mode":<24} {"Queries":>8} {"Seconds":>10} {"Rows":>8}')
+    print("-" * 53)
+    print(
+        f'{str(result["items"]) + " single-item runs":<24} {result["single_runs_queries"]:>8} '
+        f'{result["single_runs_seconds"]:>10} {result["single_runs_rows"]:>8}'
+    )
+    print(
+        f'{"1 batched run":<24} {result["batched_queries"]:>8} '
+        f'{result["batched_seconds"]:>10} {result["batched_rows"]:>8}'
+    )
+    return result
@@ -0,0 +1,172 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Query plan regression check
+===========================
+Runs EXPLAIN for the query of every Query Report under
+surgishop_reports/*/report/ with representative filter values, and fails
+when a plan
+
+- does a full scan (type ALL) of one of LARGE_TABLES, unless the report's
+  budget lists the table in "allow_full_scan", or
+- estimates more rows (sum of the "rows" column) than the report's
+  "max_rows" budget.
+
+Budgets and filter overrides live in query_plan_budgets.json next to this
+file; reports without an entry get the "default" budget. Filters without
+an override are bound from the report JSON: Date filters to the default
+(or the last 30 days), Link filters to an existing record, Select filters
+to the first option.
+
+Run against a site with the ERPNext schema (and ideally seeded data, see
+benchmarks/report_indexes.py):
+    bench --site <site> execute surgishop_reports.benchmarks.query_plans.check
+    bench --site <site> execute surgishop_reports.benchmarks.query_plans.check --kwargs "{'report_name': 'Shipped Batch Expiry Report'}"
+"""
+
+import glob
+import json
+import os
+import re
+
+import frappe
+from frappe.utils import add_days, nowdate
+
+BUDGETS_FILE = os.path.join(os.path.dirname(__file__), "query_plan_budgets.json")
+
+LARGE_TABLES = {
+    "tabBin",
+    "tabDelivery Note",
+    "tabDelivery Note Item",
+    "tabGL Entry",
+    "tabItem Price",
+    "tabPayment Entry",
+    "tabPurchase Receipt",
+    "tabPurchase Receipt Item",
+    "tabQuotation",
+    "tabQuotation Item",
+    "tabSales Invoice",
+    "tabSales Invoice Item",
+    "tabSales Order",
+    "tabSales Order Item",
+    "tabSerial and Batch Entry",
+    "tabStock Ledger Entry",
+}
+
+# `tabSales Invoice` si / `tabSales Invoice` AS si
+TABLE_ALIAS = re.compile(r"`(tab[^`]+)`(?:\s+(?:AS\s+)?(?!ON\b|WHERE\b|INNER\b|LEFT\b|JOIN\b|GROUP\b|ORDER\b)(\w+))?", re.IGNORECASE)
+
+
+def check(report_name=None):
+    """EXPLAIN every Query Report (or one) and throw if any plan is over budget"""
+    budgets = load_budgets()
+    results = []
+
+    for report in get_query_reports():
+        if report_name and report["name"] != report_name:
+            continue
+
+        budget = dict(budgets.get("default", {}), **budgets.get(report["name"], {}))
+        results.append(explain_report(report, budget))
+
+    print_results(results)
+
+    failures = [r for r in results if r["violations"]]
+    if failures:
+        frappe.throw(
+            "Query plan budget exceeded:<br>"
+            + "<br>".join(f'{r["report"]}: {"; ".join(r["violations"])}' for r in failures)
+        )
+    return results
+
+
+def get_query_reports():
+    app_path = frappe.get_app_path("surgishop_reports")
+    for path in sorted(glob.glob(os.path.join(app_path, "*", "report", "*", "*.json"))):
+        with open(path) as f:
+            report = json.load(f)
+        if report.get("report_type") == "Query Report" and report.get("query"):
+            yield report
+
+
+def explain_report(report, budget):
+    query = report["query"].strip().rstrip(";")
+    values = get_filter_values(report, budget.get("filters") or {})
+    plan = frappe.db.sql(f"EXPLAIN {query}", values, as_dict=True)
+
+    aliases = get_table_aliases(query)
+    allowed = set(budget.get("allow_full_scan") or [])
+    violations = []
+    estimated_rows = 0
+
+    for step in plan:
+        estimated_rows += step.get("rows") or 0
+        table = aliases.get(step.get("table"), step.get("table"))
+        if step.get("type") == "ALL" and table in LARGE_TABLES and table not in allowed:
+            violations.append(f"full scan of {table}")
+
+    if estimated_rows > budget["max_rows"]:
+        violations.append(f"estimated rows {estimated_rows:,} > budget {budget['max_rows']:,}")
+
+    return {
+        "report": report["name"],
+        "estimated_rows": estimated_rows,
+        "max_rows": budget["max_rows"],
+        "full_scans": sorted(
+            {aliases.get(s.get("table"), s.get("table")) for s in plan if s.get("type") == "ALL"}
+        ),
+        "violations": violations,
+    }
+
+
+def get_filter_values(report, overrides):
+    """Bind every filter of the report to a representative value"""
+    values = {}
+    for f in report.get("filters") or []:
+        fieldname = f["fieldname"]
+        if fieldname in overrides:
+            values[fieldname] = overrides[fieldname]
+        elif f["fieldtype"] == "Date":
+            values[fieldname] = get_date_value(fieldname, f.get("default"))
+        elif f["fieldtype"] == "Link" and f.get("options"):
+            values[fieldname] = frappe.db.get_value(f["options"], {}, "name")
+        elif f["fieldtype"] == "Select" and f.get("options"):
+            values[fieldname] = next((o for o in f["options"].split("\n") if o), None)
+        else:
+            values[fieldname] = f.get("default")
+
+    # Filters used by the query but not declared on the report
+    for fieldname, value in overrides.items():
+        values.setdefault(fieldname, value)
+    return values
+
+
+def get_date_value(fieldname, default):
+    if default == "Today" or fieldname == "to_date":
+        return nowdate()
+    return add_days(nowdate(), -30)
+
+
+def get_table_aliases(query):
+    aliases = {}
+    for table, alias in TABLE_ALIAS.findall(query):
+        aliases[table] = table
+        if alias:
+            aliases[alias] = table
+    return aliases
+
+
+def load_budgets():
+    with open(BUDGETS_FILE) as f:
+        return json.load(f)
+
+
+def print_results(results):
+    print(f'{"Report":<32} {"Est. rows":>10} {"Budget":>10}  {"Full scans":<40} Status')
+    print("-" * 110)
+    for r in results:
+        print(
+            f'{r["report"]:<32} {r["estimated_rows"]:>10,} {r["max_rows"]:>10,}  '
+            f'{", ".join(r["full_scans"]) or "-":<40} {"FAIL" if r["violations"] else "ok"}'
+        )
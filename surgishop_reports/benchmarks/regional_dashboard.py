@@ -0,0 +1,158 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Regional Dashboard benchmark
+============================
+Compares the old per-rep query loop with the batched data layer (goals
+plus the daily revenue rollup) for 10, 100 and 1,000 reps. The reps, their
+targets and invoices come from the synthetic data set (benchmarks/seed.py),
+inserted inside the current transaction with the derived tables rebuilt,
+and rolled back afterwards, so the site data is left untouched.
+
+Usage:
+    bench --site <site> execute surgishop_reports.benchmarks.regional_dashboard.run
+    bench --site <site> execute surgishop_reports.benchmarks.regional_dashboard.run --kwargs "{'sizes': [10, 50]}"
+"""
+
+import frappe
+from frappe.utils import add_days, flt, nowdate
+
+from surgishop_reports.benchmarks import seed as bench_data
+from surgishop_reports.selling.report.regional_dashboard import regional_dashboard
+from surgishop_reports.utils.profiling import count_queries
+
+INVOICES_PER_REP = 5
+
+
+def run(sizes=(10, 100, 1000), invoices_per_rep=INVOICES_PER_REP):
+    filters = frappe._dict(from_date=add_days(nowdate(), -30), to_date=nowdate())
+    results = []
+
+    for size in sizes:
+        try:
+            bench_data.seed(size * invoices_per_rep, reps=size)
+            bench_data.rebuild_derived()
+            reps = frappe.get_all("Sales Person", filters={"enabled": 1}, pluck="name")
+
+            with count_queries() as legacy:
+                legacy_data = get_data_per_rep(filters)
+            with count_queries() as batched:
+                batched_data = regional_dashboard.get_data(filters)
+
+            if legacy_data != batched_data:
+                frappe.throw(f"Batched output differs from per-rep output for {size} reps")
+
+            results.append(
+                {
+                    "reps": len(reps),
+                    "per_rep_queries": legacy.count,
+                    "per_rep_seconds": round(legacy.wall_time, 4),
+                    "batched_queries": batched.count,
+                    "batched_seconds": round(batched.wall_time, 4),
+                }
+            )
+        finally:
+            frappe.db.rollback()
+
+    print_results(results)
+    return results
+
+
+def get_data_per_rep(filters):
+    """The previous implementation: three queries for every rep"""
+    sales_persons = frappe.get_all(
+        "Sales Person", filters={"enabled": 1}, order_by="name asc", pluck="name"
+    )
+
+    data = []
+    for sales_person_name in sales_persons:
+        targets = frappe.db.sql(
+            """
+            SELECT
+                SUM(CASE WHEN item_group = 'Products' THEN target_amount ELSE 0 END) as sales_goal,
+                SUM(CASE WHEN item_group = 'SIL' THEN target_amount ELSE 0 END) as sil_goal
+            FROM `tabTarget Detail`
+            WHERE parent = %(sales_person)s
+            """,
+            {"sales_person": sales_person_name},
+            as_dict=1,
+        )
+        sales_goal = flt(targets[0].get("sales_goal")) if targets else 0
+        sil_goal = flt(targets[0].get("sil_goal")) if targets else 0
+
+        where_clause, values = get_date_conditions(filters)
+        values["sales_person"] = sales_person_name
+
+        total_sales = flt(
+            frappe.db.sql(
+                f"""
+                SELECT SUM(si.grand_total)
+                FROM `tabSales Invoice` si
+                INNER JOIN `tabSales Team` st ON st.parent = si.name
+                WHERE si.docstatus = 1
+                    AND st.sales_person = %(sales_person)s
+                    {where_clause}
+                """,
+                values,
+            )[0][0]
+        )
+        current_sil = flt(
+            frappe.db.sql(
+                f"""
+                SELECT SUM(sii.amount)
+                FROM `tabSales Invoice` si
+                INNER JOIN `tabSales Team` st ON st.parent = si.name
+                INNER JOIN `tabSales Invoice Item` sii ON sii.parent = si.name
+                INNER JOIN `tabItem` item ON item.name = sii.item_code
+                WHERE si.docstatus = 1
+                    AND st.sales_person = %(sales_person)s
+                    AND item.item_group = 'SIL'
+                    {where_clause}
+                """,
+                values,
+            )[0][0]
+        )
+
+        sales_goal_percent = f"{round((total_sales / sales_goal * 100), 2)}%" if sales_goal > 0 else "0%"
+        sil_goal_percent = f"{round((current_sil / sil_goal * 100), 2)}%" if sil_goal > 0 else "0%"
+
+        data.append(
+            {
+                "sales_person": sales_person_name,
+                "total_sales": total_sales,
+                "sales_goal": sales_goal,
+                "current_sil": current_sil,
+                "sil_goal": sil_goal,
+                "sales_goal_percent": sales_goal_percent,
+                "sil_goal_percent": sil_goal_percent,
+            }
+        )
+
+    return data
+
+
+def get_date_conditions(filters):
+    conditions = []
+    values = {}
+
+    if filters.get("from_date"):
+        conditions.append("si.posting_date >= %(from_date)s")
+        values["from_date"] = filters.get("from_date")
+
+    if filters.get("to_date"):
+        conditions.append("si.posting_date <= %(to_date)s")
+        values["to_date"] = filters.get("to_date")
+
+    where_clause = ("AND " + " AND ".join(conditions)) if conditions else ""
+    return where_clause, values
+
+
+def print_results(results):
+    print(f'{"Reps":>8} {"Per-rep queries":>16} {"Per-rep s":>10} {"Batched queries":>16} {"Batched s":>10}')
+    print("-" * 64)
+    for r in results:
+        print(
+            f'{r["reps"]:>8} {r["per_rep_queries"]:>16} {r["per_rep_seconds"]:>10} '
+            f'{r["batched_queries"]:>16} {r["batched_seconds"]:>10}'
+        )
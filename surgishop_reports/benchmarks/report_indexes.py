@@ -0,0 +1,104 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Report index benchmark
+======================
+Times the report behind each entry of utils.indexes.REPORT_INDEXES with
+the index ignored and then in use. The index is switched with MariaDB's
+ALTER INDEX ... IGNORED / NOT IGNORED (MariaDB 10.6+), so nothing is
+dropped or rebuilt.
+
+The synthetic data set (benchmarks/seed.py) is inserted first so the
+difference shows on small sites too. ALTER TABLE commits implicitly, so
+it cannot be rolled back; it is deleted again at the end.
+
+Usage:
+    bench --site <site> execute surgishop_reports.benchmarks.report_indexes.run
+    bench --site <site> execute surgishop_reports.benchmarks.report_indexes.run --kwargs "{'scale': 200000}"
+"""
+
+import time
+
+import frappe
+from frappe.utils import add_days, nowdate
+
+from surgishop_reports.benchmarks import seed as bench_data
+from surgishop_reports.utils.indexes import REPORT_INDEXES, ensure_index
+
+RUNS = 3
+
+# Report and filters that exercise each index
+PROBES = {
+    "Sales Invoice Item": ("Shipped Batch Expiry Report", {"from_date": add_days(nowdate(), -30), "to_date": nowdate()}),
+    "Sales Invoice": ("Sent Sales Invoices", {"status": "Sent", "from_date": add_days(nowdate(), -7), "to_date": nowdate()}),
+    "Delivery Note": ("Delivery Note Status", {}),
+    "GL Entry": (
+        "Surgi General Ledger",
+        {"customer": f"{bench_data.BENCH_PREFIX}-CUST-00001", "from_date": add_days(nowdate(), -365), "to_date": nowdate()},
+    ),
+    "Bin": ("Stock Status", {}),
+}
+
+
+def run(scale=50000):
+    results = []
+    try:
+        bench_data.cleanup()
+        bench_data.seed(scale)
+        bench_data.rebuild_derived()
+        frappe.db.commit()
+
+        for doctype, fields in REPORT_INDEXES:
+            index_name = ensure_index(doctype, fields)
+            if not index_name:
+                print(f"[SKIP] {doctype} {fields}: columns not installed")
+                continue
+
+            report_name, filters = PROBES[doctype]
+            try:
+                set_index_ignored(doctype, index_name, True)
+                before = time_report(report_name, filters)
+            finally:
+                set_index_ignored(doctype, index_name, False)
+            after = time_report(report_name, filters)
+
+            results.append(
+                {
+                    "report": report_name,
+                    "index": f"{doctype} ({', '.join(fields)})",
+                    "before_seconds": round(before, 4),
+                    "after_seconds": round(after, 4),
+                }
+            )
+    finally:
+        bench_data.cleanup()
+        frappe.db.commit()
+
+    print_results(results)
+    return results
+
+
+def set_index_ignored(doctype, index_name, ignored):
+    frappe.db.sql_ddl(
+        f"ALTER TABLE `tab{doctype}` ALTER INDEX `{index_name}` {'IGNORED' if ignored else 'NOT IGNORED'}"
+    )
+
+
+def time_report(report_name, filters):
+    """Best of RUNS executions of the report, in seconds"""
+    report = frappe.get_doc("Report", report_name)
+    best = None
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        report.get_data(filters=filters, as_dict=True, ignore_prepared_report=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def print_results(results):
+    print(f'{"Report":<30} {"Index":<55} {"Before s":>9} {"After s":>9}')
+    print("-" * 106)
+    for r in results:
+        print(f'{r["report"]:<30} {r["index"]:<55} {r["before_seconds"]:>9} {r["after_seconds"]:>9}')
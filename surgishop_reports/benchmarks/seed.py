@@ -0,0 +1,352 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Synthetic data generator
+========================
+Inserts a realistic, reproducible data set sized by the number of Sales
+Invoices (`scale`), for the benchmark suite (benchmarks/suite.py):
+
+- Customers, Items with Standard Selling prices, Batches
+- Sales Persons with a Products and an SIL target each
+- Sales Invoices with ~3 items, a Sales Team row and two GL Entries each
+- Bins for every item in three of the warehouses
+- Quotations and Sales Orders (scale / 10 each, two items)
+- Delivery Notes (scale / 2) and Purchase Receipts (scale / 20), every
+  line with a Serial and Batch Bundle and entry
+
+Rows go in with bulk inserts of CHUNK_SIZE, so memory stays flat at 10^6
+invoices. Documents are not validated and no ledgers are posted; every
+name starts with the prefix, and `cleanup` deletes them again. Columns
+that are not installed on the site (custom fields) are left out.
+
+Bulk inserts fire no doc events, so the derived tables (sales person
+revenue rollup, party balance snapshot, margin cube) do not see the
+seeded rows until `rebuild_derived` runs; `cleanup` runs it too.
+
+The other benchmarks seed through this module as well, at the size they
+need, and roll back or clean up afterwards.
+
+Usage:
+    bench --site <site> execute surgishop_reports.benchmarks.seed.seed --kwargs "{'scale': 100000}"
+    bench --site <site> execute surgishop_reports.benchmarks.seed.rebuild_derived
+    bench --site <site> execute surgishop_reports.benchmarks.seed.cleanup
+"""
+
+import random
+
+import frappe
+from frappe.utils import add_days, getdate, nowdate
+
+from surgishop_reports.accounts import party_balance
+from surgishop_reports.selling import margin_cube, sales_person_revenue
+
+BENCH_PREFIX = "zz-bench"
+CHUNK_SIZE = 10000
+
+# Days of history the documents are spread over
+HISTORY_DAYS = 730
+
+STORES_WAREHOUSE = "Stores - SURGI"
+BLEMISH_WAREHOUSE = "Blemish - SURGI"
+
+SEEDED_DOCTYPES = [
+    "Customer",
+    "Item",
+    "Item Price",
+    "Sales Person",
+    "Target Detail",
+    "Batch",
+    "Bin",
+    "Sales Invoice",
+    "Sales Invoice Item",
+    "Sales Team",
+    "GL Entry",
+    "Quotation",
+    "Quotation Item",
+    "Sales Order",
+    "Sales Order Item",
+    "Delivery Note",
+    "Delivery Note Item",
+    "Purchase Receipt",
+    "Purchase Receipt Item",
+    "Serial and Batch Bundle",
+    "Serial and Batch Entry",
+]
+
+
+class Writer:
+    """Buffers rows per doctype and bulk inserts them CHUNK_SIZE at a time"""
+
+    def __init__(self):
+        self.rows = {}
+        self.columns = {}
+        self.counts = {}
+
+    def add(self, doctype, **row):
+        rows = self.rows.setdefault(doctype, [])
+        rows.append(row)
+        if len(rows) >= CHUNK_SIZE:
+            self.flush(doctype)
+
+    def flush(self, doctype=None):
+        for dt in [doctype] if doctype else list(self.rows):
+            rows = self.rows.pop(dt, None)
+            if not rows:
+                continue
+            if dt not in self.columns:
+                installed = set(frappe.db.get_table_columns(dt))
+                self.columns[dt] = [field for field in rows[0] if field in installed]
+            fields = self.columns[dt]
+            frappe.db.bulk_insert(dt, fields, [tuple(row[field] for field in fields) for row in rows])
+            self.counts[dt] = self.counts.get(dt, 0) + len(rows)
+
+
+def seed(scale=100000, seed_value=1, reps=20):
+    """Insert the data set for `scale` Sales Invoices and `reps` Sales Persons; returns rows per doctype"""
+    rng = random.Random(seed_value)
+    writer = Writer()
+    today = getdate(nowdate())
+
+    def past_date():
+        return add_days(today, -rng.randint(0, HISTORY_DAYS))
+
+    customers = [f"{BENCH_PREFIX}-CUST-{i:05d}" for i in range(max(scale // 200, 10))]
+    items = [f"{BENCH_PREFIX}-ITEM-{i:05d}" for i in range(max(scale // 100, 50))]
+    sales_persons = [f"{BENCH_PREFIX}-REP-{i:05d}" for i in range(reps)]
+    delivery_notes = scale // 2
+    warehouses = [STORES_WAREHOUSE, BLEMISH_WAREHOUSE] + [f"{BENCH_PREFIX}-WH-{i}" for i in range(8)]
+    categories = ["Vascular", "ENT", "Orthopedic", "Mesh", "Robotics"]
+
+    for customer in customers:
+        writer.add(
+            "Customer",
+            name=customer,
+            customer_name=customer,
+            customer_group="Commercial",
+            territory="All Territories",
+        )
+    for sales_person in sales_persons:
+        writer.add("Sales Person", name=sales_person, sales_person_name=sales_person, enabled=1, is_group=0)
+        for suffix, item_group, target_amount in (("p", "Products", 10000), ("s", "SIL", 2500)):
+            writer.add(
+                "Target Detail",
+                name=f"{sales_person}-{suffix}",
+                parent=sales_person,
+                parenttype="Sales Person",
+                parentfield="targets",
+                item_group=item_group,
+                target_amount=target_amount,
+            )
+
+    batches = {}
+    for i, item_code in enumerate(items):
+        writer.add(
+            "Item",
+            name=item_code,
+            item_code=item_code,
+            item_name=item_code,
+            description=f"Synthetic item {i}",
+            item_group="SIL" if i % 10 == 0 else "Products",
+            brand=f"{BENCH_PREFIX}-BRAND-{i % 25}",
+            stock_uom="Nos",
+            disabled=0,
+            has_batch_no=1,
+            custom_item_category=rng.choice(categories),
+        )
+        writer.add(
+            "Item Price",
+            name=f"{item_code}-ip",
+            item_code=item_code,
+            price_list="Standard Selling",
+            price_list_rate=rng.randint(10, 2000),
+        )
+        for warehouse in rng.sample(warehouses, 3):
+            writer.add(
+                "Bin",
+                name=f"{item_code}-{warehouse}",
+                item_code=item_code,
+                warehouse=warehouse,
+                actual_qty=rng.randint(0, 200),
+            )
+        batches[item_code] = [f"{item_code}-B{j}" for j in range(3)]
+        for batch in batches[item_code]:
+            expiry_date = add_days(today, rng.randint(-60, 720))
+            writer.add("Batch", name=batch, batch_id=batch, item=item_code, expiry_date=expiry_date)
+
+    for i in range(scale):
+        invoice = f"{BENCH_PREFIX}-SINV-{i:07d}"
+        customer = rng.choice(customers)
+        posting_date = past_date()
+        grand_total = 0
+        for j in range(rng.randint(1, 5)):
+            qty = rng.randint(1, 10)
+            rate = rng.randint(10, 2000)
+            grand_total += qty * rate
+            writer.add(
+                "Sales Invoice Item",
+                name=f"{invoice}-{j}",
+                parent=invoice,
+                parenttype="Sales Invoice",
+                parentfield="items",
+                idx=j + 1,
+                item_code=rng.choice(items),
+                qty=qty,
+                stock_qty=qty,
+                rate=rate,
+                amount=qty * rate,
+                base_net_amount=qty * rate,
+                valuation_rate=rate * 0.6,
+                delivery_note=f"{BENCH_PREFIX}-DN-{rng.randrange(delivery_notes):07d}" if delivery_notes else None,
+            )
+        outstanding = grand_total if rng.random() < 0.2 else 0
+        writer.add(
+            "Sales Invoice",
+            name=invoice,
+            customer=customer,
+            customer_name=customer,
+            posting_date=posting_date,
+            docstatus=1,
+            grand_total=grand_total,
+            outstanding_amount=outstanding,
+            custom_auto_send_status=rng.choice(["Scheduled", "Sent", "Sent", "Failed"]),
+            custom_actual_send_time=posting_date,
+        )
+        writer.add(
+            "Sales Team",
+            name=f"{invoice}-st",
+            parent=invoice,
+            parenttype="Sales Invoice",
+            parentfield="sales_team",
+            sales_person=rng.choice(sales_persons),
+            allocated_percentage=100,
+        )
+        writer.add(
+            "GL Entry",
+            name=f"{invoice}-gl-dr",
+            posting_date=posting_date,
+            party_type="Customer",
+            party=customer,
+            debit=grand_total,
+            credit=0,
+            voucher_type="Sales Invoice",
+            voucher_no=invoice,
+            is_cancelled=0,
+        )
+        writer.add(
+            "GL Entry",
+            name=f"{invoice}-gl-cr",
+            posting_date=posting_date,
+            party_type=None,
+            party=None,
+            debit=0,
+            credit=grand_total,
+            voucher_type="Sales Invoice",
+            voucher_no=invoice,
+            is_cancelled=0,
+        )
+
+    for doctype, abbr, child, statuses in (
+        ("Quotation", "QTN", "Quotation Item", ["Open", "Lost", "Ordered"]),
+        ("Sales Order", "SO", "Sales Order Item", ["To Deliver and Bill", "Completed", "Closed"]),
+    ):
+        for i in range(scale // 10):
+            name = f"{BENCH_PREFIX}-{abbr}-{i:07d}"
+            writer.add(
+                doctype,
+                name=name,
+                customer=rng.choice(customers),
+                party_name=rng.choice(customers),
+                quotation_to="Customer",
+                transaction_date=past_date(),
+                valid_till=add_days(today, rng.randint(-30, 60)),
+                docstatus=1,
+                status=rng.choice(statuses),
+            )
+            for j in range(2):
+                qty = rng.randint(1, 10)
+                writer.add(
+                    child,
+                    name=f"{name}-{j}",
+                    parent=name,
+                    parenttype=doctype,
+                    parentfield="items",
+                    idx=j + 1,
+                    item_code=rng.choice(items),
+                    qty=qty,
+                    stock_qty=qty,
+                )
+
+    for doctype, abbr, child, count, transaction, party_field in (
+        ("Delivery Note", "DN", "Delivery Note Item", delivery_notes, "Outward", "customer"),
+        ("Purchase Receipt", "PR", "Purchase Receipt Item", scale // 20, "Inward", "supplier"),
+    ):
+        for i in range(count):
+            name = f"{BENCH_PREFIX}-{abbr}-{i:07d}"
+            posting_date = past_date()
+            party = rng.choice(customers) if party_field == "customer" else f"{BENCH_PREFIX}-SUPP"
+            writer.add(
+                doctype,
+                name=name,
+                posting_date=posting_date,
+                creation=posting_date,
+                docstatus=1,
+                status="Completed",
+                **{party_field: party},
+            )
+            for j in range(2):
+                row_name = f"{name}-{j}"
+                item_code = rng.choice(items)
+                bundle = f"{row_name}-sbb"
+                qty = rng.randint(1, 10)
+                writer.add(
+                    child,
+                    name=row_name,
+                    parent=name,
+                    parenttype=doctype,
+                    parentfield="items",
+                    idx=j + 1,
+                    item_code=item_code,
+                    qty=qty,
+                    warehouse=STORES_WAREHOUSE,
+                    serial_and_batch_bundle=bundle,
+                )
+                writer.add(
+                    "Serial and Batch Bundle",
+                    name=bundle,
+                    item_code=item_code,
+                    warehouse=STORES_WAREHOUSE,
+                    has_batch_no=1,
+                    type_of_transaction=transaction,
+                    voucher_type=doctype,
+                    voucher_no=name,
+                    voucher_detail_no=row_name,
+                    docstatus=1,
+                )
+                writer.add(
+                    "Serial and Batch Entry",
+                    name=f"{bundle}-0",
+                    parent=bundle,
+                    parenttype="Serial and Batch Bundle",
+                    parentfield="entries",
+                    batch_no=rng.choice(batches[item_code]),
+                    qty=qty,
+                    warehouse=STORES_WAREHOUSE,
+                )
+
+    writer.flush()
+    return writer.counts
+
+
+def rebuild_derived():
+    """Recompute the tables that doc events keep up to date, which bulk inserts skip"""
+    sales_person_revenue.rebuild()
+    party_balance.rebuild()
+    margin_cube.rebuild()
+
+
+def cleanup():
+    """Delete every row inserted by `seed`, and the derived rows built from them"""
+    for doctype in SEEDED_DOCTYPES:
+        frappe.db.sql(f"DELETE FROM `tab{doctype}` WHERE name LIKE %s", (f"{BENCH_PREFIX}-%",))
+    rebuild_derived()
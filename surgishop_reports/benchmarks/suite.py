@@ -0,0 +1,236 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Benchmark suite
+===============
+Seeds the synthetic data set (benchmarks/seed.py) at each scale and
+rebuilds the derived tables from it, then times every report under surgishop_reports/*/report/ and the HTML (and
+optionally PDF) rendering of every bulk statement format for a number of
+customers. Each report is run RUNS times, with the availability and
+catalogue caches cleared before every run, and the best wall time is kept along with its SQL statement count and rows.
+
+Results are written as JSON (commit, site, timings per scale) so two runs
+can be compared with `compare`. The seeded rows are deleted after each
+scale; pass keep=True to leave the last scale in place.
+
+Usage:
+    bench --site <site> execute surgishop_reports.benchmarks.suite.run
+    bench --site <site> execute surgishop_reports.benchmarks.suite.run --kwargs "{'scales': [100000, 1000000], 'pdf': True}"
+    bench --site <site> execute surgishop_reports.benchmarks.suite.compare --kwargs "{'baseline': '...json', 'current': '...json'}"
+"""
+
+import glob
+import json
+import os
+import subprocess
+import time
+
+import frappe
+from frappe.utils import add_days, now_datetime, nowdate
+
+from surgishop_reports.accounts import customer_statement, statement_run
+from surgishop_reports.benchmarks import seed as bench_data
+from surgishop_reports.benchmarks.query_plans import get_filter_values
+from surgishop_reports.stock import availability, catalogue
+from surgishop_reports.utils.profiling import count_queries
+
+RUNS = 3
+RESULTS_FOLDER = "benchmarks"
+
+# Reports that need a specific seeded record to return anything
+REPORT_FILTERS = {
+    "Customer Item Purchase History": {"customer": f"{bench_data.BENCH_PREFIX}-CUST-00000"},
+    "Item Tracking Report": {"item_code": f"{bench_data.BENCH_PREFIX}-ITEM-00000"},
+    "Products by Specialty": {"custom_item_category": None},
+    "Surgi General Ledger": {"customer": f"{bench_data.BENCH_PREFIX}-CUST-00000"},
+    "Warehouse Stock Status": {"item_code": None},
+}
+
+
+def run(scales=(1000, 10000, 100000), statement_customers=(10, 100), pdf=False, output=None, keep=False):
+    results = {
+        "commit": get_commit(),
+        "site": frappe.local.site,
+        "started": str(now_datetime()),
+        "runs": RUNS,
+        "scales": [],
+    }
+
+    for idx, scale in enumerate(scales):
+        bench_data.cleanup()
+        start = time.perf_counter()
+        counts = bench_data.seed(scale)
+        seed_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        bench_data.rebuild_derived()
+        frappe.db.commit()
+
+        entry = {
+            "scale": scale,
+            "seed_seconds": round(seed_seconds, 2),
+            "rebuild_seconds": round(time.perf_counter() - start, 2),
+            "rows": counts,
+            "reports": [time_report(report) for report in get_reports()],
+            "statements": [
+                time_statements(print_format, customers, pdf)
+                for print_format in statement_run.STATEMENT_FORMATS
+                for customers in statement_customers
+            ],
+        }
+        results["scales"].append(entry)
+        print_scale(entry)
+
+        if not (keep and idx == len(scales) - 1):
+            bench_data.cleanup()
+            frappe.db.commit()
+
+    path = output or get_results_path(results)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=1)
+    print(f"Results written to {path}")
+    return path
+
+
+def get_reports():
+    app_path = frappe.get_app_path("surgishop_reports")
+    for path in sorted(glob.glob(os.path.join(app_path, "*", "report", "*", "*.json"))):
+        with open(path) as f:
+            yield json.load(f)
+
+
+def get_filters(report):
+    filters = {"from_date": add_days(nowdate(), -30), "to_date": nowdate()}
+    filters.update(get_filter_values(report, REPORT_FILTERS.get(report["name"], {})))
+    return filters
+
+
+def time_report(report):
+    result = {"report": report["name"], "type": report["report_type"]}
+    doc = frappe.get_doc("Report", report["name"])
+    filters = get_filters(report)
+
+    try:
+        best = None
+        for _ in range(RUNS):
+            availability.clear_cache()
+            catalogue.clear_cache()
+            with count_queries() as stats:
+                _columns, data = doc.get_data(filters=filters, as_dict=True, ignore_prepared_report=True)
+            if best is None or stats.wall_time < best.wall_time:
+                best, rows = stats, len(data)
+    except Exception as e:
+        frappe.db.rollback()
+        result["error"] = repr(e)
+        return result
+
+    result.update(
+        seconds=round(best.wall_time, 4),
+        queries=best.count,
+        sql_seconds=round(best.sql_time, 4),
+        rows=rows,
+    )
+    return result
+
+
+def time_statements(print_format, count, pdf=False):
+    """Build and render `count` statements the way a bulk run does"""
+    customers = frappe.db.sql_list(
+        "SELECT name FROM `tabCustomer` WHERE name LIKE %s ORDER BY name LIMIT %s",
+        (f"{bench_data.BENCH_PREFIX}-%", count),
+    )
+    from_date, to_date = add_days(nowdate(), -90), nowdate()
+    doctype = frappe.db.get_value("Print Format", print_format, "doc_type")
+    build_statements = statement_run.STATEMENT_FORMATS[print_format]
+
+    with count_queries() as stats:
+        statements = build_statements(customers, from_date, to_date)
+        customer_statement.use_statements(build_statements, statements, from_date, to_date)
+        render_start = time.perf_counter()
+        html = [
+            statement_run.get_statement_html(doctype, print_format, c, from_date, to_date) for c in customers
+        ]
+        render_seconds = time.perf_counter() - render_start
+
+    result = {
+        "print_format": print_format,
+        "customers": len(customers),
+        "queries": stats.count,
+        "seconds": round(stats.wall_time, 4),
+        "html_seconds": round(render_seconds, 4),
+        "html_bytes": sum(len(h) for h in html),
+    }
+
+    if pdf:
+        from frappe.utils.pdf import get_pdf
+
+        start = time.perf_counter()
+        for h in html:
+            get_pdf(h)
+        result["pdf_seconds"] = round(time.perf_counter() - start, 4)
+
+    return result
+
+
+def compare(baseline, current):
+    """Print the change in seconds per report and statement between two result files"""
+    with open(baseline) as f:
+        before = index_results(json.load(f))
+    with open(current) as f:
+        after = index_results(json.load(f))
+
+    print(f'{"Scale":>8} {"Benchmark":<50} {"Before s":>9} {"After s":>9} {"Change":>8}')
+    print("-" * 88)
+    for key in sorted(set(before) & set(after)):
+        old, new = before[key], after[key]
+        change = f"{(new - old) / old * 100:+.0f}%" if old else "-"
+        print(f"{key[0]:>8} {key[1]:<50} {old:>9} {new:>9} {change:>8}")
+
+
+def index_results(results):
+    indexed = {}
+    for entry in results["scales"]:
+        for r in entry["reports"]:
+            if "seconds" in r:
+                indexed[(entry["scale"], r["report"])] = r["seconds"]
+        for r in entry["statements"]:
+            indexed[(entry["scale"], f'{r["print_format"]} x{r["customers"]}')] = r["seconds"]
+    return indexed
+
+
+def get_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=frappe.get_app_path("surgishop_reports"),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_results_path(results):
+    stamp = now_datetime().strftime("%Y%m%d-%H%M%S")
+    name = f"{stamp}-{results['commit']}.json" if results["commit"] else f"{stamp}.json"
+    return frappe.get_site_path("private", RESULTS_FOLDER, name)
+
+
+def print_scale(entry):
+    print(
+        f'\nScale {entry["scale"]:,} invoices '
+        f'(seeded in {entry["seed_seconds"]} s, derived tables rebuilt in {entry["rebuild_seconds"]} s)'
+    )
+    print(f'{"Report":<36} {"Seconds":>9} {"Queries":>8} {"Rows":>8}')
+    print("-" * 64)
+    for r in entry["reports"]:
+        if "error" in r:
+            print(f'{r["report"]:<36} {"error: " + r["error"][:60]}')
+        else:
+            print(f'{r["report"]:<36} {r["seconds"]:>9} {r["queries"]:>8} {r["rows"]:>8}')
+    print(f'\n{"Statement format":<36} {"Customers":>9} {"Seconds":>9} {"Queries":>8}')
+    print("-" * 66)
+    for r in entry["statements"]:
+        print(f'{r["print_format"]:<36} {r["customers"]:>9} {r["seconds"]:>9} {r["queries"]:>8}')
@@ -64,6 +64,9 @@ fixtures = [
 # app_include_css = "/assets/surgishop_reports/css/surgishop_reports.css"
 # app_include_js = "/assets/surgishop_reports/js/surgishop_reports.js"
 
+# Background report exports: menu helper and realtime handlers
+app_include_js = "/assets/surgishop_reports/js/report_export.js"
+
 # include js, css files in header of web template
 # web_include_css = "/assets/surgishop_reports/css/surgishop_reports.css"
 # web_include_js = "/assets/surgishop_reports/js/surgishop_reports.js"
@@ -110,11 +113,31 @@ fixtures = [
 #	"filters": "surgishop_reports.utils.jinja_filters"
 # }
 
+jinja = {
+    "methods": [
+        "surgishop_reports.accounts.customer_statement.get_customer_statement",
+        "surgishop_reports.accounts.customer_statement.get_transaction_statement",
+        "surgishop_reports.accounts.customer_statement.get_open_items_statement",
+    ],
+}
+
 # Installation
 # ------------
 
 # before_install = "surgishop_reports.install.before_install"
 # after_install = "surgishop_reports.install.after_install"
+after_install = "surgishop_reports.utils.fixture_sync.after_install"
+
+# Migration
+# ---------
+
+# Fixture files whose content is unchanged are not reimported; report
+# indexes skipped by their patch (custom field not installed yet) are added
+before_migrate = "surgishop_reports.utils.fixture_sync.before_migrate"
+after_migrate = [
+    "surgishop_reports.utils.fixture_sync.after_migrate",
+    "surgishop_reports.utils.indexes.ensure_report_indexes",
+]
 
 # Uninstallation
 # ------------
@@ -152,13 +175,101 @@ fixtures = [
 # ---------------
 # Hook on document methods and events
 
-# doc_events = {
-#	"*": {
-#		"on_update": "method",
-#		"on_cancel": "method",
-#		"on_trash": "method"
-#	}
-# }
+doc_events = {
+    "Sales Invoice": {
+        "on_submit": [
+            "surgishop_reports.selling.sales_person_revenue.on_submit",
+            "surgishop_reports.selling.margin_cube.on_submit",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+        "on_cancel": [
+            "surgishop_reports.selling.sales_person_revenue.on_cancel",
+            "surgishop_reports.selling.margin_cube.on_cancel",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+        "on_update_after_submit": "surgishop_reports.utils.report_cache.evict",
+    },
+    "Item": {
+        "on_update": [
+            "surgishop_reports.stock.availability.invalidate",
+            "surgishop_reports.stock.catalogue.invalidate",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+        "on_trash": [
+            "surgishop_reports.stock.catalogue.invalidate",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+    },
+    "Item Price": {
+        "on_update": "surgishop_reports.stock.catalogue.invalidate",
+        "on_trash": "surgishop_reports.stock.catalogue.invalidate",
+    },
+    "Bin": {
+        "on_update": [
+            "surgishop_reports.stock.availability.invalidate",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+    },
+    "Stock Ledger Entry": {
+        "on_submit": [
+            "surgishop_reports.stock.availability.invalidate",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+        "on_cancel": [
+            "surgishop_reports.stock.availability.invalidate",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+    },
+    "Quotation": {
+        "on_submit": [
+            "surgishop_reports.stock.availability.invalidate",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+        "on_cancel": [
+            "surgishop_reports.stock.availability.invalidate",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+        "on_update_after_submit": [
+            "surgishop_reports.stock.availability.invalidate",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+    },
+    "Sales Order": {
+        "on_submit": [
+            "surgishop_reports.stock.availability.invalidate",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+        "on_cancel": [
+            "surgishop_reports.stock.availability.invalidate",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+        "on_update_after_submit": [
+            "surgishop_reports.stock.availability.invalidate",
+            "surgishop_reports.utils.report_cache.evict",
+        ],
+    },
+    "User": {
+        "on_update": "surgishop_reports.utils.report_cache.evict",
+    },
+    "GL Entry": {
+        "on_submit": "surgishop_reports.accounts.party_balance.on_submit",
+    },
+    "Print Format": {
+        "on_update": "surgishop_reports.utils.pdf_cache.invalidate",
+        "on_trash": "surgishop_reports.utils.pdf_cache.invalidate",
+    },
+}
+
+# Result cache: the doctypes each cached report reads. Writes to them
+# (doc_events above) evict the report's cached results. Products by
+# Specialty is not listed: it reads the catalogue snapshot, which is
+# already cached and refreshed per item.
+report_cache_sources = {
+    "Customer Item Purchase History": ["Sales Invoice"],
+    "Items on Hold": ["Quotation", "Sales Order", "User"],
+    "Stock Status": ["Item", "Bin", "Stock Ledger Entry", "Quotation", "Sales Order"],
+    "Warehouse Stock Status": ["Item", "Bin", "Stock Ledger Entry", "Quotation", "Sales Order"],
+}
 
 # Scheduled Tasks
 # ---------------
@@ -181,6 +292,25 @@ fixtures = [
 #	],
 # }
 
+scheduler_events = {
+    "hourly": [
+        "surgishop_reports.utils.rebuild_queue.run_pending",
+    ],
+    "daily": [
+        "surgishop_reports.selling.margin_cube.rebuild_reposted",
+    ],
+    "cron": {
+        "*/5 * * * *": [
+            "surgishop_reports.accounts.auto_send.enqueue_due_invoices",
+        ],
+    },
+}
+
+# Log retention in days; adjustable in Log Settings
+default_log_clearing_doctypes = {
+    "Report Execution Log": 30,
+}
+
 # Testing
 # -------
 
@@ -192,6 +322,12 @@ fixtures = [
 # override_whitelisted_methods = {
 #	"frappe.desk.doctype.event.event.get_events": "surgishop_reports.event.get_events"
 # }
+
+override_whitelisted_methods = {
+    "frappe.desk.query_report.run": "surgishop_reports.utils.report_runner.run",
+    "frappe.utils.print_format.download_pdf": "surgishop_reports.utils.pdf_cache.download_pdf",
+}
+
 #
 # each overriding function accepts a `data` argument;
 # generated from the base implementation of the doctype dashboard,
@@ -0,0 +1,5 @@
+from surgishop_reports.utils.indexes import ensure_index
+
+
+def execute():
+    ensure_index("Sales Invoice", ["custom_auto_send_status", "custom_actual_send_time"])
@@ -0,0 +1,5 @@
+from surgishop_reports.utils.indexes import ensure_index
+
+
+def execute():
+    ensure_index("Sales Invoice Item", ["delivery_note", "item_code"])
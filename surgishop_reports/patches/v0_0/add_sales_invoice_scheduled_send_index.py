@@ -0,0 +1,5 @@
+from surgishop_reports.utils.indexes import ensure_index
+
+
+def execute():
+    ensure_index("Sales Invoice", ["custom_auto_send_status", "custom_scheduled_send_time"])
@@ -0,0 +1,38 @@
+from frappe.custom.doctype.custom_field.custom_field import create_custom_fields
+
+
+def execute():
+    create_custom_fields(
+        {
+            "Sales Invoice": [
+                {
+                    "fieldname": "custom_send_attempts",
+                    "label": "Send Attempts",
+                    "fieldtype": "Int",
+                    "insert_after": "custom_actual_send_time",
+                    "read_only": 1,
+                    "no_copy": 1,
+                    "allow_on_submit": 1,
+                },
+                {
+                    "fieldname": "custom_next_send_retry",
+                    "label": "Next Send Retry",
+                    "fieldtype": "Datetime",
+                    "insert_after": "custom_send_attempts",
+                    "read_only": 1,
+                    "no_copy": 1,
+                    "allow_on_submit": 1,
+                },
+                {
+                    "fieldname": "custom_send_error",
+                    "label": "Send Error",
+                    "fieldtype": "Small Text",
+                    "insert_after": "custom_next_send_retry",
+                    "read_only": 1,
+                    "no_copy": 1,
+                    "allow_on_submit": 1,
+                },
+            ]
+        },
+        update=True,
+    )
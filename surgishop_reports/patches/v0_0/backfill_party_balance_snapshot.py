@@ -0,0 +1,5 @@
+from surgishop_reports.accounts.party_balance import rebuild
+
+
+def execute():
+    rebuild()
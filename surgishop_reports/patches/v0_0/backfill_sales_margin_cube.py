@@ -0,0 +1,5 @@
+from surgishop_reports.selling.margin_cube import rebuild
+
+
+def execute():
+    rebuild()
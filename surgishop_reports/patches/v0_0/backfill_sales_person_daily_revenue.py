@@ -0,0 +1,5 @@
+from surgishop_reports.selling.sales_person_revenue import rebuild
+
+
+def execute():
+    rebuild()
@@ -0,0 +1,54 @@
+// Copyright (c) 2025, Surgishop
+// License: MIT
+
+// Background exports (utils/export.py): a menu item on the reports that
+// stream their SQL, and the realtime events of the export job.
+
+frappe.provide("surgishop_reports");
+
+surgishop_reports.add_export_menu = function (report) {
+  [
+    ["csv", __("Export in Background (CSV)")],
+    ["xlsx", __("Export in Background (Excel)")],
+  ].forEach(([file_format, label]) => {
+    report.page.add_menu_item(label, () => {
+      const filters = report.get_filter_values(true);
+      if (!filters) return;
+
+      frappe
+        .call("surgishop_reports.utils.export.enqueue_export", {
+          report_name: report.report_name,
+          filters: filters,
+          file_format: file_format,
+        })
+        .then(() => {
+          frappe.show_alert({
+            message: __("{0} export queued, the file opens when it is ready", [__(report.report_name)]),
+            indicator: "blue",
+          });
+        });
+    });
+  });
+};
+
+frappe.realtime.on("report_export_progress", (data) => {
+  frappe.show_alert({
+    message: __("{0}: {1} rows exported", [__(data.report_name), format_number(data.rows, null, 0)]),
+    indicator: "blue",
+  });
+});
+
+frappe.realtime.on("report_export_complete", (data) => {
+  frappe.show_alert(
+    {
+      message: __("{0}: {1} rows exported, <a href='{2}' target='_blank'>download</a>", [
+        __(data.report_name),
+        format_number(data.rows, null, 0),
+        data.file_url,
+      ]),
+      indicator: "green",
+    },
+    15
+  );
+  window.open(data.file_url);
+});
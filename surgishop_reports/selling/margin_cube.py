@@ -0,0 +1,171 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Sales margin cube
+=================
+`tabSales Margin Cube` holds one row per (month, item_code, customer) with
+the SUM of stock qty, revenue (base_net_amount) and COGS (valuation_rate *
+stock_qty) of submitted Sales Invoice Items, so margin by item, customer,
+item group or month is read from hundreds of cube rows instead of every
+invoice line.
+
+Sales Invoice submit/cancel queues a recompute of the invoice's (month,
+customer) rows (utils/rebuild_queue.py), run with `rebuild` after the
+transaction commits; nothing is added as a delta. A Repost Item
+Valuation rewrites valuation_rate without an invoice event, so
+`rebuild_reposted` runs daily and rebuilds from the earliest posting
+date reposted in the last day.
+
+Backfill or repair:
+    bench --site <site> execute surgishop_reports.selling.margin_cube.rebuild
+    bench --site <site> execute surgishop_reports.selling.margin_cube.rebuild --kwargs "{'from_date': '2025-01-01'}"
+    bench --site <site> execute surgishop_reports.selling.margin_cube.rebuild --kwargs "{'from_date': '2025-01-01', 'customer': 'X'}"
+"""
+
+import frappe
+from frappe.utils import add_days, flt, get_first_day, get_last_day, now, now_datetime
+
+from surgishop_reports.utils import rebuild_queue
+from surgishop_reports.utils.query import Conditions
+
+CUBE_DOCTYPE = "Sales Margin Cube"
+
+# group_by mode -> (cube expression, column)
+GROUP_BY = {
+    "Item": (
+        "c.item_code",
+        {"fieldname": "item_code", "label": "Item", "fieldtype": "Link", "options": "Item", "width": 150},
+    ),
+    "Customer": (
+        "c.customer",
+        {"fieldname": "customer", "label": "Customer", "fieldtype": "Link", "options": "Customer", "width": 200},
+    ),
+    "Item Group": (
+        "i.item_group",
+        {"fieldname": "item_group", "label": "Item Group", "fieldtype": "Link", "options": "Item Group", "width": 150},
+    ),
+    "Month": ("c.month", {"fieldname": "month", "label": "Month", "fieldtype": "Date", "width": 110}),
+}
+
+
+def on_submit(doc, method=None):
+    queue_rebuild(doc)
+
+
+def on_cancel(doc, method=None):
+    queue_rebuild(doc)
+
+
+def queue_rebuild(doc):
+    """Recompute the customer's month once the transaction commits"""
+    month = get_first_day(doc.posting_date)
+    rebuild_queue.queue(
+        "surgishop_reports.selling.margin_cube.rebuild",
+        f"{month}::{doc.customer}",
+        month,
+        month,
+        doc.customer,
+    )
+
+
+def rebuild_reposted():
+    """
+    Daily: rebuild from the earliest posting date of the Repost Item
+    Valuations completed in the last day, whose new valuation rates reach
+    Sales Invoice Items without any invoice event.
+    """
+    from_date = frappe.db.sql(
+        """
+        SELECT MIN(posting_date)
+        FROM `tabRepost Item Valuation`
+        WHERE docstatus = 1
+            AND status = 'Completed'
+            AND modified >= %(since)s
+        """,
+        {"since": add_days(now_datetime(), -1)},
+    )[0][0]
+    if from_date:
+        rebuild(from_date)
+
+
+def get_margins(group_by, from_date=None, to_date=None):
+    """
+    Qty, revenue, COGS, profit and GPM per `group_by` key (see GROUP_BY).
+
+    The cube is monthly, so the range is widened to whole months.
+    """
+    expression, column = GROUP_BY[group_by]
+    conditions = Conditions()
+    conditions.date_range(
+        "c.month",
+        get_first_day(from_date) if from_date else None,
+        get_last_day(to_date) if to_date else None,
+    )
+
+    rows = frappe.db.sql(
+        f"""
+        SELECT
+            {expression} AS `{column["fieldname"]}`,
+            SUM(c.qty) AS qty,
+            SUM(c.revenue) AS revenue,
+            SUM(c.cogs) AS cogs
+        FROM `tab{CUBE_DOCTYPE}` c
+        INNER JOIN `tabItem` i ON i.name = c.item_code
+        {conditions.where()}
+        GROUP BY {expression}
+        ORDER BY revenue DESC
+        """,
+        conditions.values,
+        as_dict=True,
+    )
+
+    for row in rows:
+        row.profit = flt(row.revenue) - flt(row.cogs)
+        row.gpm = row.profit / row.revenue * 100 if row.revenue else 0
+
+    return column, rows
+
+
+def rebuild(from_date=None, to_date=None, customer=None):
+    """Recompute the cube from submitted invoices, optionally for whole months of a range and one customer"""
+    from_date = get_first_day(from_date) if from_date else None
+    to_date = get_last_day(to_date) if to_date else None
+
+    cube = Conditions()
+    cube.date_range("month", from_date, to_date)
+    cube.equals("customer", customer)
+    invoices = Conditions()
+    invoices.date_range("si.posting_date", from_date, to_date)
+    invoices.equals("si.customer", customer)
+
+    values = dict(cube.values, **invoices.values, timestamp=now(), user=frappe.session.user)
+
+    frappe.db.sql(f"DELETE FROM `tab{CUBE_DOCTYPE}` {cube.where()}", values)
+
+    frappe.db.sql(
+        f"""
+        INSERT INTO `tab{CUBE_DOCTYPE}`
+            (name, month, item_code, customer, qty, revenue, cogs, creation, modified, owner, modified_by)
+        SELECT
+            CONCAT(month, '::', item_code, '::', customer),
+            month, item_code, customer, SUM(qty), SUM(revenue), SUM(cogs),
+            %(timestamp)s, %(timestamp)s, %(user)s, %(user)s
+        FROM (
+            SELECT
+                si.posting_date - INTERVAL (DAYOFMONTH(si.posting_date) - 1) DAY AS month,
+                sii.item_code,
+                si.customer,
+                sii.stock_qty AS qty,
+                sii.base_net_amount AS revenue,
+                sii.valuation_rate * sii.stock_qty AS cogs
+            FROM `tabSales Invoice` si
+            INNER JOIN `tabSales Invoice Item` sii ON sii.parent = si.name
+            WHERE si.docstatus = 1
+                AND sii.item_code IS NOT NULL
+                {invoices.and_clause()}
+        ) lines
+        GROUP BY month, item_code, customer
+        """,
+        values,
+    )
@@ -2,14 +2,92 @@
 # License: MIT
 
 import frappe
+from frappe.utils import flt
+
+from surgishop_reports.selling.sales_person_revenue import get_revenue_by_person
+
 
 def execute(filters=None):
     """
     Regional Dashboard
-    
-    TODO: Copy the report_script content from the exported JSON
+
+    Revenue and SIL performance against targets for every enabled rep.
     """
-    columns = []
-    data = []
-    
+    if not filters:
+        filters = {}
+    columns = get_columns()
+    data = get_data(filters) or []
     return columns, data
+
+
+def get_columns():
+    return [
+        {"fieldname": "sales_person", "label": "REP", "fieldtype": "Link", "options": "Sales Person", "width": 180},
+        {"fieldname": "total_sales", "label": "Current Account Rev", "fieldtype": "Currency", "width": 150},
+        {"fieldname": "sales_goal", "label": "Account Goal", "fieldtype": "Currency", "width": 130},
+        {"fieldname": "current_sil", "label": "Current SIL", "fieldtype": "Currency", "width": 130},
+        {"fieldname": "sil_goal", "label": "Goal SIL", "fieldtype": "Currency", "width": 130},
+        {"fieldname": "sales_goal_percent", "label": "REV Goal", "fieldtype": "Data", "width": 120},
+        {"fieldname": "sil_goal_percent", "label": "SIL Goal", "fieldtype": "Data", "width": 120},
+    ]
+
+
+def get_data(filters):
+    sales_persons = frappe.get_all(
+        "Sales Person",
+        filters={"enabled": 1},
+        order_by="name asc",
+        pluck="name",
+    )
+
+    if not sales_persons:
+        return []
+
+    # Goals and revenue for all reps in two grouped queries, joined in memory below.
+    # Revenue comes from the daily rollup, so its cost is independent of invoice volume.
+    targets = get_targets(sales_persons)
+    revenue = get_revenue_by_person(filters.get("from_date"), filters.get("to_date"))
+
+    data = []
+    for sales_person_name in sales_persons:
+        sales_goal, sil_goal = targets.get(sales_person_name, (0, 0))
+        rep_revenue = revenue.get(sales_person_name) or {}
+        total_sales = flt(rep_revenue.get("total_sales"))
+        current_sil = flt(rep_revenue.get("current_sil"))
+
+        sales_goal_percent = f"{round((flt(total_sales) / flt(sales_goal) * 100), 2)}%" if sales_goal > 0 else "0%"
+        sil_goal_percent = f"{round((flt(current_sil) / flt(sil_goal) * 100), 2)}%" if sil_goal > 0 else "0%"
+
+        data.append(
+            {
+                "sales_person": sales_person_name,
+                "total_sales": total_sales,
+                "sales_goal": sales_goal,
+                "current_sil": current_sil,
+                "sil_goal": sil_goal,
+                "sales_goal_percent": sales_goal_percent,
+                "sil_goal_percent": sil_goal_percent,
+            }
+        )
+
+    return data
+
+
+def get_targets(sales_persons):
+    """Return {sales_person: (sales_goal, sil_goal)} from Target Detail"""
+    rows = frappe.db.sql(
+        """
+        SELECT
+            parent as sales_person,
+            SUM(CASE WHEN item_group = 'Products' THEN target_amount ELSE 0 END) as sales_goal,
+            SUM(CASE WHEN item_group = 'SIL' THEN target_amount ELSE 0 END) as sil_goal
+        FROM `tabTarget Detail`
+        WHERE parent IN %(sales_persons)s
+        GROUP BY parent
+        """,
+        {"sales_persons": tuple(sales_persons)},
+        as_dict=1,
+    )
+
+    return {r.sales_person: (flt(r.sales_goal), flt(r.sil_goal)) for r in rows}
+
@@ -0,0 +1,33 @@
+// Copyright (c) 2025, Surgishop
+// License: MIT
+
+frappe.query_reports["Temp Report"] = {
+  filters: [
+    {
+      fieldname: "from_date",
+      label: __("From Date"),
+      fieldtype: "Date",
+      default: frappe.datetime.month_start(),
+      reqd: 1,
+    },
+    {
+      fieldname: "to_date",
+      label: __("To Date"),
+      fieldtype: "Date",
+      default: frappe.datetime.get_today(),
+      reqd: 1,
+    },
+    {
+      fieldname: "group_by",
+      label: __("Group By"),
+      fieldtype: "Select",
+      options: "Invoice Line\nItem\nCustomer\nItem Group\nMonth",
+      default: "Invoice Line",
+      description: __("Grouped modes read the monthly margin cube and cover whole months"),
+    },
+  ],
+
+  onload(report) {
+    surgishop_reports.add_export_menu(report);
+  },
+};
@@ -0,0 +1,76 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import frappe
+
+from surgishop_reports.selling.margin_cube import get_margins
+
+INVOICE_LINE = "Invoice Line"
+
+
+def execute(filters=None):
+    """
+    GPM (Temp Report)
+
+    Revenue, COGS, profit and GPM of submitted Sales Invoices. "Invoice
+    Line" lists every Sales Invoice Item; the other modes group the
+    Sales Margin Cube by item, customer, item group or month, for whole
+    months of the range.
+    """
+    filters = frappe._dict(filters or {})
+    group_by = filters.get("group_by") or INVOICE_LINE
+
+    if group_by == INVOICE_LINE:
+        query, values = get_export_query(filters)
+        data = frappe.db.sql(query, values, as_dict=True)
+        return get_columns(), data
+
+    column, data = get_margins(group_by, filters.get("from_date"), filters.get("to_date"))
+    return [column] + get_amount_columns(), data
+
+
+def get_export_query(filters):
+    """One row per Sales Invoice Item, also used by utils.export"""
+    return (
+        """
+        SELECT
+            si.posting_date AS posting_date,
+            si.name AS invoice,
+            sii.item_code AS item_code,
+            sii.qty AS qty,
+            sii.base_net_amount AS revenue,
+            (sii.valuation_rate * sii.stock_qty) AS cogs,
+            (sii.base_net_amount - (sii.valuation_rate * sii.stock_qty)) AS profit,
+            CASE WHEN sii.base_net_amount != 0 THEN
+                ((sii.base_net_amount - (sii.valuation_rate * sii.stock_qty)) / sii.base_net_amount) * 100
+            ELSE
+                0
+            END AS gpm
+        FROM `tabSales Invoice` si
+        INNER JOIN `tabSales Invoice Item` sii ON sii.parent = si.name
+        WHERE si.docstatus = 1
+            AND si.posting_date BETWEEN %(from_date)s AND %(to_date)s
+        ORDER BY si.posting_date DESC
+        """,
+        {"from_date": filters.get("from_date"), "to_date": filters.get("to_date")},
+    )
+
+
+def get_columns():
+    """Invoice Line columns, also the header of utils.export"""
+    return [
+        {"fieldname": "posting_date", "label": "Date", "fieldtype": "Date", "width": 100},
+        {"fieldname": "invoice", "label": "Invoice", "fieldtype": "Link", "options": "Sales Invoice", "width": 150},
+        {"fieldname": "item_code", "label": "Item", "fieldtype": "Link", "options": "Item", "width": 120},
+        {"fieldname": "qty", "label": "Qty", "fieldtype": "Float", "width": 80},
+    ] + get_amount_columns()[1:]
+
+
+def get_amount_columns():
+    return [
+        {"fieldname": "qty", "label": "Qty (Stock UOM)", "fieldtype": "Float", "width": 120},
+        {"fieldname": "revenue", "label": "Revenue", "fieldtype": "Currency", "width": 120},
+        {"fieldname": "cogs", "label": "COGS", "fieldtype": "Currency", "width": 120},
+        {"fieldname": "profit", "label": "Profit", "fieldtype": "Currency", "width": 120},
+        {"fieldname": "gpm", "label": "GPM", "fieldtype": "Percent", "width": 100},
+    ]
@@ -0,0 +1,129 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Per-sales-person daily revenue rollup
+=====================================
+`tabSales Person Daily Revenue` holds one row per (sales_person,
+posting_date, bucket), where bucket is "Invoice Total" (SUM of
+si.grand_total) or "SIL" (SUM of sii.amount for SIL items), so
+dashboards can answer any date range by summing daily rows instead of
+scanning invoice history.
+
+Sales Invoice submit/cancel queues a recompute of the invoice's day
+(utils/rebuild_queue.py), run with `rebuild` after the transaction
+commits. Nothing is added as a delta, so rewritten invoices and changed
+item groups cannot drift the rollup past the next rebuild of their day.
+
+Backfill or repair:
+    bench --site <site> execute surgishop_reports.selling.sales_person_revenue.rebuild
+    bench --site <site> execute surgishop_reports.selling.sales_person_revenue.rebuild --kwargs "{'from_date': '2025-01-01'}"
+"""
+
+import frappe
+from frappe.utils import getdate, now
+
+from surgishop_reports.utils import rebuild_queue
+from surgishop_reports.utils.query import Conditions
+
+ROLLUP_DOCTYPE = "Sales Person Daily Revenue"
+INVOICE_TOTAL = "Invoice Total"
+SIL = "SIL"
+
+
+def on_submit(doc, method=None):
+    queue_rebuild(doc)
+
+
+def on_cancel(doc, method=None):
+    queue_rebuild(doc)
+
+
+def queue_rebuild(doc):
+    """Recompute the invoice's day once the transaction commits"""
+    if not any(d.sales_person for d in doc.get("sales_team") or []):
+        return
+
+    posting_date = getdate(doc.posting_date)
+    rebuild_queue.queue(
+        "surgishop_reports.selling.sales_person_revenue.rebuild", posting_date, posting_date, posting_date
+    )
+
+
+def get_revenue_by_person(from_date=None, to_date=None):
+    """Return {sales_person: {"total_sales": x, "current_sil": y}} for the range"""
+    conditions = Conditions(invoice_total=INVOICE_TOTAL, sil=SIL)
+    conditions.date_range("posting_date", from_date, to_date)
+
+    rows = frappe.db.sql(
+        f"""
+        SELECT
+            sales_person,
+            SUM(CASE WHEN bucket = %(invoice_total)s THEN amount ELSE 0 END) as total_sales,
+            SUM(CASE WHEN bucket = %(sil)s THEN amount ELSE 0 END) as current_sil
+        FROM `tab{ROLLUP_DOCTYPE}`
+        {conditions.where()}
+        GROUP BY sales_person
+        """,
+        conditions.values,
+        as_dict=1,
+    )
+
+    return {r.sales_person: r for r in rows}
+
+
+def rebuild(from_date=None, to_date=None):
+    """Recompute the rollup from submitted invoices, optionally for a date range"""
+    rollup = Conditions()
+    rollup.date_range("posting_date", from_date, to_date)
+    invoices = Conditions()
+    invoices.date_range("si.posting_date", from_date, to_date)
+
+    values = dict(
+        rollup.values,
+        invoice_total=INVOICE_TOTAL,
+        sil=SIL,
+        timestamp=now(),
+        user=frappe.session.user,
+    )
+
+    frappe.db.sql(f"DELETE FROM `tab{ROLLUP_DOCTYPE}` {rollup.where()}", values)
+
+    frappe.db.sql(
+        f"""
+        INSERT INTO `tab{ROLLUP_DOCTYPE}`
+            (name, sales_person, posting_date, bucket, amount, creation, modified, owner, modified_by)
+        SELECT
+            CONCAT(st.sales_person, '::', si.posting_date, '::', %(invoice_total)s),
+            st.sales_person, si.posting_date, %(invoice_total)s, SUM(si.grand_total),
+            %(timestamp)s, %(timestamp)s, %(user)s, %(user)s
+        FROM `tabSales Invoice` si
+        INNER JOIN `tabSales Team` st ON st.parent = si.name
+        WHERE si.docstatus = 1
+            AND st.sales_person IS NOT NULL
+            {invoices.and_clause()}
+        GROUP BY st.sales_person, si.posting_date
+        """,
+        values,
+    )
+
+    frappe.db.sql(
+        f"""
+        INSERT INTO `tab{ROLLUP_DOCTYPE}`
+            (name, sales_person, posting_date, bucket, amount, creation, modified, owner, modified_by)
+        SELECT
+            CONCAT(st.sales_person, '::', si.posting_date, '::', %(sil)s),
+            st.sales_person, si.posting_date, %(sil)s, SUM(sii.amount),
+            %(timestamp)s, %(timestamp)s, %(user)s, %(user)s
+        FROM `tabSales Invoice` si
+        INNER JOIN `tabSales Team` st ON st.parent = si.name
+        INNER JOIN `tabSales Invoice Item` sii ON sii.parent = si.name
+        INNER JOIN `tabItem` item ON item.name = sii.item_code
+        WHERE si.docstatus = 1
+            AND item.item_group = %(sil)s
+            AND st.sales_person IS NOT NULL
+            {invoices.and_clause()}
+        GROUP BY st.sales_person, si.posting_date
+        """,
+        values,
+    )
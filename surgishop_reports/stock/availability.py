@@ -0,0 +1,227 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Item availability engine
+========================
+Computes on-shelf, quoted, ordered, blemish and available quantities per
+item for Stock Status and Warehouse Stock Status.
+
+All four sources are read in one grouped pass and the result is kept in
+the Redis cache for the day. Document events mark changed items as dirty
+and the next refresh recomputes only those items. Status changes that
+ERPNext writes with db_set (e.g. a Quotation declared Lost) do not fire
+document events, so the cached table also expires after CACHE_TTL seconds
+as a safety net.
+
+Items are marked dirty after the transaction commits, and refreshes are
+serialized with a Redis lock so each one starts from the table the
+previous one wrote.
+"""
+
+import frappe
+from frappe.utils import flt, nowdate
+
+STORES_WAREHOUSE = "Stores - SURGI"
+BLEMISH_WAREHOUSE = "Blemish - SURGI"
+
+CACHE_KEY = "surgishop_reports:item_availability"
+DIRTY_KEY = "surgishop_reports:item_availability_dirty"
+LOCK_KEY = "surgishop_reports:item_availability_lock"
+CACHE_TTL = 60 * 60
+
+# Seconds a refresh may hold the lock, and wait for it
+LOCK_TIMEOUT = 120
+
+LOCATION_FIELDS = [
+    "custom_item_location",
+    "custom_item_location_2",
+    "custom_item_location_3",
+    "custom_item_location_4",
+    "custom_item_location_5",
+    "custom_item_location_6",
+]
+
+
+def get_availability(item_code=None):
+    """Return availability rows sorted by item code, refreshing dirty items first"""
+    rows = get_cached_rows()
+
+    if item_code:
+        row = rows.get(item_code)
+        return [row] if row else []
+
+    return [rows[key] for key in sorted(rows)]
+
+
+def get_cached_rows():
+    cache = frappe.cache()
+    today = nowdate()
+    cached = cache.get_value(CACHE_KEY)
+    if cached and cached.get("date") == today and not cache.hkeys(DIRTY_KEY):
+        return cached["rows"]
+
+    # One refresh at a time: concurrent refreshes would each write the whole
+    # table back and drop the other's items
+    with cache.lock(cache.make_key(LOCK_KEY), timeout=LOCK_TIMEOUT, blocking_timeout=LOCK_TIMEOUT):
+        # expires=True reads Redis, not this request's memoized copy
+        cached = cache.get_value(CACHE_KEY, expires=True)
+        dirty = pop_dirty_items()
+        try:
+            if not cached or cached.get("date") != today:
+                # Anything dirtied before a full build is covered by it
+                rows = {row.item_code: row for row in compute()}
+            elif dirty:
+                rows = refresh(cached["rows"], dirty)
+            else:
+                # Refreshed by another process while this one waited
+                return cached["rows"]
+        except Exception:
+            mark_dirty(dirty)
+            raise
+
+        cache.set_value(CACHE_KEY, {"date": today, "rows": rows}, expires_in_sec=CACHE_TTL)
+
+    return rows
+
+
+def refresh(rows, item_codes):
+    """Replace the rows of `item_codes` with freshly computed ones"""
+    fresh = {row.item_code: row for row in compute(item_codes)}
+    for item_code in item_codes:
+        if item_code in fresh:
+            rows[item_code] = fresh[item_code]
+        else:
+            rows.pop(item_code, None)
+    return rows
+
+
+def compute(item_codes=None):
+    """
+    Read Bin, open Quotations and open Sales Orders once, grouped by item.
+
+    Only enabled items with a non-zero quantity in any bucket are returned.
+    """
+    values = {
+        "stores": STORES_WAREHOUSE,
+        "blemish": BLEMISH_WAREHOUSE,
+        "today": nowdate(),
+    }
+    bin_condition = quotation_condition = order_condition = ""
+    if item_codes:
+        values["item_codes"] = tuple(item_codes)
+        bin_condition = "AND item_code IN %(item_codes)s"
+        quotation_condition = "AND qi.item_code IN %(item_codes)s"
+        order_condition = "AND soi.item_code IN %(item_codes)s"
+
+    location_columns = ", ".join(f"i.{field}" for field in LOCATION_FIELDS)
+
+    rows = frappe.db.sql(
+        f"""
+        SELECT
+            qty.item_code,
+            i.brand,
+            i.custom_competitive,
+            i.custom_approval_only,
+            i.custom_temperature_critical,
+            {location_columns},
+            qty.on_shelves,
+            qty.in_open_quotations,
+            qty.in_sales_orders,
+            qty.blemish
+        FROM (
+            SELECT
+                src.item_code,
+                SUM(src.on_shelves) AS on_shelves,
+                SUM(src.in_open_quotations) AS in_open_quotations,
+                SUM(src.in_sales_orders) AS in_sales_orders,
+                SUM(src.blemish) AS blemish
+            FROM (
+                SELECT
+                    item_code,
+                    IF(warehouse = %(stores)s, actual_qty, 0) AS on_shelves,
+                    0 AS in_open_quotations,
+                    0 AS in_sales_orders,
+                    IF(warehouse = %(blemish)s, actual_qty, 0) AS blemish
+                FROM `tabBin`
+                WHERE warehouse IN (%(stores)s, %(blemish)s)
+                    {bin_condition}
+
+                UNION ALL
+
+                SELECT qi.item_code, 0, qi.stock_qty, 0, 0
+                FROM `tabQuotation Item` qi
+                INNER JOIN `tabQuotation` q
+                    ON q.name = qi.parent
+                    AND q.docstatus = 1
+                    AND q.status = 'Open'
+                    AND (q.valid_till IS NULL OR q.valid_till >= %(today)s)
+                WHERE 1 = 1
+                    {quotation_condition}
+
+                UNION ALL
+
+                SELECT soi.item_code, 0, 0, soi.stock_qty, 0
+                FROM `tabSales Order Item` soi
+                INNER JOIN `tabSales Order` so
+                    ON so.name = soi.parent
+                    AND so.docstatus = 1
+                    AND so.status NOT IN ('Closed', 'Completed')
+                WHERE 1 = 1
+                    {order_condition}
+            ) src
+            GROUP BY src.item_code
+            HAVING on_shelves <> 0
+                OR in_open_quotations <> 0
+                OR in_sales_orders <> 0
+                OR blemish <> 0
+        ) qty
+        INNER JOIN `tabItem` i ON i.name = qty.item_code
+        WHERE IFNULL(i.disabled, 0) = 0
+        """,
+        values,
+        as_dict=1,
+    )
+
+    for row in rows:
+        row.on_shelves = flt(row.on_shelves)
+        row.in_open_quotations = flt(row.in_open_quotations)
+        row.in_sales_orders = flt(row.in_sales_orders)
+        row.blemish = flt(row.blemish)
+        row.available = row.on_shelves - row.in_open_quotations - row.in_sales_orders
+        row.location = ", ".join(row.get(field) for field in LOCATION_FIELDS if row.get(field))
+
+    return rows
+
+
+def invalidate(doc, method=None):
+    """doc_events handler: mark the items touched by `doc` as dirty"""
+    item_codes = set()
+    if doc.get("item_code"):
+        item_codes.add(doc.item_code)
+    for row in doc.get("items") or []:
+        if row.get("item_code"):
+            item_codes.add(row.item_code)
+
+    # Only once committed: a refresh before that would read the old rows
+    # and keep them until the next change or CACHE_TTL
+    frappe.db.after_commit.add(lambda: mark_dirty(item_codes))
+
+
+def mark_dirty(item_codes):
+    cache = frappe.cache()
+    for item_code in item_codes:
+        cache.hset(DIRTY_KEY, item_code, 1)
+
+
+def pop_dirty_items():
+    cache = frappe.cache()
+    item_codes = [frappe.safe_decode(key) for key in cache.hkeys(DIRTY_KEY)]
+    for item_code in item_codes:
+        cache.hdel(DIRTY_KEY, item_code)
+    return item_codes
+
+
+def clear_cache():
+    frappe.cache().delete_value(CACHE_KEY)
+    frappe.cache().delete_value(DIRTY_KEY)
@@ -0,0 +1,218 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Price catalogue snapshot
+========================
+Enabled items with their Standard Selling rate, grouped by specialty
+(Item.custom_item_category). Products by Specialty reads its rows from
+here; API clients that poll `get_price_catalogue` also get conditional
+responses. The desk report always returns its rows, since a query
+report run has no way to answer "not modified".
+
+The snapshot lives in the Redis cache with a content hash (ETag) per
+category. Item and Item Price events mark items as dirty; the next read
+recomputes only those items and the ETags of the categories they left or
+joined. Unchanged categories keep their ETag, so a client that sends it
+back gets `not_modified` instead of the rows. Writes that skip document
+events are picked up when the snapshot expires after CACHE_TTL seconds.
+
+Items are marked dirty after the transaction commits, and refreshes are
+serialized with a Redis lock so each one starts from the snapshot the
+previous one wrote.
+"""
+
+import hashlib
+import json
+
+import frappe
+from frappe.utils import flt, strip_html
+
+from surgishop_reports.utils.query import Conditions
+
+PRICE_LIST = "Standard Selling"
+
+CACHE_KEY = "surgishop_reports:price_catalogue"
+DIRTY_KEY = "surgishop_reports:price_catalogue_dirty"
+LOCK_KEY = "surgishop_reports:price_catalogue_lock"
+CACHE_TTL = 24 * 60 * 60
+
+# Seconds a refresh may hold the lock, and wait for it
+LOCK_TIMEOUT = 120
+
+# Descriptions are cut to a one-line summary for the list
+DESCRIPTION_LENGTH = 140
+
+
+def get_catalogue(category=None):
+    """Return (etag, rows) for one category, or for all of them, sorted by item code"""
+    snapshot = get_snapshot()
+    if category:
+        return snapshot["etags"].get(category, get_etag([])), snapshot["categories"].get(category, [])
+
+    etags = snapshot["etags"]
+    rows = sorted(
+        (row for rows in snapshot["categories"].values() for row in rows),
+        key=lambda row: (row.item_code, row.price),
+    )
+    etag = hashlib.sha1(json.dumps(sorted(etags.items())).encode()).hexdigest()
+    return etag, rows
+
+
+@frappe.whitelist()
+def get_price_catalogue(category=None, etag=None):
+    """
+    Conditional read of one category (or all): rows and ETag, or only
+    `not_modified` when `etag` is still current.
+    """
+    frappe.has_permission("Item Price", "read", throw=True)
+
+    current, rows = get_catalogue(category)
+    if etag and etag == current:
+        return {"etag": current, "not_modified": True}
+    return {"etag": current, "rows": rows}
+
+
+def get_snapshot():
+    cache = frappe.cache()
+    snapshot = cache.get_value(CACHE_KEY)
+    if snapshot and not cache.hkeys(DIRTY_KEY):
+        return snapshot
+
+    # One refresh at a time: concurrent refreshes would each write the whole
+    # snapshot back and drop the other's items
+    with cache.lock(cache.make_key(LOCK_KEY), timeout=LOCK_TIMEOUT, blocking_timeout=LOCK_TIMEOUT):
+        # expires=True reads Redis, not this request's memoized copy
+        snapshot = cache.get_value(CACHE_KEY, expires=True)
+        dirty = pop_dirty_items()
+        try:
+            if not snapshot:
+                # Anything dirtied before a full build is covered by it
+                snapshot = build_snapshot(compute())
+            elif dirty:
+                snapshot = refresh(snapshot, dirty)
+            else:
+                # Refreshed by another process while this one waited
+                return snapshot
+        except Exception:
+            mark_dirty(dirty)
+            raise
+
+        cache.set_value(CACHE_KEY, snapshot, expires_in_sec=CACHE_TTL)
+
+    return snapshot
+
+
+def build_snapshot(rows):
+    categories = {}
+    for row in rows:
+        categories.setdefault(row.category, []).append(row)
+    return {
+        "categories": categories,
+        "etags": {category: get_etag(category_rows) for category, category_rows in categories.items()},
+    }
+
+
+def refresh(snapshot, item_codes):
+    """Replace the rows of `item_codes` and re-hash only the categories touched"""
+    dirty = set(item_codes)
+    fresh = compute(item_codes)
+    categories = snapshot["categories"]
+
+    touched = {row.category for row in fresh}
+    for category, rows in categories.items():
+        kept = [row for row in rows if row.item_code not in dirty]
+        if len(kept) != len(rows):
+            categories[category] = kept
+            touched.add(category)
+
+    for row in fresh:
+        categories.setdefault(row.category, []).append(row)
+
+    for category in touched:
+        rows = sorted(categories.get(category, []), key=lambda row: (row.item_code, row.price))
+        if rows:
+            categories[category] = rows
+            snapshot["etags"][category] = get_etag(rows)
+        else:
+            categories.pop(category, None)
+            snapshot["etags"].pop(category, None)
+
+    return snapshot
+
+
+def compute(item_codes=None):
+    """Enabled items that have a Standard Selling price, one row per price"""
+    conditions = Conditions("i.disabled = 0")
+    conditions.is_in("i.name", item_codes, key="item_codes")
+
+    rows = frappe.db.sql(
+        f"""
+        SELECT
+            i.name AS item_code,
+            i.custom_item_category AS category,
+            i.description,
+            ip.name AS price,
+            ip.price_list_rate AS rate
+        FROM `tabItem` i
+        INNER JOIN `tabItem Price` ip
+            ON ip.item_code = i.name
+            AND ip.price_list = %(price_list)s
+        {conditions.where()}
+        ORDER BY i.name, ip.name
+        """,
+        dict(conditions.values, price_list=PRICE_LIST),
+        as_dict=True,
+    )
+
+    for row in rows:
+        row.category = row.category or ""
+        row.description = get_summary(row.description)
+        row.rate = flt(row.rate)
+
+    return rows
+
+
+def get_summary(description):
+    text = " ".join(strip_html(description or "").split())
+    if len(text) > DESCRIPTION_LENGTH:
+        text = text[: DESCRIPTION_LENGTH - 1].rstrip() + "…"
+    return text
+
+
+def get_etag(rows):
+    payload = json.dumps([[row.item_code, row.description, row.rate] for row in rows], default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def invalidate(doc, method=None):
+    """doc_events handler for Item and Item Price"""
+    if doc.doctype == "Item":
+        item_codes = {doc.name}
+    else:
+        # A price moved to another item leaves a stale row on the old one
+        before = doc.get_doc_before_save()
+        item_codes = {doc.item_code, before.item_code if before else None}
+
+    # Only once committed: a refresh before that would read the old prices
+    # and keep them until the next change or CACHE_TTL
+    frappe.db.after_commit.add(lambda: mark_dirty(item_codes))
+
+
+def mark_dirty(item_codes):
+    cache = frappe.cache()
+    for item_code in item_codes:
+        if item_code:
+            cache.hset(DIRTY_KEY, item_code, 1)
+
+
+def pop_dirty_items():
+    cache = frappe.cache()
+    item_codes = [frappe.safe_decode(key) for key in cache.hkeys(DIRTY_KEY)]
+    for item_code in item_codes:
+        cache.hdel(DIRTY_KEY, item_code)
+    return item_codes
+
+
+def clear_cache():
+    frappe.cache().delete_value(CACHE_KEY)
@@ -0,0 +1,101 @@
+// Copyright (c) 2025, Surgishop
+// License: MIT
+
+frappe.query_reports["Item Tracking Report"] = {
+  filters: [
+    {
+      fieldname: "item_code",
+      label: __("Item"),
+      fieldtype: "Link",
+      options: "Item",
+      on_change: () => {
+        // A new item starts again from the newest history
+        frappe.query_report.set_filter_value({ inbound_before: "", outbound_before: "" });
+      },
+    },
+    {
+      fieldname: "item_codes",
+      label: __("Items"),
+      fieldtype: "MultiSelectList",
+      get_data: (txt) => frappe.db.get_link_options("Item", txt),
+    },
+    {
+      fieldname: "brand",
+      label: __("Brand"),
+      fieldtype: "Link",
+      options: "Brand",
+    },
+    {
+      fieldname: "item_group",
+      label: __("Item Group"),
+      fieldtype: "Link",
+      options: "Item Group",
+    },
+    {
+      fieldname: "from_date",
+      label: __("From Date"),
+      fieldtype: "Date",
+    },
+    {
+      fieldname: "to_date",
+      label: __("To Date"),
+      fieldtype: "Date",
+    },
+    {
+      fieldname: "page_length",
+      label: __("Rows per Section"),
+      fieldtype: "Int",
+      default: 50,
+    },
+    {
+      fieldname: "inbound_before",
+      label: __("Inbound Older Than"),
+      fieldtype: "Data",
+      hidden: 1,
+    },
+    {
+      fieldname: "outbound_before",
+      label: __("Outbound Older Than"),
+      fieldtype: "Data",
+      hidden: 1,
+    },
+  ],
+
+  onload(report) {
+    // Values travel in escaped data-* attributes, never in inline script
+    report.page.main
+      .off("click", ".item-tracking-load-older")
+      .on("click", ".item-tracking-load-older", function () {
+        const link = $(this);
+        frappe.query_reports["Item Tracking Report"].load_older(
+          link.attr("data-item-code"),
+          link.attr("data-cursor-filter"),
+          link.attr("data-cursor")
+        );
+      });
+  },
+
+  formatter(value, row, column, data, default_formatter) {
+    // "Older history" marker rows carry the keyset cursor for the next page
+    if (data && data.cursor_filter) {
+      if (column.fieldname === "row_type") {
+        const escape = frappe.utils.escape_html;
+        return `<a class="item-tracking-load-older"
+          data-item-code="${escape(data.item_code)}"
+          data-cursor-filter="${escape(data.cursor_filter)}"
+          data-cursor="${escape(data.notes)}">
+          ${__("Load older history")} &rarr;</a>`;
+      }
+      return "";
+    }
+    return default_formatter(value, row, column, data);
+  },
+
+  load_older(item_code, cursor_filter, cursor) {
+    // Paging is per item, so narrow a batch view down to the chosen item first
+    const values = { item_codes: [], brand: "", item_group: "", inbound_before: "", outbound_before: "" };
+    values.item_code = item_code;
+    values[cursor_filter] = cursor;
+    frappe.query_report.set_filter_value(values);
+  },
+};
@@ -2,14 +2,382 @@
 # License: MIT
 
 import frappe
+from frappe.utils import cint
+
+from surgishop_reports.utils.query import Conditions
+
+DEFAULT_PAGE_LENGTH = 50
+
 
 def execute(filters=None):
     """
     Item Tracking Report
-    
-    TODO: Copy the report_script content from the exported JSON
+
+    Stock position plus inbound (Purchase Receipt) and outbound (Delivery
+    Note) history for one item, a list of items, a brand or an item group.
+    Everything is fetched with three statements however many items are
+    selected: item summaries, inbound history and outbound history.
+
+    History is read newest-first, `page_length` rows per item and section.
+    For a single item, older pages load through keyset pagination on
+    (posting_date, document name); the "inbound_before"/"outbound_before"
+    filters carry the cursor.
     """
-    columns = []
+    columns = get_columns()
     data = []
-    
+
+    # ------------------------------
+    # Validate filter
+    # ------------------------------
+    filters = frappe._dict(filters or {})
+    selection, values = get_item_selection(filters)
+    if not selection:
+        return columns, data
+
+    items = get_item_summaries(selection, values)
+    if not items:
+        return columns, data
+
+    item_codes = [item.item_code for item in items]
+    page_length = cint(filters.get("page_length")) or DEFAULT_PAGE_LENGTH
+    # Cursors only make sense when a single item is on screen
+    paged = len(item_codes) == 1
+
+    inbound = get_inbound(item_codes, filters, page_length, paged)
+    outbound = get_outbound(item_codes, filters, page_length, paged)
+
+    for item in items:
+        if data:
+            # Spacer between items
+            data.append(empty_row())
+        data.extend(
+            get_item_section(item, inbound.get(item.item_code, []), outbound.get(item.item_code, []), page_length)
+        )
+
     return columns, data
+
+
+def get_columns():
+    return [
+        {"fieldname": "row_type", "label": "Type", "fieldtype": "Data", "width": 120},
+        {"fieldname": "date", "label": "Date", "fieldtype": "Date", "width": 100},
+        {"fieldname": "document", "label": "Document", "fieldtype": "Data", "width": 150},
+        {"fieldname": "qty", "label": "Qty", "fieldtype": "Float", "width": 80},
+        {"fieldname": "party", "label": "Supplier/Customer", "fieldtype": "Data", "width": 180},
+        {"fieldname": "reference", "label": "Invoice/PO #", "fieldtype": "Data", "width": 150},
+        {"fieldname": "stock", "label": "Stock", "fieldtype": "Float", "width": 80},
+        {"fieldname": "on_quote", "label": "On Quote", "fieldtype": "Float", "width": 80},
+        {"fieldname": "on_so", "label": "On Sales Order", "fieldtype": "Float", "width": 100},
+        {"fieldname": "notes", "label": "Notes", "fieldtype": "Data", "width": 200},
+    ]
+
+
+def get_item_section(item, inbound, outbound, page_length):
+    data = []
+
+    # ------------------------------
+    # ITEM HEADER ROW
+    # ------------------------------
+    row = empty_row()
+    row.update({
+        "row_type": f"<b>ITEM: {item.item_code}</b>",
+        "document": f"<b>{item.item_name}</b>",
+        "stock": item.stock_qty,
+        "on_quote": item.quote_qty,
+        "on_so": item.so_qty
+    })
+    data.append(row)
+
+    # Spacer
+    data.append(empty_row())
+
+    # ------------------------------
+    # INBOUND HISTORY
+    # ------------------------------
+    row = empty_row()
+    row["row_type"] = "<b>INBOUND HISTORY</b>"
+    data.append(row)
+
+    inbound, inbound_cursor = paginate(inbound, page_length)
+
+    if inbound:
+        for r in inbound:
+            row = empty_row()
+            row.update({
+                "row_type": "Inbound",
+                "date": r.posting_date,
+                "document": f'<a href="/app/purchase-receipt/{r.name}">{r.name}</a>',
+                "qty": r.qty,
+                "party": r.supplier,
+                "reference": r.purchase_order or "",
+                "notes": r.remarks or ""
+            })
+            data.append(row)
+        if inbound_cursor:
+            data.append(more_row("inbound_before", inbound_cursor, item.item_code))
+    else:
+        row = empty_row()
+        row["row_type"] = "No inbound history"
+        data.append(row)
+
+    # Spacer
+    data.append(empty_row())
+
+    # ------------------------------
+    # OUTBOUND HISTORY
+    # ------------------------------
+    row = empty_row()
+    row["row_type"] = "<b>OUTBOUND HISTORY</b>"
+    data.append(row)
+
+    outbound, outbound_cursor = paginate(outbound, page_length)
+
+    if outbound:
+        for d in outbound:
+            row = empty_row()
+            row.update({
+                "row_type": "Outbound",
+                "date": d.posting_date,
+                "document": f'<a href="/app/delivery-note/{d.name}">{d.name}</a>',
+                "qty": d.qty,
+                "party": d.customer,
+                "reference": d.against_sales_invoice or "",
+                "notes": d.lr_no or ""
+            })
+            data.append(row)
+        if outbound_cursor:
+            data.append(more_row("outbound_before", outbound_cursor, item.item_code))
+    else:
+        row = empty_row()
+        row["row_type"] = "No outbound history"
+        data.append(row)
+
+    return data
+
+
+def empty_row():
+    return {
+        "row_type": "",
+        "date": "",
+        "document": "",
+        "qty": "",
+        "party": "",
+        "reference": "",
+        "stock": "",
+        "on_quote": "",
+        "on_so": "",
+        "notes": ""
+    }
+
+
+def more_row(cursor_filter, cursor, item_code):
+    """Marker row; the report's formatter turns it into a "load older" link"""
+    row = empty_row()
+    row.update({
+        "row_type": "Older history",
+        "notes": cursor,
+        "cursor_filter": cursor_filter,
+        "item_code": item_code,
+    })
+    return row
+
+
+def get_item_selection(filters):
+    """
+    WHERE clause on `tabItem` i for the selected items.
+
+    Explicit items (item_code plus item_codes) take precedence; otherwise
+    the enabled items of the brand and/or item group are selected.
+    """
+    item_codes = frappe.parse_json(filters.get("item_codes") or "[]")
+    if filters.get("item_code"):
+        item_codes = [filters.get("item_code")] + [d for d in item_codes if d != filters.get("item_code")]
+
+    if item_codes:
+        return "i.item_code IN %(item_codes)s", {"item_codes": tuple(item_codes)}
+
+    conditions = Conditions()
+    conditions.equals("i.brand", filters.get("brand"))
+    conditions.equals("i.item_group", filters.get("item_group"))
+
+    if not conditions.conditions:
+        return None, conditions.values
+
+    conditions.add("IFNULL(i.disabled, 0) = 0")
+    return " AND ".join(conditions.conditions), conditions.values
+
+
+def get_item_summaries(selection, values):
+    """Item names with Bin stock, open quote qty and open SO qty, in one statement"""
+    return frappe.db.sql(
+        f"""
+        SELECT
+            i.item_code,
+            i.item_name,
+            COALESCE(qty.stock_qty, 0) AS stock_qty,
+            COALESCE(qty.quote_qty, 0) AS quote_qty,
+            COALESCE(qty.so_qty, 0) AS so_qty
+        FROM `tabItem` i
+        LEFT JOIN (
+            SELECT
+                src.item_code,
+                SUM(src.stock_qty) AS stock_qty,
+                SUM(src.quote_qty) AS quote_qty,
+                SUM(src.so_qty) AS so_qty
+            FROM (
+                SELECT b.item_code, b.actual_qty AS stock_qty, 0 AS quote_qty, 0 AS so_qty
+                FROM `tabBin` b
+                WHERE b.item_code IN (SELECT i.name FROM `tabItem` i WHERE {selection})
+
+                UNION ALL
+
+                SELECT qi.item_code, 0, qi.qty, 0
+                FROM `tabQuotation Item` qi
+                INNER JOIN `tabQuotation` q ON q.name = qi.parent
+                WHERE qi.item_code IN (SELECT i.name FROM `tabItem` i WHERE {selection})
+                  AND q.docstatus = 0 AND q.status != 'Lost'
+
+                UNION ALL
+
+                SELECT soi.item_code, 0, 0, soi.qty - soi.delivered_qty
+                FROM `tabSales Order Item` soi
+                INNER JOIN `tabSales Order` so ON so.name = soi.parent
+                WHERE soi.item_code IN (SELECT i.name FROM `tabItem` i WHERE {selection})
+                  AND so.docstatus = 1
+                  AND so.status NOT IN ('Completed','Closed')
+                  AND soi.qty > soi.delivered_qty
+            ) src
+            GROUP BY src.item_code
+        ) qty ON qty.item_code = i.item_code
+        WHERE {selection}
+        ORDER BY i.item_code
+        """,
+        values,
+        as_dict=True
+    )
+
+
+def get_inbound(item_codes, filters, page_length, paged):
+    """Return {item_code: rows}, at most page_length + 1 rows per item"""
+    conditions, values = get_window_conditions(
+        "pr", "pri", filters, filters.get("inbound_before") if paged else None
+    )
+    values.update({"item_codes": tuple(item_codes), "limit": page_length + 1})
+
+    return get_history(
+        """
+        SELECT pri.item_code, pr.name, pr.posting_date, pr.supplier, pri.qty, pri.purchase_order,
+               pr.remarks, pri.name AS row_name
+        """,
+        f"""
+        FROM `tabPurchase Receipt Item` pri
+        INNER JOIN `tabPurchase Receipt` pr ON pr.name = pri.parent
+        WHERE pri.item_code IN %(item_codes)s AND pr.docstatus = 1
+            {conditions}
+        """,
+        "pri.item_code",
+        "pr.posting_date DESC, pr.name DESC, pri.name DESC",
+        values,
+        batch=len(item_codes) > 1,
+    )
+
+
+def get_outbound(item_codes, filters, page_length, paged):
+    """Return {item_code: rows}, at most page_length + 1 rows per item"""
+    conditions, values = get_window_conditions(
+        "dn", "dni", filters, filters.get("outbound_before") if paged else None
+    )
+    values.update({"item_codes": tuple(item_codes), "limit": page_length + 1})
+
+    return get_history(
+        """
+        SELECT dni.item_code, dn.name, dn.posting_date, dn.customer, dni.qty,
+               dni.against_sales_invoice, dn.lr_no, dni.name AS row_name
+        """,
+        f"""
+        FROM `tabDelivery Note Item` dni
+        INNER JOIN `tabDelivery Note` dn ON dn.name = dni.parent
+        WHERE dni.item_code IN %(item_codes)s AND dn.docstatus = 1
+            {conditions}
+        """,
+        "dni.item_code",
+        "dn.posting_date DESC, dn.name DESC, dni.name DESC",
+        values,
+        batch=len(item_codes) > 1,
+    )
+
+
+def get_history(select, source, item_column, order_by, values, batch=False):
+    """
+    Newest %(limit)s rows per item. One item is a plain ORDER BY ... LIMIT,
+    which stops after the first page; only a batch needs ROW_NUMBER() per
+    item, which numbers each item's whole history.
+    """
+    if not batch:
+        rows = frappe.db.sql(
+            f"{select} {source} ORDER BY {order_by} LIMIT %(limit)s",
+            values,
+            as_dict=True
+        )
+        return group_by_item(rows)
+
+    rows = frappe.db.sql(
+        f"""
+        SELECT * FROM (
+            {select},
+                ROW_NUMBER() OVER (PARTITION BY {item_column} ORDER BY {order_by}) AS row_num
+            {source}
+        ) history
+        WHERE row_num <= %(limit)s
+        ORDER BY item_code, row_num
+        """,
+        values,
+        as_dict=True
+    )
+    return group_by_item(rows)
+
+
+def group_by_item(rows):
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(row.item_code, []).append(row)
+    return grouped
+
+
+def get_window_conditions(parent, child, filters, cursor):
+    """Date window plus keyset condition for rows older than `cursor`"""
+    conditions = Conditions()
+    conditions.date_range(f"{parent}.posting_date", filters.get("from_date"), filters.get("to_date"))
+
+    if cursor:
+        cursor_date, cursor_name, cursor_row = parse_cursor(cursor)
+        conditions.add(
+            f"""(
+                {parent}.posting_date < %(cursor_date)s
+                OR ({parent}.posting_date = %(cursor_date)s AND {parent}.name < %(cursor_name)s)
+                OR ({parent}.posting_date = %(cursor_date)s AND {parent}.name = %(cursor_name)s
+                    AND {child}.name < %(cursor_row)s)
+            )""",
+            cursor_date=cursor_date,
+            cursor_name=cursor_name,
+            cursor_row=cursor_row,
+        )
+
+    return conditions.and_clause(), conditions.values
+
+
+def paginate(rows, page_length):
+    """Trim the look-ahead row and return (page, cursor of the last row or None)"""
+    if len(rows) <= page_length:
+        return rows, None
+
+    rows = rows[:page_length]
+    last = rows[-1]
+    return rows, f"{last.posting_date}|{last.name}|{last.row_name}"
+
+
+def parse_cursor(cursor):
+    parts = cursor.split("|")
+    if len(parts) != 3:
+        frappe.throw(f"Invalid history cursor: {cursor}")
+    return parts
@@ -0,0 +1,67 @@
+// Copyright (c) 2025, Surgishop
+// License: MIT
+
+const SHIPPING_STATUS_COLORS = {
+  Picking: { color: "#856404", background: "#fff3cd" },
+  Shipped: { color: "#155724", background: "#d4edda" },
+  Unknown: { color: "#721c24", background: "#f8d7da" },
+};
+
+frappe.query_reports["Outbound Shipping Status Report"] = {
+  filters: [
+    {
+      fieldname: "from_date",
+      label: __("From Date"),
+      fieldtype: "Date",
+      default: frappe.datetime.get_today(),
+      on_change: () => frappe.query_report.set_filter_value("before", ""),
+    },
+    {
+      fieldname: "to_date",
+      label: __("To Date"),
+      fieldtype: "Date",
+      default: frappe.datetime.get_today(),
+      on_change: () => frappe.query_report.set_filter_value("before", ""),
+    },
+    {
+      fieldname: "page_length",
+      label: __("Rows per Page"),
+      fieldtype: "Int",
+      default: 100,
+    },
+    {
+      fieldname: "before",
+      label: __("Older Than"),
+      fieldtype: "Data",
+      hidden: 1,
+    },
+  ],
+
+  formatter(value, row, column, data, default_formatter) {
+    // "Older" marker row carries the keyset cursor for the next page
+    if (data && data.cursor) {
+      if (column.fieldname === "delivery_note") {
+        return `<a onclick="frappe.query_report.set_filter_value('before', '${data.cursor}')">
+          ${__("Load older")} &rarr;</a>`;
+      }
+      return "";
+    }
+
+    if (column.fieldname === "delivery_note" && data) {
+      // Link with the naming series prefix removed
+      value = `<a href="/app/delivery-note/${encodeURIComponent(data.delivery_note)}">${frappe.utils.escape_html(
+        (data.delivery_note || "").replace("MAT-DN-", "")
+      )}</a>`;
+    } else if (column.fieldname === "shipping_status" && data) {
+      const colors = SHIPPING_STATUS_COLORS[data.shipping_status] || SHIPPING_STATUS_COLORS.Unknown;
+      value = `<span style="display:inline-block;padding:4px 10px;border-radius:6px;font-weight:bold;color:${colors.color};background-color:${colors.background};">${__(data.shipping_status)}</span>`;
+    } else {
+      value = default_formatter(value, row, column, data);
+    }
+
+    // Zebra striping
+    const rowIndex = row && row[0] ? row[0].rowIndex : 0;
+    const background = rowIndex % 2 ? "#f2f2f2" : "white";
+    return `<div style="text-align:left;background-color:${background};">${value}</div>`;
+  },
+};
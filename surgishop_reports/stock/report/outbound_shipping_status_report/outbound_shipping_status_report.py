@@ -0,0 +1,147 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import frappe
+from frappe.utils import cint
+
+from surgishop_reports.utils.query import Conditions
+
+DEFAULT_PAGE_LENGTH = 100
+
+SHIPPING_STATUS = {0: "Picking", 1: "Shipped"}
+
+
+def execute(filters=None):
+    """
+    Outbound Shipping Status Report
+
+    Delivery Notes in the date window, newest first, with the sales reps of
+    the Sales Order each one was made against. Values are returned raw; the
+    report's formatter adds links, striping and the status badge.
+
+    Pages of `page_length` notes are read with keyset pagination on
+    (posting_date, name); the hidden "before" filter carries the cursor.
+    """
+    columns = get_columns()
+
+    filters = frappe._dict(filters or {})
+    page_length = cint(filters.get("page_length")) or DEFAULT_PAGE_LENGTH
+
+    delivery_notes = get_delivery_notes(filters, page_length)
+    cursor = None
+    if len(delivery_notes) > page_length:
+        delivery_notes = delivery_notes[:page_length]
+        last = delivery_notes[-1]
+        cursor = f"{last.posting_date}|{last.name}"
+
+    sales_reps = get_sales_reps([dn.name for dn in delivery_notes])
+
+    data = []
+    for dn in delivery_notes:
+        data.append(
+            {
+                "delivery_note": dn.name,
+                "customer": dn.customer,
+                "shipping_rule": dn.shipping_rule,
+                "billing": dn.custom_custom_shipping,
+                "custom_customer_freight_acct": dn.custom_customer_freight_acct,
+                "sales_rep": sales_reps.get(dn.name, ""),
+                "notes": dn.custom_order_product_attributes,
+                "shipping_status": SHIPPING_STATUS.get(dn.docstatus, "Unknown"),
+            }
+        )
+
+    if cursor:
+        # Marker row; the formatter turns it into a "load older" link
+        data.append({"cursor": cursor})
+
+    return columns, data
+
+
+def get_columns():
+    return [
+        {"fieldname": "delivery_note", "label": "Delivery Note", "fieldtype": "Link", "options": "Delivery Note", "width": 150},
+        {"fieldname": "customer", "label": "Customer", "fieldtype": "Data", "width": 180},
+        {"fieldname": "shipping_rule", "label": "Speed", "fieldtype": "Data", "width": 120},
+        {"fieldname": "billing", "label": "Billing", "fieldtype": "Data", "width": 120},
+        {"fieldname": "custom_customer_freight_acct", "label": "Customer Freight Acct", "fieldtype": "Data", "width": 175},
+        {"fieldname": "sales_rep", "label": "Sales Rep", "fieldtype": "Data", "width": 150},
+        {"fieldname": "notes", "label": "Notes", "fieldtype": "Data", "width": 200},
+        {"fieldname": "shipping_status", "label": "Shipping Status", "fieldtype": "Data", "width": 100},
+    ]
+
+
+def get_delivery_notes(filters, page_length):
+    """One page of Delivery Notes plus one look-ahead row"""
+    conditions = Conditions(limit=page_length + 1)
+    conditions.date_range("dn.posting_date", filters.get("from_date"), filters.get("to_date"))
+
+    if filters.get("before"):
+        cursor_date, cursor_name = parse_cursor(filters.get("before"))
+        conditions.add(
+            """(
+                dn.posting_date < %(cursor_date)s
+                OR (dn.posting_date = %(cursor_date)s AND dn.name < %(cursor_name)s)
+            )""",
+            cursor_date=cursor_date,
+            cursor_name=cursor_name,
+        )
+
+    return frappe.db.sql(
+        f"""
+        SELECT
+            dn.name,
+            dn.posting_date,
+            dn.customer,
+            dn.shipping_rule,
+            dn.custom_custom_shipping,
+            dn.custom_customer_freight_acct,
+            dn.custom_order_product_attributes,
+            dn.docstatus
+        FROM `tabDelivery Note` dn
+        {conditions.where()}
+        ORDER BY dn.posting_date DESC, dn.name DESC
+        LIMIT %(limit)s
+        """,
+        conditions.values,
+        as_dict=True,
+    )
+
+
+def get_sales_reps(delivery_notes):
+    """
+    Return {delivery_note: "rep, rep"} from the Sales Team of the Sales
+    Order on each note's first linked line, in one grouped statement.
+    """
+    if not delivery_notes:
+        return {}
+
+    rows = frappe.db.sql(
+        """
+        SELECT
+            first_so.delivery_note,
+            GROUP_CONCAT(DISTINCT st.sales_person SEPARATOR ', ') AS sales_rep
+        FROM (
+            SELECT
+                dni.parent AS delivery_note,
+                SUBSTRING_INDEX(GROUP_CONCAT(dni.against_sales_order ORDER BY dni.idx), ',', 1) AS sales_order
+            FROM `tabDelivery Note Item` dni
+            WHERE dni.parent IN %(delivery_notes)s
+                AND IFNULL(dni.against_sales_order, '') != ''
+            GROUP BY dni.parent
+        ) first_so
+        INNER JOIN `tabSales Team` st
+            ON st.parent = first_so.sales_order
+            AND st.parenttype = 'Sales Order'
+        GROUP BY first_so.delivery_note
+        """,
+        {"delivery_notes": tuple(delivery_notes)},
+    )
+    return dict(rows)
+
+
+def parse_cursor(cursor):
+    parts = cursor.split("|")
+    if len(parts) != 2:
+        frappe.throw(f"Invalid page cursor: {cursor}")
+    return parts
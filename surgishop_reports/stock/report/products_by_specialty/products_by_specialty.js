@@ -0,0 +1,14 @@
+// Copyright (c) 2025, Surgishop
+// License: MIT
+
+frappe.query_reports["Products by Specialty"] = {
+  filters: [
+    {
+      fieldname: "custom_item_category",
+      label: __("Specialty"),
+      fieldtype: "Select",
+      reqd: 1,
+      options: "Hemostat / Wound Care\nVascular\nENT\nOrthopedic\nEndomechanical\nSpecialty\nGYN/Urology\nMesh\nSpine / Neurology\nRobotics\nOrthopedicSpine / NeurologyEndomechnical\nOrthopedicSpine / Neurology\nMechEndomechanical\nHemostat / Wound CareSpine / Neurology\nHemostat / Wound CareOrthopedicSpine /Neurology\nGYN/Urology Mesh\nGYN/UrologyEndomechnical\nENT Vascular",
+    },
+  ],
+};
@@ -0,0 +1,30 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import frappe
+
+from surgishop_reports.stock.catalogue import get_catalogue
+
+
+def execute(filters=None):
+    """
+    Products by Specialty
+
+    Enabled items of the chosen specialty with their Standard Selling rate,
+    read from the catalogue snapshot in stock/catalogue.py instead of
+    querying Item and Item Price on every run. The snapshot is the only
+    cache: the report is not in report_cache_sources.
+    """
+    filters = frappe._dict(filters or {})
+    rows = get_catalogue(filters.get("custom_item_category"))[1]
+
+    data = [{"item_code": row.item_code, "description": row.description, "rate": row.rate} for row in rows]
+    return get_columns(), data
+
+
+def get_columns():
+    return [
+        {"fieldname": "item_code", "label": "Item", "fieldtype": "Link", "options": "Item", "width": 150},
+        {"fieldname": "description", "label": "Description", "fieldtype": "Data", "width": 450},
+        {"fieldname": "rate", "label": "Rate", "fieldtype": "Currency", "width": 120},
+    ]
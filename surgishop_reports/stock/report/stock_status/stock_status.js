@@ -0,0 +1,40 @@
+// Copyright (c) 2025, Surgishop
+// License: MIT
+
+frappe.query_reports["Stock Status"] = {
+  formatter(value, row, column, data, default_formatter) {
+    const colKey = (column.fieldname || "").toLowerCase();
+
+    // --- Handle currency columns (blank if 0/null) ---
+    if (["competitive", "approval_only"].includes(colKey)) {
+      const raw = data?.[column.fieldname] ?? value;
+      const n = Number(raw);
+      if (raw === null || raw === undefined || raw === "" || isNaN(n) || n === 0) {
+        value = "";
+      } else {
+        value = default_formatter(raw, row, column, data);
+      }
+    } else {
+      value = default_formatter(value, row, column, data);
+    }
+
+    // --- Center all columns except first two (Brand + Item Code) ---
+    const colIdx =
+      typeof column.colIndex === "number"
+        ? column.colIndex
+        : (column.id && column.id.match(/col-(\d+)/))
+        ? parseInt(column.id.match(/col-(\d+)/)[1])
+        : null;
+
+    const isFirstTwo =
+      colIdx !== null
+        ? colIdx <= 1
+        : ["brand", "item_code"].includes(colKey);
+
+    if (!isFirstTwo) {
+      return `<div style="text-align:center">${value}</div>`;
+    }
+
+    return value; // leave first two columns default-aligned
+  }
+};
@@ -0,0 +1,47 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+from surgishop_reports.stock.availability import get_availability
+
+
+def execute(filters=None):
+    """
+    Stock Status
+
+    Available = On Shelves ('Stores - SURGI') - Open Quotations - Sales Orders
+    """
+    columns = get_columns()
+    data = []
+
+    for row in get_availability():
+        data.append(
+            {
+                "brand": row.brand,
+                "item_code": row.item_code,
+                "available": row.available,
+                "on_shelves": row.on_shelves,
+                "in_open_quotations": row.in_open_quotations,
+                "in_sales_orders": row.in_sales_orders,
+                "competitive": row.custom_competitive or None,
+                "approval_only": row.custom_approval_only or None,
+                "blemish": row.blemish,
+                "temperature": "✓" if row.custom_temperature_critical else "",
+            }
+        )
+
+    return columns, data
+
+
+def get_columns():
+    return [
+        {"fieldname": "brand", "label": "Brand", "fieldtype": "Link", "options": "Brand", "width": 120},
+        {"fieldname": "item_code", "label": "Item Code", "fieldtype": "Link", "options": "Item", "width": 150},
+        {"fieldname": "available", "label": "Available", "fieldtype": "Int", "width": 150},
+        {"fieldname": "on_shelves", "label": "On Shelves", "fieldtype": "Int", "width": 100},
+        {"fieldname": "in_open_quotations", "label": "In Open Quotations", "fieldtype": "Int", "width": 120},
+        {"fieldname": "in_sales_orders", "label": "In Sales Orders", "fieldtype": "Int", "width": 120},
+        {"fieldname": "competitive", "label": "Competitive", "fieldtype": "Currency", "width": 120},
+        {"fieldname": "approval_only", "label": "Approval Only", "fieldtype": "Currency", "width": 120},
+        {"fieldname": "blemish", "label": "Blemish", "fieldtype": "Int", "width": 100},
+        {"fieldname": "temperature", "label": "Temperature", "fieldtype": "Data", "width": 100},
+    ]
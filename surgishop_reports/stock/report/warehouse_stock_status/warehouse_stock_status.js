@@ -0,0 +1,36 @@
+// Copyright (c) 2025, Surgishop
+// License: MIT
+
+frappe.query_reports["Warehouse Stock Status"] = {
+  filters: [
+    {
+      fieldname: "item_code",
+      label: __("Item"),
+      fieldtype: "Link",
+      options: "Item",
+      default: "1951B",
+    },
+  ],
+
+  formatter(value, row, column, data, default_formatter) {
+    const colKey = (column.fieldname || "").toLowerCase();
+    
+    value = default_formatter(value, row, column, data);
+    
+    // --- Center all columns except first two (Brand + Item Code) ---
+    const colIdx =
+      typeof column.colIndex === "number"
+        ? column.colIndex
+        : (column.id && column.id.match(/col-(\d+)/))
+        ? parseInt(column.id.match(/col-(\d+)/)[1])
+        : null;
+    const isFirstTwo =
+      colIdx !== null
+        ? colIdx <= 1
+        : ["brand", "item_code"].includes(colKey);
+    if (!isFirstTwo) {
+      return `<div style="text-align:center">${value}</div>`;
+    }
+    return value; // leave first two columns default-aligned
+  }
+};
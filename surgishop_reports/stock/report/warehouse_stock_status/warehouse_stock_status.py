@@ -0,0 +1,46 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+from surgishop_reports.stock.availability import get_availability
+
+
+def execute(filters=None):
+    """
+    Warehouse Stock Status
+
+    Stock Status with the item's shelf locations, optionally for one item.
+    """
+    filters = filters or {}
+    columns = get_columns()
+    data = []
+
+    for row in get_availability(filters.get("item_code")):
+        data.append(
+            {
+                "brand": row.brand,
+                "item_code": row.item_code,
+                "location": row.location,
+                "available": row.available,
+                "on_shelves": row.on_shelves,
+                "in_open_quotations": row.in_open_quotations,
+                "in_sales_orders": row.in_sales_orders,
+                "blemish": row.blemish,
+                "temperature": "✓" if row.custom_temperature_critical else "",
+            }
+        )
+
+    return columns, data
+
+
+def get_columns():
+    return [
+        {"fieldname": "brand", "label": "Brand", "fieldtype": "Link", "options": "Brand", "width": 120},
+        {"fieldname": "item_code", "label": "Item Code", "fieldtype": "Link", "options": "Item", "width": 150},
+        {"fieldname": "location", "label": "Location", "fieldtype": "Data", "width": 200},
+        {"fieldname": "available", "label": "Available", "fieldtype": "Int", "width": 150},
+        {"fieldname": "on_shelves", "label": "On Shelves", "fieldtype": "Int", "width": 100},
+        {"fieldname": "in_open_quotations", "label": "In Open Quotations", "fieldtype": "Int", "width": 120},
+        {"fieldname": "in_sales_orders", "label": "In Sales Orders", "fieldtype": "Int", "width": 120},
+        {"fieldname": "blemish", "label": "Blemish", "fieldtype": "Int", "width": 100},
+        {"fieldname": "temperature", "label": "Temperature", "fieldtype": "Data", "width": 100},
+    ]
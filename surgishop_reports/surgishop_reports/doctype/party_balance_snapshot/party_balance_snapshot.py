@@ -0,0 +1,13 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import frappe
+from frappe.model.document import Document
+
+
+class PartyBalanceSnapshot(Document):
+    pass
+
+
+def on_doctype_update():
+    frappe.db.add_index("Party Balance Snapshot", ["party_type", "party", "month"])
@@ -0,0 +1,19 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import frappe
+from frappe.model.document import Document
+from frappe.query_builder import Interval
+from frappe.query_builder.functions import Now
+
+
+class ReportExecutionLog(Document):
+    @staticmethod
+    def clear_old_logs(days=30):
+        """Called by Log Settings; retention is set there (default_log_clearing_doctypes)"""
+        table = frappe.qb.DocType("Report Execution Log")
+        frappe.db.delete(table, filters=(table.creation < (Now() - Interval(days=days))))
+
+
+def on_doctype_update():
+    frappe.db.add_index("Report Execution Log", ["report", "creation"])
@@ -0,0 +1,14 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import frappe
+from frappe.model.document import Document
+
+
+class SalesMarginCube(Document):
+    pass
+
+
+def on_doctype_update():
+    frappe.db.add_index("Sales Margin Cube", ["month", "item_code"])
+    frappe.db.add_index("Sales Margin Cube", ["month", "customer"])
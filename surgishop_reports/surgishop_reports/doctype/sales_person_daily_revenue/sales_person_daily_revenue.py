@@ -0,0 +1,13 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import frappe
+from frappe.model.document import Document
+
+
+class SalesPersonDailyRevenue(Document):
+    pass
+
+
+def on_doctype_update():
+    frappe.db.add_index("Sales Person Daily Revenue", ["posting_date", "sales_person"])
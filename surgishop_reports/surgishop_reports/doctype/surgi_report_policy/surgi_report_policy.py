@@ -0,0 +1,8 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+from frappe.model.document import Document
+
+
+class SurgiReportPolicy(Document):
+    pass
@@ -0,0 +1,14 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import frappe
+from frappe.model.document import Document
+
+
+class SurgiReportSettings(Document):
+    def validate(self):
+        seen = set()
+        for policy in self.policies:
+            if policy.report in seen:
+                frappe.throw(f"Row {policy.idx}: {policy.report} already has a policy")
+            seen.add(policy.report)
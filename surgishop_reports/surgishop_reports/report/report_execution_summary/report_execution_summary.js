@@ -0,0 +1,25 @@
+// Copyright (c) 2025, Surgishop
+// License: MIT
+
+frappe.query_reports["Report Execution Summary"] = {
+  filters: [
+    {
+      fieldname: "from_date",
+      label: __("From Date"),
+      fieldtype: "Date",
+      default: frappe.datetime.add_days(frappe.datetime.get_today(), -7),
+    },
+    {
+      fieldname: "to_date",
+      label: __("To Date"),
+      fieldtype: "Date",
+      default: frappe.datetime.get_today(),
+    },
+    {
+      fieldname: "report",
+      label: __("Report"),
+      fieldtype: "Link",
+      options: "Report",
+    },
+  ],
+};
@@ -0,0 +1,87 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import math
+
+import frappe
+from frappe.utils import flt
+
+from surgishop_reports.utils.query import Conditions
+
+
+def execute(filters=None):
+    """
+    Report Execution Summary
+
+    One row per report from Report Execution Log: wall time percentiles
+    and the average SQL count, SQL time, rows and payload per run, from
+    the sampled rows only (slow runs are always logged, so including the
+    rest would skew the distribution towards the slow tail). Slow runs
+    and the maximum count every logged row. Slowest p95 first.
+    """
+    filters = frappe._dict(filters or {})
+    columns = get_columns()
+
+    conditions = Conditions()
+    conditions.datetime_range("creation", filters.get("from_date"), filters.get("to_date"))
+    conditions.equals("report", filters.get("report"))
+
+    runs = {}
+    for row in frappe.db.sql(
+        f"""
+        SELECT report, wall_time, sql_count, sql_time, row_count, payload_bytes, sampled, slow
+        FROM `tabReport Execution Log`
+        {conditions.where()}
+        ORDER BY report, wall_time
+        """,
+        conditions.values,
+        as_dict=True,
+        as_iterator=True,
+    ):
+        runs.setdefault(row.report, []).append(row)
+
+    data = []
+    for report_name, logged in runs.items():
+        # Rows arrive sorted by wall_time within each report
+        rows = [row for row in logged if row.sampled]
+        count = len(rows)
+        summary = {
+            "report": report_name,
+            "runs": count,
+            "slow_runs": sum(1 for row in logged if row.slow),
+            "max": flt(logged[-1].wall_time),
+        }
+        if count:
+            wall_times = [flt(row.wall_time) for row in rows]
+            summary.update(
+                p50=percentile(wall_times, 50),
+                p95=percentile(wall_times, 95),
+                sql_count=sum(row.sql_count for row in rows) / count,
+                sql_time=sum(flt(row.sql_time) for row in rows) / count,
+                row_count=sum(row.row_count for row in rows) / count,
+                payload_kb=sum(row.payload_bytes for row in rows) / count / 1024,
+            )
+        data.append(summary)
+
+    data.sort(key=lambda row: row.get("p95") or 0, reverse=True)
+    return columns, data
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an ascending list"""
+    return sorted_values[max(math.ceil(p / 100 * len(sorted_values)) - 1, 0)]
+
+
+def get_columns():
+    return [
+        {"fieldname": "report", "label": "Report", "fieldtype": "Link", "options": "Report", "width": 220},
+        {"fieldname": "runs", "label": "Sampled Runs", "fieldtype": "Int", "width": 110},
+        {"fieldname": "slow_runs", "label": "Slow Runs", "fieldtype": "Int", "width": 100},
+        {"fieldname": "p50", "label": "p50 (s)", "fieldtype": "Float", "precision": 3, "width": 100},
+        {"fieldname": "p95", "label": "p95 (s)", "fieldtype": "Float", "precision": 3, "width": 100},
+        {"fieldname": "max", "label": "Max (s)", "fieldtype": "Float", "precision": 3, "width": 100},
+        {"fieldname": "sql_count", "label": "Avg SQL Statements", "fieldtype": "Float", "precision": 1, "width": 150},
+        {"fieldname": "sql_time", "label": "Avg SQL Time (s)", "fieldtype": "Float", "precision": 3, "width": 140},
+        {"fieldname": "row_count", "label": "Avg Rows", "fieldtype": "Float", "precision": 0, "width": 100},
+        {"fieldname": "payload_kb", "label": "Avg Payload (KB)", "fieldtype": "Float", "precision": 1, "width": 140},
+    ]
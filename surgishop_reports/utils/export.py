@@ -0,0 +1,214 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Streaming report export
+=======================
+Exports the SQL of a query-based report (Temp Report, ...) or of a
+Script Report that defines get_export_query(filters) (Surgi General
+Ledger) to CSV or XLSX in a background job, for exports too large for
+the desk's in-memory download.
+
+A Script Report can also define:
+
+- get_columns(): the header is taken from its labels, in its order,
+  instead of the SQL aliases.
+- transform_export_rows(filters, rows): a generator over the streamed
+  rows, for rows the report adds or computes in Python (the ledger's
+  opening row, running balance and closing row). Queries it needs must
+  run before it iterates `rows`: the stream holds the connection.
+
+Rows are read through an unbuffered (server-side) cursor and written to
+a file under private/files/report_exports/ as they arrive: CSV with the
+csv module, XLSX with openpyxl's write-only workbook. Peak memory does
+not grow with the row count. The finished file is attached as a private
+File and the user gets a `report_export_complete` realtime event with
+its URL.
+
+Temp Report and Surgi General Ledger have "Export in Background" menu
+items; public/js/report_export.js queues the job, shows the
+`report_export_progress` counts and opens the file when it is done.
+
+Usage (desk console):
+    frappe.call("surgishop_reports.utils.export.enqueue_export",
+        {report_name: "Temp Report", filters: {...}, file_format: "xlsx"})
+"""
+
+import csv
+import os
+
+import frappe
+from frappe.modules import get_report_module_dotted_path
+from frappe.utils import now_datetime
+
+EXPORTS_FOLDER = "report_exports"
+FILE_FORMATS = ("csv", "xlsx")
+
+# Rows between progress updates
+PROGRESS_EVERY = 10000
+
+
+@frappe.whitelist()
+def enqueue_export(report_name, filters=None, file_format="csv"):
+    """Queue an export of the report with these filters; returns the job id"""
+    if file_format not in FILE_FORMATS:
+        frappe.throw(f"Unknown export format {file_format}, expected csv or xlsx")
+
+    report = frappe.get_doc("Report", report_name)
+    if not report.is_permitted():
+        frappe.throw(f"Not permitted to export {report_name}", frappe.PermissionError)
+    if not get_query(report, {})[0]:
+        frappe.throw(f"{report_name} has no SQL query to stream")
+
+    filters = frappe.parse_json(filters) if filters else {}
+    job_id = f"report_export::{frappe.session.user}::{report_name}::{frappe.generate_hash(length=8)}"
+    frappe.enqueue(
+        "surgishop_reports.utils.export.run_export",
+        queue="long",
+        timeout=2 * 60 * 60,
+        job_id=job_id,
+        report_name=report_name,
+        filters=filters,
+        file_format=file_format,
+        user=frappe.session.user,
+    )
+    return job_id
+
+
+def run_export(report_name, filters, file_format="csv", user=None):
+    user = user or frappe.session.user
+    report = frappe.get_doc("Report", report_name)
+    query, values = get_query(report, filters)
+
+    file_name = f"{frappe.scrub(report_name)}-{now_datetime().strftime('%Y%m%d-%H%M%S')}.{file_format}"
+    folder = frappe.get_site_path("private", "files", EXPORTS_FOLDER)
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, file_name)
+
+    write = write_xlsx if file_format == "xlsx" else write_csv
+    with frappe.db.unbuffered_cursor():
+        rows = get_rows(report, filters, query, values)
+        count = write(path, report_name, rows, get_columns(report), user)
+
+    file_doc = frappe.get_doc(
+        {
+            "doctype": "File",
+            "file_name": file_name,
+            "file_url": f"/private/files/{EXPORTS_FOLDER}/{file_name}",
+            "is_private": 1,
+            "attached_to_doctype": "Report",
+            "attached_to_name": report_name,
+        }
+    )
+    file_doc.owner = user
+    file_doc.insert(ignore_permissions=True)
+    frappe.db.commit()
+
+    frappe.publish_realtime(
+        "report_export_complete",
+        {"report_name": report_name, "file_url": file_doc.file_url, "rows": count},
+        user=user,
+    )
+    return file_doc.file_url
+
+
+def get_query(report, filters):
+    """
+    (sql, values) to stream: a Script Report's get_export_query(filters),
+    or the report's own SQL with every declared filter bound (None when
+    not given). (None, None) when the report has neither.
+    """
+    module = get_report_module(report)
+    if module:
+        if not hasattr(module, "get_export_query"):
+            return None, None
+        return module.get_export_query(frappe._dict(filters or {}))
+
+    if not report.query:
+        return None, None
+
+    values = {f.fieldname: None for f in report.filters}
+    values.update({key: value for key, value in (filters or {}).items() if value not in ("", [])})
+    return report.query.strip().rstrip(";"), values
+
+
+def get_report_module(report):
+    """The Python module of a Script Report, None for query reports"""
+    if report.report_type != "Script Report":
+        return None
+    return frappe.get_module(get_report_module_dotted_path(report.module, report.name))
+
+
+def get_rows(report, filters, query, values):
+    """The streamed rows, through the report's transform_export_rows if it has one"""
+    rows = stream_rows(query, values)
+    module = get_report_module(report)
+    if module and hasattr(module, "transform_export_rows"):
+        rows = module.transform_export_rows(frappe._dict(filters or {}), rows)
+    return rows
+
+
+def stream_rows(query, values):
+    # A generator, so the query only runs at the first row, after whatever
+    # the transform reads up front
+    yield from frappe.db.sql(query, values, as_dict=True, as_iterator=True)
+
+
+def get_columns(report):
+    """[(fieldname, label)] from the Script Report's get_columns(), or None"""
+    module = get_report_module(report)
+    if not (module and hasattr(module, "get_columns")):
+        return None
+    return [(column["fieldname"], column.get("label") or column["fieldname"]) for column in module.get_columns()]
+
+
+def get_layout(columns, row):
+    """
+    (fields, header): the report's columns, or the first row's keys with
+    labels from the 'Label:Type:Width' aliases of a query report
+    """
+    if columns:
+        return [fieldname for fieldname, _label in columns], [label for _fieldname, label in columns]
+    return list(row), [key.split(":", 1)[0] for key in row]
+
+
+def write_csv(path, report_name, rows, columns, user):
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        for row in rows:
+            if not count:
+                fields, header = get_layout(columns, row)
+                writer.writerow(header)
+            writer.writerow([row.get(field) for field in fields])
+            count += 1
+            if not count % PROGRESS_EVERY:
+                publish_progress(report_name, count, user)
+    return count
+
+
+def write_xlsx(path, report_name, rows, columns, user):
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(report_name[:31])
+    count = 0
+    for row in rows:
+        if not count:
+            fields, header = get_layout(columns, row)
+            sheet.append(header)
+        sheet.append([row.get(field) for field in fields])
+        count += 1
+        if not count % PROGRESS_EVERY:
+            publish_progress(report_name, count, user)
+
+    workbook.save(path)
+    return count
+
+
+def publish_progress(report_name, count, user):
+    frappe.publish_realtime(
+        "report_export_progress",
+        {"report_name": report_name, "rows": count},
+        user=user,
+    )
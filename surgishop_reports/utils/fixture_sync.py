@@ -0,0 +1,153 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Fixture sync
+============
+The Reports and Print Formats listed in the `fixtures` hook ship as
+standard JSON files under <module>/report/ and <module>/print_format/.
+On migrate Frappe reimports and re-saves such a file whenever its
+`modified` is newer than the database row, and every export from the
+source site bumps `modified` even when nothing else changed. For the
+~250 KB Print Designer formats that is a full re-validation per site.
+
+Each file is hashed without its `modified` (sorted-key JSON, SHA-256)
+and the hashes of the last sync are stored in a global default:
+
+- before_migrate: a document whose hash is unchanged gets the file's
+  `modified` written to its row, so Frappe's own sync sees it as current
+  and skips it. Changed and new documents are left to that sync.
+- after_migrate / after_install: the hashes of the files now imported
+  are stored for the next run.
+
+Skipped and updated counts are printed and logged. Set
+`force_fixture_sync` in site_config.json to reimport everything on the
+next migrate, or force a reimport now:
+    bench --site <site> execute surgishop_reports.utils.fixture_sync.sync --kwargs "{'force': True}"
+"""
+
+import glob
+import hashlib
+import json
+import os
+
+import frappe
+from frappe.modules.import_file import import_file_by_path
+
+HASHES_KEY = "surgishop_reports_fixture_hashes"
+
+# Fixture doctype -> folder of its standard files
+FOLDERS = {"Report": "report", "Print Format": "print_format"}
+
+# Bumped on every export, so it is left out of the hash
+VOLATILE_FIELDS = ("modified",)
+
+
+def before_migrate():
+    force = frappe.conf.get("force_fixture_sync")
+    hashes = get_stored_hashes()
+    skipped, updated = [], []
+
+    for key, (path, doc) in get_fixture_files().items():
+        doctype, name = key
+        modified = frappe.db.get_value(doctype, name, "modified")
+        if not force and modified and hashes.get(get_hash_key(doctype, name)) == get_content_hash(doc):
+            if doc.get("modified") and str(modified) != doc["modified"]:
+                # Matching timestamps make Frappe's sync skip the file
+                frappe.db.sql(
+                    f"UPDATE `tab{doctype}` SET modified = %s WHERE name = %s",
+                    (doc["modified"], name),
+                )
+            skipped.append(key)
+        else:
+            updated.append(key)
+
+    log_counts("before migrate", skipped, updated, force)
+
+
+def after_migrate():
+    record_hashes()
+
+
+def after_install():
+    record_hashes()
+
+
+def sync(force=False):
+    """Import every changed fixture file now (all of them with force) and store the hashes"""
+    hashes = get_stored_hashes()
+    skipped, updated = [], []
+
+    for (doctype, name), (path, doc) in get_fixture_files().items():
+        exists = frappe.db.exists(doctype, name)
+        if not force and exists and hashes.get(get_hash_key(doctype, name)) == get_content_hash(doc):
+            skipped.append((doctype, name))
+            continue
+        import_file_by_path(path, force=True)
+        updated.append((doctype, name))
+
+    record_hashes()
+    frappe.db.commit()
+    log_counts("sync", skipped, updated, force)
+
+
+def record_hashes():
+    """Store the hash of every fixture file that is in the database"""
+    hashes = {}
+    for (doctype, name), (_path, doc) in get_fixture_files().items():
+        if frappe.db.exists(doctype, name):
+            hashes[get_hash_key(doctype, name)] = get_content_hash(doc)
+
+    frappe.db.set_global(HASHES_KEY, json.dumps(hashes, sort_keys=True))
+
+
+def get_fixture_files():
+    """Return {(doctype, name): (path, doc)} for the fixture documents shipped as standard files"""
+    app_path = frappe.get_app_path("surgishop_reports")
+    files = {}
+
+    for doctype, names in get_fixture_names().items():
+        folder = FOLDERS.get(doctype)
+        if not folder:
+            continue
+        for path in sorted(glob.glob(os.path.join(app_path, "*", folder, "*", "*.json"))):
+            with open(path) as f:
+                doc = json.load(f)
+            if isinstance(doc, dict) and doc.get("doctype") == doctype and doc.get("name") in names:
+                files[(doctype, doc["name"])] = (path, doc)
+
+    return files
+
+
+def get_fixture_names():
+    """{doctype: set of names} from the `name in [...]` filters of the fixtures hook"""
+    names = {}
+    for fixture in frappe.get_hooks("fixtures", app_name="surgishop_reports"):
+        if not isinstance(fixture, dict):
+            continue
+        for fieldname, operator, value in fixture.get("filters") or []:
+            if fieldname == "name" and operator == "in":
+                names.setdefault(fixture["doctype"], set()).update(value)
+    return names
+
+
+def get_content_hash(doc):
+    content = {key: value for key, value in doc.items() if key not in VOLATILE_FIELDS}
+    payload = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_hash_key(doctype, name):
+    return f"{doctype}::{name}"
+
+
+def get_stored_hashes():
+    return json.loads(frappe.db.get_global(HASHES_KEY) or "{}")
+
+
+def log_counts(stage, skipped, updated, force=False):
+    message = f"Fixture sync ({stage}): {len(skipped)} unchanged and skipped, {len(updated)} updated"
+    if force:
+        message += " (forced)"
+    print(message)
+    frappe.logger("surgishop_reports").info(message)
@@ -0,0 +1,74 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Composite indexes needed by the shipped reports.
+
+Each entry is created by its own patch in patches/v0_0 and measured by
+surgishop_reports.benchmarks.report_indexes. A patch runs once, so an
+index on a custom field that was not installed yet would never be added;
+`ensure_report_indexes` runs after every migrate and adds any that are
+still missing.
+"""
+
+import frappe
+
+REPORT_INDEXES = [
+    # Shipped Batch Expiry Report: invoice lines joined by delivery note and item
+    ("Sales Invoice Item", ["delivery_note", "item_code"]),
+    # Sent Sales Invoices: status filter plus send time range and sort
+    ("Sales Invoice", ["custom_auto_send_status", "custom_actual_send_time"]),
+    # Delivery Note Status: today's and yesterday's notes by creation
+    ("Delivery Note", ["creation"]),
+    # Surgi General Ledger and the customer statements
+    ("GL Entry", ["party_type", "party", "posting_date"]),
+    # Stock Status: Bin rows of the stores and blemish warehouses
+    ("Bin", ["warehouse", "item_code"]),
+]
+
+
+def ensure_index(doctype, fields):
+    """
+    Add an index on `fields` unless an index already starts with them.
+
+    Indexes on custom fields that are not installed on this site are
+    skipped with a warning, printed and logged, and added by the next
+    migrate that finds the columns. Safe to run any number of times.
+    """
+    missing = [field for field in fields if not frappe.db.has_column(doctype, field)]
+    if missing:
+        message = f"Index on {doctype} ({', '.join(fields)}) skipped: columns not installed: {', '.join(missing)}"
+        print(message)
+        frappe.logger("surgishop_reports").warning(message)
+        return None
+
+    existing = get_covering_index(doctype, fields)
+    if existing:
+        return existing
+
+    index_name = get_index_name(fields)
+    frappe.db.add_index(doctype, fields, index_name)
+    return index_name
+
+
+def ensure_report_indexes():
+    """after_migrate: add every REPORT_INDEXES entry that is still missing"""
+    for doctype, fields in REPORT_INDEXES:
+        ensure_index(doctype, fields)
+
+
+def get_covering_index(doctype, fields):
+    """Name of an existing index whose leading columns are `fields`, if any"""
+    columns = {}
+    for row in frappe.db.sql(f"SHOW INDEX FROM `tab{doctype}`", as_dict=True):
+        columns.setdefault(row.Key_name, []).append((row.Seq_in_index, row.Column_name))
+
+    for index_name, index_columns in columns.items():
+        if [column for _seq, column in sorted(index_columns)][: len(fields)] == list(fields):
+            return index_name
+
+    return None
+
+
+def get_index_name(fields):
+    return "_".join(fields) + "_index"
@@ -0,0 +1,249 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+PDF render cache
+================
+Keeps the PDFs of submitted documents printed with the app's print
+formats (the Print Formats in the `fixtures` hook) on local disk under
+private/pdf_cache/<print format>/, so printing, emailing or downloading
+the same invoice again does not render it again.
+
+The file name is a hash of the document (doctype, name, `modified`), the
+print format's `modified`, the letterhead and its `modified`, and the
+language. Any change to one of them gives a new key; the old file is no
+longer read and ages out. Saving or deleting a Print Format also deletes
+its folder right away.
+
+Only submitted documents are cached: a draft changes without its PDF
+being worth keeping. The folder is bounded by the size set in Surgi
+Report Settings. A hit refreshes the file's mtime, and once the total is
+over the limit the least recently used files are deleted.
+
+`download_pdf` overrides frappe.utils.print_format.download_pdf, and
+`get_pdf` is the same lookup for server-side callers (email
+attachments). `get_cache_stats` returns hits, misses and evictions per
+print format.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+import frappe
+from frappe.utils.print_format import download_pdf as render_pdf
+
+from surgishop_reports.utils.fixture_sync import get_fixture_names
+
+CACHE_FOLDER = "pdf_cache"
+STATS_KEY = "surgishop_reports:pdf_cache_stats"
+SIZE_KEY = "surgishop_reports:pdf_cache_size"
+
+OUTCOMES = ("hits", "misses", "evictions")
+
+
+@frappe.whitelist(allow_guest=True)
+def download_pdf(doctype, name, format=None, doc=None, no_letterhead=0, language=None, letterhead=None):
+    """
+    Drop-in for frappe.utils.print_format.download_pdf that serves cached
+    PDFs. No **kwargs: Frappe then passes only these parameters, not
+    cmd, settings or _lang.
+    """
+    if doc:
+        # Unsaved documents go straight through
+        return render_pdf(doctype, name, format, doc, no_letterhead, language, letterhead)
+
+    from frappe.www.printview import validate_print_permission
+
+    doc = frappe.get_doc(doctype, name)
+    validate_print_permission(doc)
+
+    path = get_cache_path(doc, format, letterhead, no_letterhead, language)
+    pdf = read(path, format or get_default_format(doctype)) if path else None
+    if pdf is None:
+        render_pdf(doctype, name, format, doc, no_letterhead, language, letterhead)
+        if path:
+            write(path, frappe.local.response.filecontent)
+        return
+
+    frappe.local.response.filename = "{name}.pdf".format(name=name.replace(" ", "-").replace("/", "-"))
+    frappe.local.response.filecontent = pdf
+    frappe.local.response.type = "pdf"
+
+
+def get_pdf(doc, print_format=None, letterhead=None, no_letterhead=0, language=None):
+    """PDF bytes of a document, from the cache when it is eligible"""
+    from frappe.translate import print_language
+
+    path = get_cache_path(doc, print_format, letterhead, no_letterhead, language)
+    pdf = read(path, print_format or get_default_format(doc.doctype)) if path else None
+    if pdf is not None:
+        return pdf
+
+    with print_language(language):
+        pdf = frappe.get_print(
+            doc.doctype,
+            doc.name,
+            print_format,
+            doc=doc,
+            as_pdf=True,
+            letterhead=letterhead,
+            no_letterhead=no_letterhead,
+        )
+    if path:
+        write(path, pdf)
+    return pdf
+
+
+def get_cache_path(doc, print_format=None, letterhead=None, no_letterhead=0, language=None):
+    """Cache file for this render, or None when it is not cached"""
+    if doc.docstatus != 1 or not frappe.get_cached_doc("Surgi Report Settings").enable_pdf_cache:
+        return None
+
+    print_format = print_format or get_default_format(doc.doctype)
+    if print_format not in get_fixture_names().get("Print Format", ()):
+        return None
+
+    if no_letterhead:
+        letterhead = None
+    else:
+        letterhead = letterhead or frappe.db.get_value("Letter Head", {"is_default": 1}, "name")
+
+    payload = json.dumps(
+        [
+            doc.doctype,
+            doc.name,
+            doc.modified,
+            frappe.get_cached_value("Print Format", print_format, "modified"),
+            letterhead,
+            frappe.get_cached_value("Letter Head", letterhead, "modified") if letterhead else None,
+            language or frappe.local.lang,
+        ],
+        default=str,
+    )
+    key = hashlib.sha1(payload.encode()).hexdigest()
+    return os.path.join(get_folder(print_format), f"{key}.pdf")
+
+
+def get_default_format(doctype):
+    return frappe.get_meta(doctype).default_print_format or "Standard"
+
+
+def get_folder(print_format=None):
+    folder = frappe.get_site_path("private", CACHE_FOLDER)
+    return os.path.join(folder, frappe.scrub(print_format)) if print_format else folder
+
+
+def read(path, print_format):
+    try:
+        with open(path, "rb") as f:
+            pdf = f.read()
+    except OSError:
+        count(print_format, "misses")
+        return None
+
+    # Most recently used files are the last to be evicted
+    os.utime(path)
+    count(print_format, "hits")
+    return pdf
+
+
+def write(path, pdf):
+    if not pdf:
+        return
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Complete files only: a concurrent read never sees half a PDF
+    tmp_path = f"{path}.{frappe.generate_hash(length=8)}.part"
+    with open(tmp_path, "wb") as f:
+        f.write(pdf)
+    os.replace(tmp_path, path)
+
+    cache = frappe.cache()
+    size = cache.incrby(cache.make_key(SIZE_KEY), len(pdf))
+    if size > get_max_bytes():
+        evict_lru()
+
+
+def get_max_bytes():
+    return (frappe.get_cached_doc("Surgi Report Settings").pdf_cache_size or 0) * 1024 * 1024
+
+
+def evict_lru():
+    """Delete the least recently used files until the folder fits its size limit"""
+    files = []
+    for root, _dirs, names in os.walk(get_folder()):
+        for file_name in names:
+            if file_name.endswith(".part"):
+                continue
+            path = os.path.join(root, file_name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+    files.sort()
+    total = sum(size for _mtime, size, _path in files)
+    max_bytes = get_max_bytes()
+    for _mtime, size, path in files:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        count(os.path.basename(os.path.dirname(path)), "evictions", scrubbed=True)
+
+    cache = frappe.cache()
+    cache.set(cache.make_key(SIZE_KEY), total)
+
+
+def invalidate(doc, method=None):
+    """doc_events handler for Print Format: drop its cached PDFs"""
+    shutil.rmtree(get_folder(doc.name), ignore_errors=True)
+
+
+def count(print_format, outcome, scrubbed=False):
+    cache = frappe.cache()
+    folder = print_format if scrubbed else frappe.scrub(print_format)
+    cache.incr(cache.make_key(f"{STATS_KEY}:{folder}:{outcome}"))
+
+
+@frappe.whitelist()
+def get_cache_stats():
+    """Hits, misses, evictions and hit rate per print format"""
+    frappe.only_for("System Manager")
+
+    cache = frappe.cache()
+    rows = []
+    for print_format in sorted(get_fixture_names().get("Print Format", ())):
+        hits, misses, evictions = (
+            int(value or 0)
+            for value in cache.mget(
+                [cache.make_key(f"{STATS_KEY}:{frappe.scrub(print_format)}:{outcome}") for outcome in OUTCOMES]
+            )
+        )
+        rows.append(
+            {
+                "print_format": print_format,
+                "hits": hits,
+                "misses": misses,
+                "evictions": evictions,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+            }
+        )
+    return rows
+
+
+@frappe.whitelist()
+def clear_cache(print_format=None):
+    """Delete the cached PDFs of one print format or all of them"""
+    frappe.only_for("System Manager")
+
+    shutil.rmtree(get_folder(print_format), ignore_errors=True)
+    if not print_format:
+        cache = frappe.cache()
+        cache.set(cache.make_key(SIZE_KEY), 0)
@@ -0,0 +1,41 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Bounded process pool with a Frappe site connection in every worker.
+
+Workers are spawned (not forked) so they do not share the parent's
+database socket or Redis connections, and each one connects to the same
+site once in its initializer.
+
+Usage:
+    with get_pool() as pool:
+        for result in pool.map(render, jobs):
+            ...
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import frappe
+
+MAX_WORKERS = 4
+
+
+def get_pool(max_workers=None):
+    """Return a ProcessPoolExecutor of at most MAX_WORKERS site-connected workers"""
+    if not max_workers:
+        max_workers = min(MAX_WORKERS, os.cpu_count() or 1)
+
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(frappe.local.site, frappe.local.sites_path),
+    )
+
+
+def init_worker(site, sites_path):
+    frappe.init(site=site, sites_path=sites_path)
+    frappe.connect()
@@ -0,0 +1,47 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import time
+from contextlib import contextmanager
+
+import frappe
+
+
+class QueryStats:
+    """Counters filled in by `count_queries`"""
+
+    def __init__(self):
+        self.count = 0
+        self.sql_time = 0.0
+        self.wall_time = 0.0
+
+
+@contextmanager
+def count_queries():
+    """
+    Count the SQL statements issued through frappe.db.sql inside the block.
+
+    Usage:
+        with count_queries() as stats:
+            execute(filters)
+        print(stats.count, stats.sql_time, stats.wall_time)
+    """
+    stats = QueryStats()
+    db = frappe.db
+    original_sql = db.sql
+
+    def counting_sql(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original_sql(*args, **kwargs)
+        finally:
+            stats.count += 1
+            stats.sql_time += time.perf_counter() - start
+
+    db.sql = counting_sql
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.wall_time = time.perf_counter() - start
+        db.sql = original_sql
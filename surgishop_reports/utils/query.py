@@ -0,0 +1,79 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Parameterized WHERE clauses for report filters.
+
+Every predicate is added with a named placeholder and its value, so the
+SQL text depends only on which filters are set, never on their values.
+Datetime columns get half-open day ranges (>= from 00:00, < day after
+to) instead of a ' 23:59:59' suffix, which also keeps fractional seconds
+on the last day.
+
+Usage:
+    conditions = Conditions()
+    conditions.date_range("si.posting_date", filters.get("from_date"), filters.get("to_date"))
+    conditions.equals("si.customer", filters.get("customer"))
+    frappe.db.sql(f"SELECT ... FROM `tabSales Invoice` si {conditions.where()}", conditions.values)
+"""
+
+from frappe.utils import add_days, getdate
+
+
+class Conditions:
+    """Predicates and their values, ANDed together"""
+
+    def __init__(self, *conditions, **values):
+        self.conditions = list(conditions)
+        self.values = dict(values)
+
+    def add(self, condition, **values):
+        """Add raw SQL that uses only %(name)s placeholders"""
+        self.conditions.append(condition)
+        self.values.update(values)
+        return self
+
+    def equals(self, column, value, key=None):
+        """column = value; skipped when value is empty"""
+        if value in (None, ""):
+            return self
+        key = key or get_key(column)
+        return self.add(f"{column} = %({key})s", **{key: value})
+
+    def is_in(self, column, values, key=None):
+        """column IN values; skipped when values is empty"""
+        if not values:
+            return self
+        key = key or get_key(column)
+        return self.add(f"{column} IN %({key})s", **{key: tuple(values)})
+
+    def date_range(self, column, from_date=None, to_date=None, key=None):
+        """Inclusive range on a Date column; either end may be empty"""
+        key = key or get_key(column)
+        if from_date:
+            self.add(f"{column} >= %({key}_from)s", **{f"{key}_from": getdate(from_date)})
+        if to_date:
+            self.add(f"{column} <= %({key}_to)s", **{f"{key}_to": getdate(to_date)})
+        return self
+
+    def datetime_range(self, column, from_date=None, to_date=None, key=None):
+        """Whole days from from_date through to_date on a Datetime column"""
+        key = key or get_key(column)
+        if from_date:
+            self.add(f"{column} >= %({key}_from)s", **{f"{key}_from": getdate(from_date)})
+        if to_date:
+            self.add(f"{column} < %({key}_to)s", **{f"{key}_to": add_days(getdate(to_date), 1)})
+        return self
+
+    def where(self):
+        """'WHERE a AND b', or '' when there are no conditions"""
+        return ("WHERE " + " AND ".join(self.conditions)) if self.conditions else ""
+
+    def and_clause(self):
+        """'AND a AND b' to extend an existing WHERE, or ''"""
+        return "".join(f"\n            AND {c}" for c in self.conditions)
+
+
+def get_key(column):
+    """Placeholder name for a column: 'si.posting_date' -> 'posting_date'"""
+    return column.rsplit(".", 1)[-1].strip("`")
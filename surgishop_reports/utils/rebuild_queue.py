@@ -0,0 +1,86 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Deferred rebuilds of derived tables
+===================================
+The party balance snapshot, the sales person revenue rollup and the
+margin cube are never adjusted by deltas: reposts and raw SQL rewrites
+of GL, stock and invoice rows would make them drift. A document event
+queues a recompute of the keys it touched instead:
+
+    rebuild_queue.queue("surgishop_reports.selling.margin_cube.rebuild", group, *args)
+
+After the transaction commits, each call is stored in a Redis hash and a
+short job is enqueued per (method, group), deduplicated, which runs
+method(*args) for every pending call of its group and commits. Calls
+queued while a job runs are picked up by its next pass; a call is only
+removed once its rebuild has committed. The hourly scheduler runs every
+pending call, so nothing stays behind after a failed or skipped job.
+"""
+
+import json
+
+import frappe
+
+PENDING_KEY = "surgishop_reports:pending_rebuilds"
+
+
+def queue(method, group, *args):
+    """Run method(*args) in a background job once the transaction commits"""
+    pending = frappe.flags.pending_rebuilds
+    if pending is None:
+        pending = frappe.flags.pending_rebuilds = set()
+        frappe.db.after_commit.add(enqueue_pending)
+        frappe.db.before_rollback.add(lambda: frappe.flags.pop("pending_rebuilds", None))
+
+    pending.add(json.dumps([method, str(group), [str(arg) if arg is not None else None for arg in args]]))
+
+
+def enqueue_pending():
+    fields = frappe.flags.pop("pending_rebuilds", None) or set()
+    cache = frappe.cache()
+    groups = set()
+    for field in fields:
+        cache.hset(PENDING_KEY, field, 1)
+        method, group, _args = json.loads(field)
+        groups.add((method, group))
+
+    for method, group in groups:
+        frappe.enqueue(
+            "surgishop_reports.utils.rebuild_queue.run_pending",
+            queue="short",
+            job_id=f"rebuild::{method}::{group}",
+            deduplicate=True,
+            method=method,
+            group=group,
+        )
+
+
+def run_pending(method=None, group=None):
+    """Job: run the pending rebuilds of one group, or all of them (hourly)"""
+    while True:
+        pending = get_pending(method, group)
+        if not pending:
+            return
+
+        cache = frappe.cache()
+        for (m, _g), calls in pending.items():
+            rebuild = frappe.get_attr(m)
+            for field, args in sorted(calls, key=lambda call: json.dumps(call[1])):
+                rebuild(*args)
+            frappe.db.commit()
+            for field, _args in calls:
+                cache.hdel(PENDING_KEY, field)
+
+
+def get_pending(method=None, group=None):
+    """Return {(method, group): [(field, args)]}"""
+    pending = {}
+    for field in frappe.cache().hkeys(PENDING_KEY):
+        field = frappe.safe_decode(field)
+        m, g, args = json.loads(field)
+        if method and (m, g) != (method, group):
+            continue
+        pending.setdefault((m, g), []).append((field, args))
+    return pending
@@ -0,0 +1,151 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Report result cache
+===================
+Keeps the result of a synchronous report run in Redis, keyed by report
+name, normalized filters and the user's permission scope (roles and User
+Permissions), so users who see the same data share an entry.
+
+Only reports listed in the `report_cache_sources` hook are cached, each
+with the doctypes its SQL reads:
+
+    report_cache_sources = {"Items on Hold": ["Quotation", "Sales Order", "User"]}
+
+Every source doctype has a generation counter that is part of the cache
+key. `evict` is registered in doc_events for the source doctypes and bumps
+the counter, which orphans every entry that read that doctype. Writes that
+skip document events (db_set, bulk updates) are covered by the TTL from
+Surgi Report Settings, which is also the ceiling for every entry.
+
+report_runner.run reads and fills the cache; `get_cache_stats` returns
+hits and misses per report.
+"""
+
+import hashlib
+import json
+
+import frappe
+
+CACHE_KEY = "surgishop_reports:report_cache"
+GENERATION_KEY = "surgishop_reports:report_cache_generation"
+STATS_KEY = "surgishop_reports:report_cache_stats"
+
+
+def get_result(key, report_name):
+    """Cached result for a key from get_cache_key, or None on a miss"""
+    if not key:
+        return None
+
+    result = frappe.cache().get_value(key)
+    count(report_name, "hits" if result is not None else "misses")
+    return result
+
+
+def set_result(key, result):
+    if key:
+        ttl = frappe.get_cached_doc("Surgi Report Settings").result_cache_ttl
+        frappe.cache().set_value(key, result, expires_in_sec=ttl)
+
+
+def evict(doc, method=None):
+    """doc_events handler: drop cached results of reports that read doc.doctype"""
+    bump_generation(doc.doctype)
+    # A run between this write and its commit may cache the old rows under
+    # the new generation, so bump again once the write is visible
+    frappe.db.after_commit.add(lambda: bump_generation(doc.doctype))
+
+
+def get_cache_key(report_name, filters, user=None):
+    """
+    Key for this report, filters and user, or None when the report is not
+    cached. Take the key before running the report, so a write during the
+    run leaves the result under the old generations.
+    """
+    sources = get_sources().get(report_name)
+    if not sources:
+        return None
+
+    settings = frappe.get_cached_doc("Surgi Report Settings")
+    if not settings.enable_result_cache or not settings.result_cache_ttl:
+        return None
+
+    user = user or frappe.session.user
+    payload = json.dumps(
+        [normalize_filters(filters), get_permission_scope(user), get_generations(sources)],
+        sort_keys=True,
+        default=str,
+    )
+    return f"{CACHE_KEY}:{report_name}:{hashlib.sha1(payload.encode()).hexdigest()}"
+
+
+def get_sources():
+    return frappe.get_hooks("report_cache_sources") or {}
+
+
+def normalize_filters(filters):
+    """Drop empty filters and order list values, so equivalent filters match"""
+    normalized = {}
+    for key, value in (filters or {}).items():
+        if value in (None, "", []) or key == "prepared_report_name":
+            continue
+        if isinstance(value, list):
+            value = sorted(value, key=str)
+        normalized[key] = value
+    return normalized
+
+
+def get_permission_scope(user):
+    from frappe.core.doctype.user_permission.user_permission import get_user_permissions
+
+    return [sorted(frappe.get_roles(user)), get_user_permissions(user)]
+
+
+def get_generations(doctypes):
+    cache = frappe.cache()
+    values = cache.mget([cache.make_key(f"{GENERATION_KEY}:{doctype}") for doctype in doctypes])
+    return [int(value or 0) for value in values]
+
+
+def bump_generation(doctype):
+    cache = frappe.cache()
+    cache.incr(cache.make_key(f"{GENERATION_KEY}:{doctype}"))
+
+
+def count(report_name, outcome):
+    cache = frappe.cache()
+    cache.incr(cache.make_key(f"{STATS_KEY}:{report_name}:{outcome}"))
+
+
+@frappe.whitelist()
+def get_cache_stats():
+    """Hits, misses and hit rate per cached report"""
+    frappe.only_for("System Manager")
+
+    cache = frappe.cache()
+    rows = []
+    for report_name in sorted(get_sources()):
+        hits, misses = (
+            int(value or 0)
+            for value in cache.mget(
+                [cache.make_key(f"{STATS_KEY}:{report_name}:{outcome}") for outcome in ("hits", "misses")]
+            )
+        )
+        rows.append(
+            {
+                "report": report_name,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+            }
+        )
+    return rows
+
+
+@frappe.whitelist()
+def clear_cache(report_name=None):
+    """Drop cached results for one report or all of them"""
+    frappe.only_for("System Manager")
+
+    frappe.cache().delete_keys(f"{CACHE_KEY}:{report_name}:" if report_name else f"{CACHE_KEY}:")
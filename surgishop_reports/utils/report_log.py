@@ -0,0 +1,53 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Report execution telemetry.
+
+report_runner.run measures every synchronous run (wall time, SQL count
+and time via utils.profiling.count_queries) and passes it to `log_run`.
+A `log_sample_rate` share of runs, and every run slower than
+`log_slow_after_seconds`, is written to Report Execution Log from a
+short background job, so the report request does not wait on the insert.
+
+Each row records whether it was drawn by the sample (`sampled`) and
+whether it was slow (`slow`). Slow runs are logged whether sampled or
+not, so only sampled rows form an unbiased distribution; the slow ones
+outside the sample count towards the slow total and the maximum only.
+Retention is handled by Log Settings (default_log_clearing_doctypes).
+"""
+
+import json
+import random
+
+import frappe
+
+
+def log_run(report_name, filters, user, stats, result):
+    settings = frappe.get_cached_doc("Surgi Report Settings")
+    slow = bool(settings.log_slow_after_seconds and stats.wall_time >= settings.log_slow_after_seconds)
+    sampled = random.random() * 100 < (settings.log_sample_rate or 0)
+    if not (slow or sampled):
+        return
+
+    from surgishop_reports.utils.report_runner import get_filter_shape
+
+    frappe.enqueue(
+        "surgishop_reports.utils.report_log.insert_log",
+        queue="short",
+        report=report_name,
+        user=user or frappe.session.user,
+        filter_shape=get_filter_shape(filters),
+        filters=json.dumps(filters, default=str, sort_keys=True),
+        sampled=int(sampled),
+        slow=int(slow),
+        wall_time=stats.wall_time,
+        sql_count=stats.count,
+        sql_time=stats.sql_time,
+        row_count=len(result.get("result") or []),
+        payload_bytes=len(frappe.as_json(result, indent=None)),
+    )
+
+
+def insert_log(**values):
+    frappe.get_doc({"doctype": "Report Execution Log", **values}).insert(ignore_permissions=True)
@@ -0,0 +1,246 @@
+# Copyright (c) 2025, Surgishop
+# License: MIT
+
+"""
+Adaptive report execution
+=========================
+Replaces frappe.desk.query_report.run (override_whitelisted_methods in
+hooks.py) so that slow reports stop running inside a web worker.
+
+Every synchronous run records its runtime against the report and the
+shape of its filters: which filters are set, plus the width of the date
+range. Once a shape has RUNTIME_SAMPLES runs averaging more than
+`promote_after_seconds`, further runs of that shape are sent to a
+background Prepared Report. A completed Prepared Report for the same
+filters is reused while it is younger than `reuse_prepared_minutes`, and
+one that is still Queued or Started is returned instead of queueing the
+same job again on every refresh.
+
+Surgi Report Settings can pin a report to Prepared or Synchronous, which
+takes precedence over the measured runtime. Reports that are not pinned
+and not promoted keep Frappe's own behaviour, including the report's
+`prepared_report` flag.
+
+Synchronous results of reports that declare their sources are served
+from and stored in the result cache (report_cache.py), and executed runs
+are sampled into Report Execution Log (report_log.py).
+"""
+
+import json
+
+import frappe
+from frappe.utils import add_to_date, date_diff, get_datetime, now_datetime, sbool
+
+from surgishop_reports.utils import report_cache
+from surgishop_reports.utils.profiling import count_queries
+from surgishop_reports.utils.report_log import log_run
+
+RUNTIME_KEY = "surgishop_reports:report_runtime"
+
+# Weight of the latest run in the moving average
+SMOOTHING = 0.3
+
+# Date range width in days -> shape bucket
+SPAN_BUCKETS = ((1, "day"), (7, "week"), (31, "month"), (92, "quarter"), (366, "year"))
+
+IGNORED_FILTERS = ("prepared_report_name",)
+
+
+@frappe.whitelist()
+def run(
+    report_name,
+    filters=None,
+    user=None,
+    ignore_prepared_report=False,
+    custom_columns=None,
+    is_tree=False,
+    parent_field=None,
+    are_default_filters=True,
+):
+    from frappe.desk import query_report
+
+    filters = parse_filters(filters)
+
+    # query_report.run's checks, before a cached or prepared result can answer
+    query_report.validate_filters_permissions(report_name, filters, user)
+    report = query_report.get_report_doc(report_name)
+    if not frappe.has_permission(report.ref_doctype, "report"):
+        frappe.throw(
+            f"You don't have access to {report_name}: no Report permission on {report.ref_doctype}",
+            frappe.PermissionError,
+        )
+
+    mode = None if custom_columns else get_mode(report_name, filters)
+
+    if mode == "Prepared" and not sbool(ignore_prepared_report):
+        return run_prepared(report_name, filters, user)
+
+    if mode == "Synchronous":
+        ignore_prepared_report = True
+
+    cache_key = None if custom_columns else report_cache.get_cache_key(report_name, filters, user)
+    cached = report_cache.get_result(cache_key, report_name)
+    if cached is not None:
+        return cached
+
+    with count_queries() as stats:
+        result = query_report.run(
+            report_name,
+            filters=filters,
+            user=user,
+            ignore_prepared_report=ignore_prepared_report,
+            custom_columns=custom_columns,
+            is_tree=is_tree,
+            parent_field=parent_field,
+            are_default_filters=are_default_filters,
+        )
+    if not result.get("prepared_report"):
+        record_runtime(report_name, filters, stats.wall_time)
+        report_cache.set_result(cache_key, result)
+        log_run(report_name, filters, user, stats, result)
+
+    return result
+
+
+def run_prepared(report_name, filters, user=None):
+    """Return a recent Prepared Report result, the one already running, or queue a new one"""
+    from frappe.core.doctype.prepared_report.prepared_report import (
+        get_completed_prepared_report,
+        get_reports_in_queued_state,
+        make_prepared_report,
+    )
+    from frappe.desk.query_report import get_prepared_report_result, get_report_doc
+
+    user = user or frappe.session.user
+    dn = filters.pop("prepared_report_name", None)
+    if not dn:
+        dn = get_completed_prepared_report(filters, user, report_name)
+        if dn and not is_fresh(dn):
+            dn = None
+
+    if dn:
+        return get_prepared_report_result(get_report_doc(report_name), filters, dn, user)
+
+    running = get_reports_in_queued_state(report_name, json.dumps(filters))
+    if running:
+        return {"prepared_report": True, "doc": frappe.get_doc("Prepared Report", running[0].name)}
+
+    queued = make_prepared_report(report_name, json.dumps(filters))
+    # run is called with GET, which Frappe does not commit; the report is
+    # generated by a job enqueued after commit
+    frappe.db.commit()
+    return {"prepared_report": True, "doc": frappe.get_doc("Prepared Report", queued["name"])}
+
+
+def get_mode(report_name, filters):
+    """'Prepared', 'Synchronous', or None to leave the choice to Frappe"""
+    settings = frappe.get_cached_doc("Surgi Report Settings")
+
+    for policy in settings.policies:
+        if policy.report == report_name and policy.mode != "Auto":
+            return policy.mode
+
+    if not settings.adaptive_prepared_reports:
+        return None
+
+    stats = get_runtime(report_name, filters)
+    if (
+        stats
+        and stats["count"] >= (settings.runtime_samples or 1)
+        and stats["average"] > (settings.promote_after_seconds or 0)
+    ):
+        return "Prepared"
+
+    return None
+
+
+def is_fresh(prepared_report):
+    settings = frappe.get_cached_doc("Surgi Report Settings")
+    if not settings.reuse_prepared_minutes:
+        return True
+
+    creation = frappe.db.get_value("Prepared Report", prepared_report, "creation")
+    return get_datetime(creation) >= add_to_date(now_datetime(), minutes=-settings.reuse_prepared_minutes)
+
+
+def get_filter_shape(filters):
+    """
+    Filters that are set, plus the width of the date range.
+
+    {"company": "X", "from_date": "2025-01-01", "to_date": "2025-12-31"}
+    -> "company,from_date,to_date|year"
+    """
+    keys = sorted(
+        key for key, value in filters.items() if value not in (None, "", []) and key not in IGNORED_FILTERS
+    )
+    shape = ",".join(keys)
+
+    if filters.get("from_date") and filters.get("to_date"):
+        days = date_diff(filters["to_date"], filters["from_date"]) + 1
+        span = next((name for limit, name in SPAN_BUCKETS if days <= limit), "multi-year")
+        shape += f"|{span}"
+
+    return shape
+
+
+def get_runtime_field(report_name, filters):
+    return f"{report_name}::{get_filter_shape(filters)}"
+
+
+def get_runtime(report_name, filters):
+    return frappe.cache().hget(RUNTIME_KEY, get_runtime_field(report_name, filters))
+
+
+def record_runtime(report_name, filters, seconds):
+    field = get_runtime_field(report_name, filters)
+    cache = frappe.cache()
+    stats = cache.hget(RUNTIME_KEY, field)
+
+    if stats:
+        stats["average"] += SMOOTHING * (seconds - stats["average"])
+        stats["count"] += 1
+        stats["max"] = max(stats["max"], seconds)
+    else:
+        stats = {"average": seconds, "count": 1, "max": seconds}
+    stats["last"] = seconds
+
+    cache.hset(RUNTIME_KEY, field, stats)
+
+
+@frappe.whitelist()
+def get_runtime_stats(report_name=None):
+    """Recorded runtimes per report and filter shape, slowest first"""
+    frappe.only_for("System Manager")
+
+    rows = []
+    for field, stats in (frappe.cache().hgetall(RUNTIME_KEY) or {}).items():
+        if isinstance(field, bytes):
+            field = field.decode()
+        name, shape = field.split("::", 1)
+        if report_name and name != report_name:
+            continue
+        rows.append(dict(report=name, shape=shape, **stats))
+
+    return sorted(rows, key=lambda row: row["average"], reverse=True)
+
+
+@frappe.whitelist()
+def reset_runtime_stats(report_name=None):
+    """Forget recorded runtimes, for one report or all of them"""
+    frappe.only_for("System Manager")
+
+    cache = frappe.cache()
+    if not report_name:
+        cache.delete_key(RUNTIME_KEY)
+        return
+
+    for row in get_runtime_stats(report_name):
+        cache.hdel(RUNTIME_KEY, f"{row['report']}::{row['shape']}")
+
+
+def parse_filters(filters):
+    if not filters:
+        return {}
+    if isinstance(filters, str):
+        return json.loads(filters)
+    return dict(filters)
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Surgishop Reports - Export Sync
+===============================
+Syncs surgishop_reports_export.json (reports) and
+surgishop_print_formats_export.json (print formats) into the app's
+folder structure. import_reports.py, populate_report_jsons.py,
+update_report_jsons.py and import_print_formats.py are thin wrappers
+around this module.
+
+Every document gets a canonical content hash (SHA-256 of its JSON with
+sorted keys). The JSON file already on disk is hashed the same way and
+is only rewritten when the hashes differ, so unchanged files keep their
+mtime and `bench migrate` does not reimport them. A sync with no changes
+writes nothing.
+
+Documents are processed in a pool of worker processes: the per-document
+work (print format image extraction, serializing and hashing, reading
+and hashing the file on disk) is independent, and the print formats are
+a few hundred KB each. A summary of created, updated, unchanged and
+missing documents is printed at the end, with the top-level fields that
+changed.
+
+Print formats also have their embedded base64 images moved into
+content-hashed files under surgishop_reports/public/images/print/ and
+Figma clipboard metadata stripped, see extract_embedded_images.
+
+A report that has a Python module (<slug>.py) is never downgraded: an
+export entry that would change its report_type, query or report_script
+is reported as kept and not written. Regenerate the export from the report JSONs after moving a
+report into the app.
+
+Usage:
+    python3 sync_exports.py                     # reports and print formats
+    python3 sync_exports.py reports --existing-only
+    python3 sync_exports.py print-formats --dry-run
+    python3 sync_exports.py all --jobs 4
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+BASE_PATH = 'surgishop_reports'
+MODULES = ['accounts', 'selling', 'stock']
+
+REPORTS_EXPORT = 'surgishop_reports_export.json'
+PRINT_FORMATS_EXPORT = 'surgishop_print_formats_export.json'
+
+ASSETS_DIR = os.path.join('surgishop_reports', 'public', 'images', 'print')
+ASSETS_URL = '/assets/surgishop_reports/images/print'
+
+# data:image/png;base64,.... inside html, css or Print Designer JSON
+EMBEDDED_IMAGE = re.compile(r'data:image/([a-zA-Z0-9.+-]+);base64,([A-Za-z0-9+/=]+)')
+
+# Empty <span data-metadata="<!--(figmeta)...-->"> / data-buffer="<!--(figma)...-->"
+# left behind when text is pasted from Figma; quotes may be JSON-escaped
+FIGMA_CLIPBOARD = re.compile(
+    r'<span data-(?:metadata|buffer)=\\*"<!--\((figmeta|figma)\).*?\(/\1\)-->\\*"></span>',
+    re.DOTALL
+)
+
+IMAGE_EXTENSIONS = {'jpeg': 'jpg', 'svg+xml': 'svg'}
+
+# Report fields owned by the app once the report has a Python module
+CODE_FIELDS = ('report_type', 'query', 'report_script')
+
+CREATED, UPDATED, UNCHANGED, KEPT, MISSING, FAILED = 'created', 'updated', 'unchanged', 'kept', 'missing', 'failed'
+
+SCRIPT_REPORT_TEMPLATE = '''# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import frappe
+
+def execute(filters=None):
+    """
+    {report_name}
+    """
+    {report_script}
+
+    # Ensure we return the right format
+    return columns, data
+'''
+
+SCRIPT_REPORT_PLACEHOLDER = '''# Copyright (c) 2025, Surgishop
+# License: MIT
+
+import frappe
+
+def execute(filters=None):
+    """
+    {report_name}
+
+    TODO: Add your report logic here
+    This is a placeholder - copy your script from the JSON file's report_script field
+    """
+    columns = []
+    data = []
+
+    return columns, data
+'''
+
+def slugify(text):
+    """Convert a report or print format name to its folder name (lowercase with underscores)"""
+    text = text.lower()
+    text = re.sub(r'[^\w\s-]', '', text)
+    text = re.sub(r'[-\s]+', '_', text)
+    return text
+
+def get_doc_path(doc, folder, base_path=BASE_PATH, search_modules=False):
+    """
+    Path of a document's JSON file: <module>/<folder>/<slug>/<slug>.json.
+
+    With search_modules, a file that is not under the document's own
+    module is looked for in the other modules, for documents whose
+    module was renamed after the files were created.
+    """
+    slug = slugify(doc['name'])
+    module = doc.get('module', 'Selling').lower()
+    path = os.path.join(base_path, module, folder, slug, f'{slug}.json')
+
+    if search_modules and not os.path.exists(path):
+        for other in MODULES:
+            candidate = os.path.join(base_path, other, folder, slug, f'{slug}.json')
+            if os.path.exists(candidate):
+                return candidate
+
+    return path
+
+def get_content_hash(doc):
+    """Canonical hash: independent of key order and indentation"""
+    payload = json.dumps(doc, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def read_json(path):
+    """Parsed JSON of a file, or None if it is missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_atomic(path, content, mode='w'):
+    """Write through a temporary file so a concurrent reader never sees half a file"""
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix='.sync-')
+    try:
+        with os.fdopen(fd, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def ensure_init_files(json_path, base_path=BASE_PATH):
+    """Create the __init__.py files from the module folder down to the document folder"""
+    folder = os.path.dirname(json_path)
+    while os.path.normpath(folder) != os.path.normpath(base_path):
+        init_file = os.path.join(folder, '__init__.py')
+        if not os.path.exists(init_file):
+            with open(init_file, 'w') as f:
+                f.write('')
+        folder = os.path.dirname(folder)
+
+def get_changed_fields(old, new):
+    if not isinstance(old, dict):
+        return sorted(new)
+    return sorted(key for key in set(old) | set(new) if old.get(key) != new.get(key))
+
+def sync_doc(doc, path, existing_only=False, dry_run=False):
+    """Write doc to path if its content hash differs from the file's; return the result row"""
+    result = {'name': doc.get('name'), 'path': path, 'fields': []}
+
+    existing = read_json(path) if os.path.exists(path) else None
+    if existing is None and existing_only:
+        result['status'] = MISSING
+        return result
+
+    if existing is not None and get_content_hash(existing) == get_content_hash(doc):
+        result['status'] = UNCHANGED
+        return result
+
+    result['status'] = CREATED if existing is None else UPDATED
+    result['fields'] = get_changed_fields(existing, doc)
+    if not dry_run:
+        ensure_init_files(path)
+        write_atomic(path, json.dumps(doc, indent=1))
+    return result
+
+def sync_report(report, existing_only=False, dry_run=False, search_modules=False):
+    """Worker: one report JSON, plus the Script Report .py when it does not exist yet"""
+    path = get_doc_path(report, 'report', search_modules=search_modules)
+    py_path = path[: -len('.json')] + '.py'
+    if os.path.exists(py_path):
+        # The app's Python module is newer than an export that still has the
+        # query or the script pasted in the desk; never downgrade the report to it
+        existing = read_json(path) or {}
+        if report.get('report_type') != 'Script Report' or any(
+            report.get(field) != existing.get(field) for field in CODE_FIELDS
+        ):
+            return {'name': report.get('name'), 'path': path, 'status': KEPT, 'fields': [], 'report_type': 'Script Report'}
+
+    try:
+        result = sync_doc(report, path, existing_only, dry_run)
+    except Exception as e:
+        return {'name': report.get('name'), 'path': path, 'status': FAILED, 'error': str(e), 'fields': []}
+
+    result['report_type'] = report.get('report_type', 'Report Builder')
+    if result['status'] == CREATED and result['report_type'] == 'Script Report' and not dry_run:
+        # Never overwrite a report's Python code with a template
+        if not os.path.exists(py_path):
+            template = SCRIPT_REPORT_TEMPLATE if report.get('report_script') else SCRIPT_REPORT_PLACEHOLDER
+            write_atomic(py_path, template.format(report_name=report['name'], report_script=report.get('report_script', '')))
+    return result
+
+def extract_embedded_images(pf, assets_dir=ASSETS_DIR, dry_run=False):
+    """
+    Move base64 images out of every text field of a print format.
+
+    Returns the list of asset file names the format now references.
+    """
+    assets = []
+
+    def replace(match):
+        image_type, data = match.groups()
+        content = base64.b64decode(data)
+        digest = hashlib.sha256(content).hexdigest()[:16]
+        file_name = f'{digest}.{IMAGE_EXTENSIONS.get(image_type.lower(), image_type.lower())}'
+
+        path = os.path.join(assets_dir, file_name)
+        if not dry_run and not os.path.exists(path):
+            write_atomic(path, content, mode='wb')
+
+        assets.append(file_name)
+        return f'{ASSETS_URL}/{file_name}'
+
+    for field, value in pf.items():
+        if isinstance(value, str) and 'data:image/' in value:
+            pf[field] = EMBEDDED_IMAGE.sub(replace, value)
+
+    return assets
+
+def strip_clipboard_metadata(pf):
+    """Drop Figma paste metadata spans; they render nothing"""
+    for field, value in pf.items():
+        if isinstance(value, str) and '(figm' in value:
+            pf[field] = FIGMA_CLIPBOARD.sub('', value)
+
+def get_template_stats(pf):
+    """Size of the template fields and, if jinja2 is available, compile time"""
+    html = pf.get('html') or ''
+    stats = {
+        'json_size': len(json.dumps(pf, indent=1)),
+        'html_size': len(html),
+        'compile_ms': None,
+    }
+
+    try:
+        import jinja2
+    except ImportError:
+        return stats
+
+    start = time.perf_counter()
+    for _ in range(10):
+        jinja2.Environment().from_string(html)
+    stats['compile_ms'] = (time.perf_counter() - start) * 100
+    return stats
+
+def sync_print_format(pf, existing_only=False, dry_run=False, search_modules=False):
+    """Worker: move images out, strip clipboard metadata and sync one print format JSON"""
+    path = get_doc_path(pf, 'print_format', search_modules=search_modules)
+    try:
+        before = get_template_stats(pf)
+        assets = extract_embedded_images(pf, dry_run=dry_run)
+        strip_clipboard_metadata(pf)
+
+        # Standard formats for app deployment
+        pf['is_standard'] = 'Yes'
+        pf['docstatus'] = 0
+
+        result = sync_doc(pf, path, existing_only, dry_run)
+    except Exception as e:
+        return {'name': pf.get('name'), 'path': path, 'status': FAILED, 'error': str(e), 'fields': []}
+
+    result.update(assets=assets, before=before, after=get_template_stats(pf))
+    return result
+
+def load_export(export_file):
+    """Documents of an export file; raises ValueError with a readable message"""
+    if not os.path.exists(export_file):
+        raise ValueError(f'{export_file} not found!')
+
+    with open(export_file, 'r', encoding='utf-8') as f:
+        content = f.read().strip()
+
+    if content == '[JSON_CONTENT_HERE]' or not content:
+        raise ValueError('Export file appears to be empty or contains placeholder text. '
+                         'Please export first using EXPORT_SCRIPT.js')
+
+    try:
+        docs = json.loads(content)
+    except json.JSONDecodeError as e:
+        raise ValueError(f'Invalid JSON in export file: {e}')
+
+    if not isinstance(docs, list):
+        raise ValueError('Export file should contain a JSON array')
+
+    return [doc for doc in docs if isinstance(doc, dict) and doc.get('name')]
+
+def run_sync(worker, docs, existing_only=False, dry_run=False, search_modules=False, jobs=None):
+    """Run worker over docs in parallel; results come back in export order"""
+    count = len(docs)
+    if not count:
+        return []
+
+    args = ([existing_only] * count, [dry_run] * count, [search_modules] * count)
+    if jobs == 1 or count == 1:
+        return list(map(worker, docs, *args))
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(worker, docs, *args, chunksize=max(1, count // (4 * (jobs or os.cpu_count() or 1)))))
+
+def sync_reports(export_file=REPORTS_EXPORT, existing_only=False, dry_run=False, search_modules=False, jobs=None):
+    docs = load_export(export_file)
+    print(f'Found {len(docs)} reports in {export_file}\n')
+    return run_sync(sync_report, docs, existing_only, dry_run, search_modules, jobs)
+
+def sync_print_formats(export_file=PRINT_FORMATS_EXPORT, existing_only=False, dry_run=False, search_modules=False,
+                       jobs=None):
+    docs = load_export(export_file)
+    print(f'Found {len(docs)} print formats in {export_file}\n')
+    return run_sync(sync_print_format, docs, existing_only, dry_run, search_modules, jobs)
+
+def print_summary(title, results, dry_run=False):
+    """One line per changed, missing or failed document, then the counts"""
+    marks = {CREATED: '[NEW]', UPDATED: '[CHANGED]', KEPT: '[KEPT]', MISSING: '[MISSING]', FAILED: '[FAIL]'}
+    for row in results:
+        if row['status'] == UNCHANGED:
+            continue
+        line = f'{marks[row["status"]]:<10} {row["name"]}'
+        if row['status'] == UPDATED:
+            fields = row['fields']
+            line += f' ({", ".join(fields[:8])}{", ..." if len(fields) > 8 else ""})'
+        elif row['status'] == MISSING:
+            line += f' (expected at {row["path"]})'
+        elif row['status'] == FAILED:
+            line += f' - {row["error"]}'
+        print(line)
+
+    counts = {status: sum(1 for row in results if row['status'] == status) for status in marks}
+    counts[UNCHANGED] = sum(1 for row in results if row['status'] == UNCHANGED)
+
+    print('\n' + '='*60)
+    print(f'{title} SYNC {"(DRY RUN) " if dry_run else ""}COMPLETE!')
+    print('='*60)
+    print(f'Total: {len(results)}')
+    for status in (CREATED, UPDATED, UNCHANGED, KEPT, MISSING, FAILED):
+        print(f'  - {status.capitalize()}: {counts[status]}')
+    print('='*60)
+
+    if not counts[CREATED] and not counts[UPDATED]:
+        print('\nNo changes, nothing written.')
+
+def print_asset_report(report):
+    """Before/after table for the asset pipeline"""
+    def fmt_ms(value):
+        return f'{value:.2f}' if value is not None else 'n/a'
+
+    report = [row for row in report if 'before' in row]
+
+    print(f'{"Print Format":<30} {"JSON before":>12} {"JSON after":>11} {"Compile ms before":>18} {"after":>8}')
+    print('-' * 83)
+    for row in report:
+        before, after = row['before'], row['after']
+        print(
+            f'{row["name"]:<30} {before["json_size"]:>12,} {after["json_size"]:>11,} '
+            f'{fmt_ms(before["compile_ms"]):>18} {fmt_ms(after["compile_ms"]):>8}'
+        )
+
+    total_before = sum(row['before']['json_size'] for row in report)
+    total_after = sum(row['after']['json_size'] for row in report)
+    print('-' * 83)
+    print(f'{"Total":<30} {total_before:>12,} {total_after:>11,}')
+
+    assets = sorted({name for row in report for name in row['assets']})
+    for name in assets:
+        path = os.path.join(ASSETS_DIR, name)
+        size = f'{os.path.getsize(path):,} bytes' if os.path.exists(path) else 'not written'
+        print(f'[ASSET] {ASSETS_URL}/{name} ({size})')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sync exported reports and print formats into the app')
+    parser.add_argument('target', nargs='?', choices=['all', 'reports', 'print-formats'], default='all')
+    parser.add_argument('--existing-only', action='store_true', help='only update files that already exist')
+    parser.add_argument('--dry-run', action='store_true', help='print the summary without writing anything')
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--reports-export', default=REPORTS_EXPORT)
+    parser.add_argument('--print-formats-export', default=PRINT_FORMATS_EXPORT)
+    parser.add_argument('--assets', action='store_true', help='print the print format size and asset report')
+    args = parser.parse_args(argv)
+
+    options = dict(existing_only=args.existing_only, dry_run=args.dry_run, jobs=args.jobs)
+    try:
+        if args.target in ('all', 'reports'):
+            print_summary('REPORTS', sync_reports(args.reports_export, **options), args.dry_run)
+            print()
+        if args.target in ('all', 'print-formats'):
+            results = sync_print_formats(args.print_formats_export, **options)
+            print_summary('PRINT FORMATS', results, args.dry_run)
+            if args.assets:
+                print('\nPrint assets:\n')
+                print_asset_report(results)
+    except ValueError as e:
+        print(f'Error: {e}')
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())